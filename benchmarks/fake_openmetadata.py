@@ -0,0 +1,220 @@
+"""Stand-in OpenMetadata API serving a synthetic glossary, for benchmarks.
+
+Serves the subset of /api/v1 the MCP server uses with configurable latency and error rate:
+
+    python -m benchmarks.fake_openmetadata --port 8585 --terms 5000 --latency 0.02 --error-rate 0.01
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import uuid
+
+import click
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+import uvicorn
+
+
+class FakeOpenMetadata:
+    """Synthetic glossaries, terms and tables with deterministic content for a given size and seed."""
+
+    def __init__(
+        self,
+        glossaries: int = 3,
+        terms: int = 1000,
+        tables: int = 200,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """Build the dataset.
+
+        Args:
+            glossaries: Number of glossaries
+            terms: Total number of glossary terms, spread over the glossaries in a three-level hierarchy
+            tables: Number of tables
+            latency: Seconds added to every response
+            jitter: Maximum extra random seconds added to every response
+            error_rate: Fraction of requests answered with a 503
+            seed: Random seed for the dataset and the injected errors
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+        self._random = random.Random(seed)
+        self.glossaries: List[Dict[str, Any]] = []
+        self.terms: List[Dict[str, Any]] = []
+        self.tables: List[Dict[str, Any]] = []
+        self._by_fqn: Dict[str, Dict[str, Any]] = {}
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+
+        for g in range(glossaries):
+            glossary = self._entity(f"Glossary{g}", f"Glossary{g}", "glossary")
+            glossary["description"] = f"Synthetic glossary number {g}"
+            self.glossaries.append(glossary)
+        words = ["revenue", "margin", "customer", "order", "churn", "cost", "profit", "region", "segment", "lead"]
+        for t in range(terms):
+            glossary = self.glossaries[t % glossaries]
+            siblings = [term for term in self.terms[-30:] if term["glossary"]["id"] == glossary["id"]]
+            parent = self._random.choice(siblings) if siblings and self._random.random() < 0.6 else None
+            if parent is not None and parent["fullyQualifiedName"].count(".") >= 3:
+                parent = None
+            name = f"{self._random.choice(words).title()}{self._random.choice(words).title()}{t}"
+            parent_fqn = parent["fullyQualifiedName"] if parent else glossary["fullyQualifiedName"]
+            term = self._entity(name, f"{parent_fqn}.{name}", "glossaryTerm")
+            term.update(
+                {
+                    "displayName": name,
+                    "description": " ".join(self._random.choice(words) for _ in range(40)),
+                    "synonyms": [self._random.choice(words)],
+                    "glossary": self._ref(glossary, "glossary"),
+                    "relatedTerms": [],
+                }
+            )
+            if parent is not None:
+                term["parent"] = self._ref(parent, "glossaryTerm")
+            if self.terms and self._random.random() < 0.3:
+                related = self._random.choice(self.terms)
+                term["relatedTerms"].append(self._ref(related, "glossaryTerm"))
+                related["relatedTerms"].append(self._ref(term, "glossaryTerm"))
+            self.terms.append(term)
+        for n in range(tables):
+            table = self._entity(f"table_{n}", f"service.db.schema.table_{n}", "table")
+            table["columns"] = [
+                {"name": f"column_{c}", "dataType": "VARCHAR", "description": "synthetic column"} for c in range(20)
+            ]
+            self.tables.append(table)
+
+    def _entity(self, name: str, fqn: str, entity_type: str) -> Dict[str, Any]:
+        entity = {
+            "id": str(uuid.UUID(int=self._random.getrandbits(128))),
+            "name": name,
+            "fullyQualifiedName": fqn,
+            "version": 0.1,
+            "updatedAt": 1700000000000,
+            "href": f"http://localhost/api/v1/{entity_type}/{name}",
+        }
+        self._by_fqn[fqn] = entity
+        self._by_id[entity["id"]] = entity
+        return entity
+
+    @staticmethod
+    def _ref(entity: Dict[str, Any], entity_type: str) -> Dict[str, Any]:
+        return {
+            "id": entity["id"],
+            "type": entity_type,
+            "name": entity["name"],
+            "fullyQualifiedName": entity["fullyQualifiedName"],
+        }
+
+    @staticmethod
+    def _page(entities: List[Dict[str, Any]], request: Request) -> Dict[str, Any]:
+        limit = int(request.query_params.get("limit", 10))
+        after = request.query_params.get("after")
+        offset = request.query_params.get("offset")
+        start = int(after) if after else int(offset or 0)
+        data = entities[start : start + limit]
+        paging: Dict[str, Any] = {"total": len(entities)}
+        if start + limit < len(entities):
+            paging["after"] = str(start + limit)
+        if start:
+            paging["before"] = str(max(0, start - limit))
+        return {"data": data, "paging": paging}
+
+    async def _respond(self, payload: Optional[Dict[str, Any]], status: int = 200) -> JSONResponse:
+        self.requests += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return JSONResponse({"code": 503, "message": "Injected failure"}, status_code=503)
+        if payload is None:
+            return JSONResponse({"code": 404, "message": "Entity not found"}, status_code=404)
+        return JSONResponse(payload, status_code=status)
+
+    def app(self) -> Starlette:
+        async def list_glossaries(request: Request) -> JSONResponse:
+            return await self._respond(self._page(self.glossaries, request))
+
+        async def list_terms(request: Request) -> JSONResponse:
+            glossary_id = request.query_params.get("glossary")
+            terms = [t for t in self.terms if t["glossary"]["id"] == glossary_id] if glossary_id else self.terms
+            return await self._respond(self._page(terms, request))
+
+        async def list_tables(request: Request) -> JSONResponse:
+            return await self._respond(self._page(self.tables, request))
+
+        async def by_name(request: Request) -> JSONResponse:
+            return await self._respond(self._by_fqn.get(request.path_params["fqn"]))
+
+        async def by_id(request: Request) -> JSONResponse:
+            return await self._respond(self._by_id.get(request.path_params["entity_id"]))
+
+        async def events(request: Request) -> JSONResponse:
+            return await self._respond({"data": []})
+
+        return Starlette(
+            routes=[
+                Route("/api/v1/glossaries", list_glossaries),
+                Route("/api/v1/glossaries/name/{fqn:path}", by_name),
+                Route("/api/v1/glossaries/{entity_id}", by_id),
+                Route("/api/v1/glossaryTerms", list_terms),
+                Route("/api/v1/glossaryTerms/name/{fqn:path}", by_name),
+                Route("/api/v1/glossaryTerms/{entity_id}", by_id),
+                Route("/api/v1/tables", list_tables),
+                Route("/api/v1/tables/name/{fqn:path}", by_name),
+                Route("/api/v1/tables/{entity_id}", by_id),
+                Route("/api/v1/events", events),
+            ]
+        )
+
+
+class FakeServerThread:
+    """Runs a FakeOpenMetadata app with uvicorn on a background thread."""
+
+    def __init__(self, fake: FakeOpenMetadata, port: int):
+        self.fake = fake
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(fake.app(), host="127.0.0.1", port=port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "FakeServerThread":
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Fake OpenMetadata server did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+@click.command()
+@click.option("--port", default=8585, help="Port to listen on")
+@click.option("--glossaries", default=3, help="Number of glossaries")
+@click.option("--terms", default=1000, help="Number of glossary terms")
+@click.option("--tables", default=200, help="Number of tables")
+@click.option("--latency", default=0.0, help="Seconds added to every response")
+@click.option("--jitter", default=0.0, help="Maximum extra random seconds added to every response")
+@click.option("--error-rate", default=0.0, help="Fraction of requests answered with a 503")
+def main(port: int, glossaries: int, terms: int, tables: int, latency: float, jitter: float, error_rate: float) -> None:
+    fake = FakeOpenMetadata(glossaries, terms, tables, latency=latency, jitter=jitter, error_rate=error_rate)
+    uvicorn.run(fake.app(), host="127.0.0.1", port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""Benchmark the MCP server's tools against a local fake OpenMetadata server.
+
+Starts benchmarks.fake_openmetadata on a background thread, launches the MCP server over stdio, SSE
+and/or Streamable HTTP as a subprocess pointed at it, calls every benchmarked tool and reports throughput, p50/p99
+latency and the server's resident memory per tool:
+
+    python -m benchmarks.run --transport stdio --transport sse --calls 200 --concurrency 8 --latency 0.01
+"""
+
+import asyncio
+import contextlib
+from dataclasses import asdict, dataclass
+import functools
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import click
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.types import CallToolResult
+
+from benchmarks.fake_openmetadata import FakeOpenMetadata, FakeServerThread
+from src.server import TRANSPORTS
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tool name -> builds the arguments of one call from the fake dataset
+Scenario = Tuple[str, Callable[[FakeOpenMetadata, random.Random], Dict[str, Any]]]
+
+SCENARIOS: List[Scenario] = [
+    ("list_tables", lambda fake, rng: {"limit": 50}),
+    ("get_table_by_name", lambda fake, rng: {"fqn": rng.choice(fake.tables)["fullyQualifiedName"]}),
+    ("list_glossaries", lambda fake, rng: {"limit": 10}),
+    ("get_glossary_term_by_name", lambda fake, rng: {"fqn": rng.choice(fake.terms)["fullyQualifiedName"]}),
+    (
+        "list_glossary_terms",
+        lambda fake, rng: {"glossary_fqn": rng.choice(fake.glossaries)["fullyQualifiedName"], "limit": 100},
+    ),
+    ("search_glossary_terms", lambda fake, rng: {"query": rng.choice(["revenue", "churn", "custmer", "prof"])}),
+    ("get_glossary_tree", lambda fake, rng: {"glossary_fqn": rng.choice(fake.glossaries)["fullyQualifiedName"]}),
+    (
+        "traverse_glossary_graph",
+        lambda fake, rng: {"start_fqn": rng.choice(fake.terms)["fullyQualifiedName"], "max_hops": 2},
+    ),
+    ("export_glossary_terms", lambda fake, rng: {"glossary_fqn": rng.choice(fake.glossaries)["fullyQualifiedName"]}),
+]
+
+
+@dataclass
+class ToolResult:
+    transport: str
+    tool: str
+    calls: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    rss_mb: Optional[float]
+    peak_rss_mb: Optional[float]
+
+
+def percentile(values: List[float], quantile: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(quantile * len(ordered))) - 1))]
+
+
+def memory_mb(pid: Optional[int]) -> Tuple[Optional[float], Optional[float]]:
+    """Return the current and peak resident memory of a process in MiB (Linux only)."""
+    if pid is None:
+        return None, None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None, None
+
+    def kib(name: str) -> Optional[float]:
+        value = fields.get(name)
+        return round(int(value.split()[0]) / 1024, 1) if value else None
+
+    return kib("VmRSS"), kib("VmHWM")
+
+
+def child_pid() -> Optional[int]:
+    """Find the most recent child process of this process (the server started by stdio_client)."""
+    children = []
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else ():
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so parse the fields after its closing parenthesis
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == os.getpid():
+            children.append(int(entry))
+    return max(children) if children else None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_env(fake_url: str) -> Dict[str, str]:
+    return {
+        **os.environ,
+        "OPENMETADATA_HOST": fake_url,
+        "OPENMETADATA_JWT_TOKEN": "benchmark",
+        "PYTHONPATH": REPO_ROOT,
+    }
+
+
+@contextlib.asynccontextmanager
+async def stdio_session(fake_url: str) -> AsyncIterator[Tuple[ClientSession, Optional[int]]]:
+    params = StdioServerParameters(
+        command=sys.executable, args=["-m", "src", "--transport", "stdio"], env=server_env(fake_url)
+    )
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session, child_pid()
+
+
+@contextlib.asynccontextmanager
+async def sse_session(fake_url: str, workers: int = 1) -> AsyncIterator[Tuple[ClientSession, Optional[int]]]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src", "--transport", "sse", "--port", str(port), "--workers", str(workers)],
+        cwd=REPO_ROOT,
+        env=server_env(fake_url),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await wait_until_serving(process, port)
+        async with sse_client(f"http://127.0.0.1:{port}/sse") as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session, process.pid
+    finally:
+        stop(process)
+
+
+class HttpSession:
+    """Minimal client of the stateless Streamable HTTP transport with ClientSession's call_tool signature."""
+
+    def __init__(self, http: httpx.AsyncClient, url: str):
+        self.http = http
+        self.url = url
+        self._ids = itertools.count(1)
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        message = {"jsonrpc": "2.0", "id": next(self._ids), "method": "tools/call"}
+        response = await self.http.post(self.url, json={**message, "params": {"name": name, "arguments": arguments}})
+        response.raise_for_status()
+        return CallToolResult.model_validate(response.json()["result"])
+
+
+async def wait_until_serving(process: subprocess.Popen, port: int) -> None:
+    deadline = time.monotonic() + 30
+    async with httpx.AsyncClient() as http:
+        while True:
+            try:
+                await http.get(f"http://127.0.0.1:{port}/metrics")
+                return
+            except httpx.TransportError as e:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("MCP server did not start listening") from e
+                await asyncio.sleep(0.1)
+
+
+def stop(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        # uvicorn waits for open SSE streams to finish before shutting down
+        process.kill()
+        process.wait()
+
+
+@contextlib.asynccontextmanager
+async def http_session(fake_url: str) -> AsyncIterator[Tuple[Any, Optional[int]]]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src", "--transport", "streamable-http", "--port", str(port)],
+        cwd=REPO_ROOT,
+        env=server_env(fake_url),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await wait_until_serving(process, port)
+        async with httpx.AsyncClient(timeout=60) as http:
+            yield HttpSession(http, f"http://127.0.0.1:{port}/mcp"), process.pid
+    finally:
+        stop(process)
+
+
+async def run_scenario(
+    session: Any,
+    pid: Optional[int],
+    transport: str,
+    scenario: Scenario,
+    fake: FakeOpenMetadata,
+    calls: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> ToolResult:
+    tool, make_arguments = scenario
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(record: bool) -> None:
+        nonlocal errors
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                result = await session.call_tool(tool, make_arguments(fake, rng))
+                failed = result.isError
+            except Exception:
+                failed = True
+            if record:
+                latencies.append(time.perf_counter() - started_at)
+                errors += int(failed)
+
+    for _ in range(warmup):
+        await call(record=False)
+    started_at = time.perf_counter()
+    await asyncio.gather(*(call(record=True) for _ in range(calls)))
+    elapsed = time.perf_counter() - started_at
+    rss, peak_rss = memory_mb(pid)
+    return ToolResult(
+        transport=transport,
+        tool=tool,
+        calls=calls,
+        errors=errors,
+        throughput=round(calls / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(percentile(latencies, 0.5) * 1000, 2),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 2),
+        rss_mb=rss,
+        peak_rss_mb=peak_rss,
+    )
+
+
+async def run_benchmarks(
+    fake: FakeOpenMetadata,
+    fake_url: str,
+    transports: Tuple[str, ...],
+    tools: Tuple[str, ...],
+    calls: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+    workers: int = 1,
+) -> List[ToolResult]:
+    sessions = {
+        "stdio": stdio_session,
+        "sse": functools.partial(sse_session, workers=workers),
+        "streamable-http": http_session,
+    }
+    scenarios = [scenario for scenario in SCENARIOS if not tools or scenario[0] in tools]
+    results = []
+    for transport in transports:
+        async with sessions[transport](fake_url) as (session, pid):
+            for scenario in scenarios:
+                result = await run_scenario(session, pid, transport, scenario, fake, calls, concurrency, warmup, seed)
+                print(format_row(asdict(result)), flush=True)
+                results.append(result)
+    return results
+
+
+COLUMNS = ("transport", "tool", "calls", "errors", "throughput", "p50_ms", "p99_ms", "rss_mb", "peak_rss_mb")
+WIDTHS = (15, 26, 6, 6, 11, 9, 9, 8, 11)
+
+
+def format_row(row: Dict[str, Any]) -> str:
+    cells = (str(row[column] if row[column] is not None else "-") for column in COLUMNS)
+    return "  ".join(cell.ljust(width) for cell, width in zip(cells, WIDTHS))
+
+
+@click.command()
+@click.option("--transport", "transports", multiple=True, type=click.Choice(TRANSPORTS), help="Default: all")
+@click.option("--tool", "tools", multiple=True, help="Only benchmark these tools (default: all)")
+@click.option("--calls", default=100, help="Measured calls per tool")
+@click.option("--concurrency", default=4, help="Calls in flight at once")
+@click.option("--warmup", default=5, help="Unmeasured calls per tool before measuring")
+@click.option("--glossaries", default=3, help="Number of glossaries in the fake server")
+@click.option("--terms", default=2000, help="Number of glossary terms in the fake server")
+@click.option("--tables", default=200, help="Number of tables in the fake server")
+@click.option("--latency", default=0.005, help="Seconds the fake server adds to every response")
+@click.option("--jitter", default=0.0, help="Maximum extra random seconds the fake server adds")
+@click.option("--error-rate", default=0.0, help="Fraction of fake server responses that are 503s")
+@click.option("--workers", default=1, help="Worker processes of the SSE server")
+@click.option("--seed", default=0, help="Random seed for the dataset and the call arguments")
+@click.option("--output", type=click.Path(dir_okay=False), help="Also write the results to this JSON file")
+def main(
+    transports: Tuple[str, ...],
+    tools: Tuple[str, ...],
+    calls: int,
+    concurrency: int,
+    warmup: int,
+    glossaries: int,
+    terms: int,
+    tables: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+    workers: int,
+    seed: int,
+    output: Optional[str],
+) -> None:
+    fake = FakeOpenMetadata(glossaries, terms, tables, latency=latency, jitter=jitter, error_rate=error_rate, seed=seed)
+    print(format_row({column: column for column in COLUMNS}))
+    with FakeServerThread(fake, free_port()) as server:
+        results = asyncio.run(
+            run_benchmarks(fake, server.url, transports or TRANSPORTS, tools, calls, concurrency, warmup, seed, workers)
+        )
+    print(f"Fake OpenMetadata served {fake.requests} requests")
+    if output:
+        with open(output, "w") as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
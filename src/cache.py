@@ -0,0 +1,90 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Callable, Hashable, Iterable, List, Optional
+
+
+class TTLCache:
+    """Thread-safe in-process cache with per-entry expiry and LRU eviction.
+
+    A cache with a non-positive ``ttl`` or ``max_entries`` is disabled: lookups always miss
+    and writes are dropped.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            max_entries: Maximum number of entries kept before the least recently used is evicted
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if it is missing or expired."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries if full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._entries)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def invalidate_prefixes(self, prefixes: Iterable[Hashable]) -> int:
+        """Drop every entry whose key is a tuple starting with one of ``prefixes``.
+
+        Returns:
+            Number of entries removed
+        """
+        prefixes = frozenset(prefixes)
+        return self.invalidate(lambda key: isinstance(key, tuple) and bool(key) and key[0] in prefixes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -2,12 +2,45 @@ from dataclasses import dataclass
 import os
 
 
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass
 class Config:
     OPENMETADATA_HOST: str | None = None
     OPENMETADATA_JWT_TOKEN: str | None = None
     OPENMETADATA_USERNAME: str | None = None
     OPENMETADATA_PASSWORD: str | None = None
+    OPENMETADATA_CACHE_TTL: float = 60.0
+    OPENMETADATA_CACHE_MAX_ENTRIES: int = 1024
+    OPENMETADATA_MAX_CONNECTIONS: int = 100
+    OPENMETADATA_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OPENMETADATA_KEEPALIVE_EXPIRY: float = 5.0
+    OPENMETADATA_CONNECT_TIMEOUT: float = 5.0
+    OPENMETADATA_READ_TIMEOUT: float = 30.0
+    OPENMETADATA_MAX_PAGE_SIZE: int = 1000
+    OPENMETADATA_MAX_RESPONSE_BYTES: int = 1048576
+    OPENMETADATA_HTTP2: bool = False
+    OPENMETADATA_COALESCE_REQUESTS: bool = True
+    OPENMETADATA_SHARED_CACHE_SOCKET: str | None = None
+    OPENMETADATA_MAX_RETRIES: int = 3
+    OPENMETADATA_RETRY_BACKOFF: float = 0.5
+    OPENMETADATA_RETRY_MAX_DELAY: float = 10.0
+    OPENMETADATA_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    OPENMETADATA_CIRCUIT_RESET_TIMEOUT: float = 30.0
+    OPENMETADATA_SNAPSHOT_PATH: str | None = None
+    OPENMETADATA_SNAPSHOT_REFRESH_INTERVAL: float = 600.0
+    OPENMETADATA_SYNC_INTERVAL: float = 0.0
+    OPENMETADATA_SYNC_MAX_GAP: float = 3600.0
+    OPENMETADATA_SESSION_RATE_LIMIT: float = 0.0
+    OPENMETADATA_SESSION_BURST: int = 10
+    OPENMETADATA_SESSION_MAX_IN_FLIGHT: int = 0
+    OPENMETADATA_TOOL_QUOTAS: str | None = None
+    OPENMETADATA_QUOTA_MAX_WAIT: float = 1.0
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -25,4 +58,58 @@ class Config:
             OPENMETADATA_JWT_TOKEN=os.getenv("OPENMETADATA_JWT_TOKEN"),
             OPENMETADATA_USERNAME=os.getenv("OPENMETADATA_USERNAME"),
             OPENMETADATA_PASSWORD=os.getenv("OPENMETADATA_PASSWORD"),
+            OPENMETADATA_CACHE_TTL=float(os.getenv("OPENMETADATA_CACHE_TTL", cls.OPENMETADATA_CACHE_TTL)),
+            OPENMETADATA_CACHE_MAX_ENTRIES=int(
+                os.getenv("OPENMETADATA_CACHE_MAX_ENTRIES", cls.OPENMETADATA_CACHE_MAX_ENTRIES)
+            ),
+            OPENMETADATA_MAX_CONNECTIONS=int(
+                os.getenv("OPENMETADATA_MAX_CONNECTIONS", cls.OPENMETADATA_MAX_CONNECTIONS)
+            ),
+            OPENMETADATA_MAX_KEEPALIVE_CONNECTIONS=int(
+                os.getenv("OPENMETADATA_MAX_KEEPALIVE_CONNECTIONS", cls.OPENMETADATA_MAX_KEEPALIVE_CONNECTIONS)
+            ),
+            OPENMETADATA_KEEPALIVE_EXPIRY=float(
+                os.getenv("OPENMETADATA_KEEPALIVE_EXPIRY", cls.OPENMETADATA_KEEPALIVE_EXPIRY)
+            ),
+            OPENMETADATA_CONNECT_TIMEOUT=float(
+                os.getenv("OPENMETADATA_CONNECT_TIMEOUT", cls.OPENMETADATA_CONNECT_TIMEOUT)
+            ),
+            OPENMETADATA_READ_TIMEOUT=float(os.getenv("OPENMETADATA_READ_TIMEOUT", cls.OPENMETADATA_READ_TIMEOUT)),
+            OPENMETADATA_MAX_PAGE_SIZE=int(os.getenv("OPENMETADATA_MAX_PAGE_SIZE", cls.OPENMETADATA_MAX_PAGE_SIZE)),
+            OPENMETADATA_MAX_RESPONSE_BYTES=int(
+                os.getenv("OPENMETADATA_MAX_RESPONSE_BYTES", cls.OPENMETADATA_MAX_RESPONSE_BYTES)
+            ),
+            OPENMETADATA_HTTP2=_env_flag("OPENMETADATA_HTTP2", cls.OPENMETADATA_HTTP2),
+            OPENMETADATA_COALESCE_REQUESTS=_env_flag(
+                "OPENMETADATA_COALESCE_REQUESTS", cls.OPENMETADATA_COALESCE_REQUESTS
+            ),
+            OPENMETADATA_SHARED_CACHE_SOCKET=os.getenv("OPENMETADATA_SHARED_CACHE_SOCKET"),
+            OPENMETADATA_MAX_RETRIES=int(os.getenv("OPENMETADATA_MAX_RETRIES", cls.OPENMETADATA_MAX_RETRIES)),
+            OPENMETADATA_RETRY_BACKOFF=float(os.getenv("OPENMETADATA_RETRY_BACKOFF", cls.OPENMETADATA_RETRY_BACKOFF)),
+            OPENMETADATA_RETRY_MAX_DELAY=float(
+                os.getenv("OPENMETADATA_RETRY_MAX_DELAY", cls.OPENMETADATA_RETRY_MAX_DELAY)
+            ),
+            OPENMETADATA_CIRCUIT_FAILURE_THRESHOLD=int(
+                os.getenv("OPENMETADATA_CIRCUIT_FAILURE_THRESHOLD", cls.OPENMETADATA_CIRCUIT_FAILURE_THRESHOLD)
+            ),
+            OPENMETADATA_CIRCUIT_RESET_TIMEOUT=float(
+                os.getenv("OPENMETADATA_CIRCUIT_RESET_TIMEOUT", cls.OPENMETADATA_CIRCUIT_RESET_TIMEOUT)
+            ),
+            OPENMETADATA_SNAPSHOT_PATH=os.getenv("OPENMETADATA_SNAPSHOT_PATH"),
+            OPENMETADATA_SNAPSHOT_REFRESH_INTERVAL=float(
+                os.getenv("OPENMETADATA_SNAPSHOT_REFRESH_INTERVAL", cls.OPENMETADATA_SNAPSHOT_REFRESH_INTERVAL)
+            ),
+            OPENMETADATA_SYNC_INTERVAL=float(os.getenv("OPENMETADATA_SYNC_INTERVAL", cls.OPENMETADATA_SYNC_INTERVAL)),
+            OPENMETADATA_SYNC_MAX_GAP=float(os.getenv("OPENMETADATA_SYNC_MAX_GAP", cls.OPENMETADATA_SYNC_MAX_GAP)),
+            OPENMETADATA_SESSION_RATE_LIMIT=float(
+                os.getenv("OPENMETADATA_SESSION_RATE_LIMIT", cls.OPENMETADATA_SESSION_RATE_LIMIT)
+            ),
+            OPENMETADATA_SESSION_BURST=int(os.getenv("OPENMETADATA_SESSION_BURST", cls.OPENMETADATA_SESSION_BURST)),
+            OPENMETADATA_SESSION_MAX_IN_FLIGHT=int(
+                os.getenv("OPENMETADATA_SESSION_MAX_IN_FLIGHT", cls.OPENMETADATA_SESSION_MAX_IN_FLIGHT)
+            ),
+            OPENMETADATA_TOOL_QUOTAS=os.getenv("OPENMETADATA_TOOL_QUOTAS"),
+            OPENMETADATA_QUOTA_MAX_WAIT=float(
+                os.getenv("OPENMETADATA_QUOTA_MAX_WAIT", cls.OPENMETADATA_QUOTA_MAX_WAIT)
+            ),
         )
@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+GLOSSARY = "glossary"
+GLOSSARY_TERM = "glossaryTerm"
+
+# API endpoint -> entity kind whose responses feed the index
+INDEXED_ENDPOINTS = {"glossaries": GLOSSARY, "glossaryTerms": GLOSSARY_TERM}
+
+
+class FqnIndex:
+    """Bidirectional fully-qualified-name <-> UUID mapping for glossaries and glossary terms.
+
+    Entries are recorded from any API response that carries ``id`` and ``fullyQualifiedName``
+    and expire after ``max_age`` seconds so renamed or recreated entities are re-resolved.
+    """
+
+    def __init__(self, max_age: float = 3600.0):
+        """Initialize the index.
+
+        Args:
+            max_age: Seconds before an entry (or a full warm-up) is considered stale
+        """
+        self.max_age = max_age
+        self._ids: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._fqns: Dict[Tuple[str, str], str] = {}
+        self._warmed_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _fresh(self, stored_at: float) -> bool:
+        return time.monotonic() - stored_at < self.max_age
+
+    def get_id(self, kind: str, fqn: str) -> Optional[str]:
+        """Return the UUID for ``fqn``, or None if unknown or stale."""
+        entry = self._ids.get((kind, fqn))
+        if entry is None or not self._fresh(entry[1]):
+            return None
+        return entry[0]
+
+    def get_fqn(self, kind: str, entity_id: str) -> Optional[str]:
+        """Return the fully qualified name for ``entity_id``, or None if unknown."""
+        return self._fqns.get((kind, entity_id))
+
+    def add(self, kind: str, fqn: str, entity_id: str) -> None:
+        with self._lock:
+            previous_fqn = self._fqns.get((kind, entity_id))
+            if previous_fqn is not None and previous_fqn != fqn:
+                self._ids.pop((kind, previous_fqn), None)
+            self._ids[(kind, fqn)] = (entity_id, time.monotonic())
+            self._fqns[(kind, entity_id)] = fqn
+
+    def record(self, kind: str, payload: Any) -> None:
+        """Record an entity, or every entity in a list response's ``data``."""
+        if not isinstance(payload, dict):
+            return
+        entities = payload.get("data") if isinstance(payload.get("data"), list) else [payload]
+        for entity in entities:
+            if isinstance(entity, dict) and entity.get("id") and entity.get("fullyQualifiedName"):
+                self.add(kind, entity["fullyQualifiedName"], entity["id"])
+
+    def discard(
+        self, kind: str, fqn: Optional[str] = None, entity_id: Optional[str] = None, nested: bool = True
+    ) -> None:
+        """Forget an entity and, unless ``nested`` is False, everything nested under its FQN."""
+        with self._lock:
+            if fqn is None and entity_id is not None:
+                fqn = self._fqns.get((kind, entity_id))
+            if fqn is None:
+                return
+            prefix = f"{fqn}." if nested else None
+            for key in [
+                key
+                for key in self._ids
+                if key[0] == kind and (key[1] == fqn or (prefix is not None and key[1].startswith(prefix)))
+            ]:
+                stale_id, _ = self._ids.pop(key)
+                self._fqns.pop((kind, stale_id), None)
+
+    def is_warm(self, kind: str) -> bool:
+        """Whether every entity of ``kind`` was loaded recently."""
+        warmed_at = self._warmed_at.get(kind)
+        return warmed_at is not None and self._fresh(warmed_at)
+
+    def mark_warm(self, kind: str) -> None:
+        self._warmed_at[kind] = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._fqns.clear()
+            self._warmed_at.clear()
@@ -0,0 +1,116 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Fields every tree node carries; more can be requested per call
+TREE_NODE_FIELDS = ("id", "name", "fullyQualifiedName", "displayName")
+
+# Glossary term fields the list API only returns when asked for through ``fields``
+OPTIONAL_TERM_FIELDS = frozenset(
+    {"children", "relatedTerms", "reviewers", "owners", "tags", "usageCount", "domain", "extension", "childrenCount"}
+)
+
+
+def api_fields(node_fields: Iterable[str]) -> Optional[str]:
+    """Return the ``fields`` parameter needed for the list API to return ``node_fields``."""
+    requested = [field for field in node_fields if field in OPTIONAL_TERM_FIELDS]
+    return ",".join(requested) or None
+
+
+def split_fqn(fqn: str) -> List[str]:
+    """Split an OpenMetadata FQN into its parts, honouring double-quoted parts that contain dots."""
+    parts = []
+    current = []
+    quoted = False
+    for char in fqn:
+        if char == '"':
+            quoted = not quoted
+        elif char == "." and not quoted:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def _parent_fqn(term: Dict[str, Any], glossary_fqn: str) -> Optional[str]:
+    parent = term.get("parent")
+    if isinstance(parent, dict) and parent.get("fullyQualifiedName"):
+        return parent["fullyQualifiedName"]
+    # Without a parent reference the FQN still encodes the hierarchy: glossary.parent...term
+    parts = split_fqn(term.get("fullyQualifiedName") or "")
+    if len(parts) <= 2:
+        return None
+    parent_fqn = ".".join(parts[:-1])
+    return None if parent_fqn == glossary_fqn else parent_fqn
+
+
+def _index_terms(
+    terms: Iterable[Dict[str, Any]], glossary_fqn: str, fields: Tuple[str, ...]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[Optional[str], List[str]]]:
+    # Returns the node of every term by FQN and the child FQNs of every parent FQN (None for the glossary)
+    nodes: Dict[str, Dict[str, Any]] = {}
+    children: Dict[Optional[str], List[str]] = {}
+    for term in terms:
+        fqn = term.get("fullyQualifiedName")
+        if not fqn or fqn in nodes:
+            continue
+        nodes[fqn] = {field: term[field] for field in fields if field in term}
+        children.setdefault(_parent_fqn(term, glossary_fqn), []).append(fqn)
+    return nodes, children
+
+
+def build_glossary_tree(
+    terms: Iterable[Dict[str, Any]],
+    glossary_fqn: str,
+    root_fqn: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    node_fields: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """Assemble a nested term hierarchy from a flat list of glossary terms.
+
+    Args:
+        terms: Every term of the glossary, each with ``parent`` references or hierarchical FQNs
+        glossary_fqn: Fully qualified name of the glossary
+        root_fqn: FQN of the term whose subtree is returned (default: the whole glossary)
+        max_depth: Levels of terms below the root to include (default: unlimited)
+        node_fields: Extra entity fields copied onto every node
+
+    Returns:
+        ``{"glossary": ..., "root": ..., "terms": [...], "total": ...}`` where every node has its
+        ``children``; nodes cut off by ``max_depth`` report ``childrenCount`` instead
+
+    Raises:
+        KeyError: If ``root_fqn`` is not a term of the glossary
+    """
+    fields = TREE_NODE_FIELDS + tuple(field for field in node_fields if field not in TREE_NODE_FIELDS)
+    nodes, children = _index_terms(terms, glossary_fqn, fields)
+
+    # Terms whose parent was not listed (e.g. filtered out) hang off the glossary root
+    roots = children.get(None, [])
+    for parent_fqn, child_fqns in children.items():
+        if parent_fqn is not None and parent_fqn not in nodes:
+            roots.extend(child_fqns)
+
+    if root_fqn is not None and root_fqn not in nodes:
+        raise KeyError(root_fqn)
+    visited = set()
+
+    def build(fqn: str, depth: int) -> Dict[str, Any]:
+        visited.add(fqn)
+        node = dict(nodes[fqn])
+        # Guard against malformed parent references that form a cycle
+        child_fqns = sorted(child_fqn for child_fqn in children.get(fqn, ()) if child_fqn not in visited)
+        if max_depth is not None and depth >= max_depth:
+            if child_fqns:
+                node["childrenCount"] = len(child_fqns)
+        else:
+            node["children"] = [build(child_fqn, depth + 1) for child_fqn in child_fqns]
+        return node
+
+    if root_fqn is not None:
+        tree = [build(root_fqn, 0)]
+    elif max_depth is not None and max_depth <= 0:
+        tree = []
+    else:
+        tree = [build(fqn, 1) for fqn in sorted(roots)]
+    return {"glossary": glossary_fqn, "root": root_fqn, "terms": tree, "total": len(visited)}
@@ -0,0 +1,285 @@
+from collections import deque
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.glossary_tree import split_fqn
+
+RELATED = "related"
+PARENT = "parent"
+CHILD = "child"
+SYNONYM = "synonym"
+RELATIONS = (RELATED, PARENT, CHILD, SYNONYM)
+
+
+def _ref_id(ref: Any) -> Optional[str]:
+    return ref.get("id") if isinstance(ref, dict) else None
+
+
+def _normalize(text: Any) -> Optional[str]:
+    return " ".join(text.lower().split()) if isinstance(text, str) and text.strip() else None
+
+
+class GlossaryGraph:
+    """In-memory adjacency index over glossary terms for multi-hop traversal.
+
+    Terms are linked through ``relatedTerms`` (in both directions), parent/child references and
+    synonyms: two terms are synonym-linked when a synonym of one equals the name or a synonym of
+    the other. Like the search index, terms are added and removed one at a time so the graph can
+    follow individual API responses between full refreshes.
+    """
+
+    def __init__(self, max_age: float = 300.0):
+        """Initialize the graph.
+
+        Args:
+            max_age: Seconds after the last full refresh before the graph is considered stale
+        """
+        self.max_age = max_age
+        self.refreshed_at: Optional[float] = None
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._ids_by_fqn: Dict[str, str] = {}
+        self._parents: Dict[str, str] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._related: Dict[str, Set[str]] = {}
+        self._related_in: Dict[str, Set[str]] = {}
+        self._synonyms: Dict[str, Set[str]] = {}
+        self._by_synonym: Dict[str, Set[str]] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, term_id: str) -> bool:
+        return term_id in self._nodes
+
+    @property
+    def is_built(self) -> bool:
+        return self.refreshed_at is not None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at >= self.max_age
+
+    def get_id(self, fqn: str) -> Optional[str]:
+        return self._ids_by_fqn.get(fqn)
+
+    def upsert(self, term: Dict[str, Any]) -> None:
+        """Add a glossary term entity, replacing its previous edges.
+
+        Related-term edges are only replaced when the entity carries ``relatedTerms``, so responses
+        fetched without that field keep the edges already known.
+        """
+        term_id = term.get("id")
+        fqn = term.get("fullyQualifiedName")
+        if not term_id or not fqn:
+            return
+        parent = term.get("parent")
+        if isinstance(parent, dict) and parent.get("fullyQualifiedName"):
+            parent_fqn: Optional[str] = parent["fullyQualifiedName"]
+        else:
+            parts = split_fqn(fqn)
+            parent_fqn = ".".join(parts[:-1]) if len(parts) > 2 else None
+        has_related = isinstance(term.get("relatedTerms"), list)
+        related = {ref_id for ref_id in map(_ref_id, term.get("relatedTerms") or ()) if ref_id and ref_id != term_id}
+        synonyms = {key for key in map(_normalize, term.get("synonyms") or ()) if key}
+
+        with self._lock:
+            previous_related = self._related.get(term_id, set())
+            self._remove_locked(term_id)
+            self._nodes[term_id] = {
+                "id": term_id,
+                "fullyQualifiedName": fqn,
+                "name": term.get("name"),
+                "displayName": term.get("displayName"),
+            }
+            self._ids_by_fqn[fqn] = term_id
+            if parent_fqn:
+                self._parents[term_id] = parent_fqn
+                self._children.setdefault(parent_fqn, set()).add(term_id)
+            for ref_id in related if has_related else previous_related:
+                self._related.setdefault(term_id, set()).add(ref_id)
+                self._related_in.setdefault(ref_id, set()).add(term_id)
+            self._synonyms[term_id] = synonyms
+            for key in synonyms:
+                self._by_synonym.setdefault(key, set()).add(term_id)
+            name_key = _normalize(term.get("name"))
+            if name_key:
+                self._by_name.setdefault(name_key, set()).add(term_id)
+
+    def remove(self, term_id: str) -> None:
+        with self._lock:
+            self._remove_locked(term_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, term_id: str) -> None:
+        members = index.get(key)
+        if members is not None:
+            members.discard(term_id)
+            if not members:
+                del index[key]
+
+    def _remove_locked(self, term_id: str) -> None:
+        node = self._nodes.pop(term_id, None)
+        if node is None:
+            return
+        if self._ids_by_fqn.get(node["fullyQualifiedName"]) == term_id:
+            del self._ids_by_fqn[node["fullyQualifiedName"]]
+        parent_fqn = self._parents.pop(term_id, None)
+        if parent_fqn:
+            self._discard(self._children, parent_fqn, term_id)
+        # Incoming edges stay recorded so they reconnect if the term comes back; neighbors() skips missing terms
+        for ref_id in self._related.pop(term_id, set()):
+            self._discard(self._related_in, ref_id, term_id)
+        for key in self._synonyms.pop(term_id, set()):
+            self._discard(self._by_synonym, key, term_id)
+        name_key = _normalize(node.get("name"))
+        if name_key:
+            self._discard(self._by_name, name_key, term_id)
+
+    def remove_prefix(self, fqn: str) -> None:
+        """Remove a term and every term nested under its FQN."""
+        prefix = f"{fqn}."
+        with self._lock:
+            stale = [
+                term_id
+                for term_fqn, term_id in self._ids_by_fqn.items()
+                if term_fqn == fqn or term_fqn.startswith(prefix)
+            ]
+            for term_id in stale:
+                self._remove_locked(term_id)
+
+    def replace_all(self, term_ids: Set[str]) -> None:
+        """Finish a full refresh: drop every term not seen in it and mark the graph fresh."""
+        with self._lock:
+            for term_id in [term_id for term_id in self._nodes if term_id not in term_ids]:
+                self._remove_locked(term_id)
+            self.refreshed_at = time.monotonic()
+
+    def neighbors(self, term_id: str, relations: Iterable[str] = RELATIONS) -> Iterator[Tuple[str, str]]:
+        """Yield ``(neighbor_id, relation)`` pairs for every edge of ``term_id`` of the given relations."""
+        node = self._nodes.get(term_id)
+        if node is None:
+            return
+        relations = set(relations)
+        if RELATED in relations:
+            for ref_id in self._related_ids(term_id):
+                yield ref_id, RELATED
+        if PARENT in relations and term_id in self._parents:
+            parent_id = self._ids_by_fqn.get(self._parents[term_id])
+            if parent_id:
+                yield parent_id, PARENT
+        if CHILD in relations:
+            for child_id in self._children.get(node["fullyQualifiedName"], ()):
+                yield child_id, CHILD
+        if SYNONYM in relations:
+            for other_id in self._synonym_ids(term_id, node):
+                yield other_id, SYNONYM
+
+    def _related_ids(self, term_id: str) -> Set[str]:
+        # Related terms in either direction, skipping references to terms not in the graph
+        linked = self._related.get(term_id, set()) | self._related_in.get(term_id, set())
+        return {ref_id for ref_id in linked if ref_id in self._nodes}
+
+    def _synonym_ids(self, term_id: str, node: Dict[str, Any]) -> Set[str]:
+        # Terms named by one of this term's synonyms, sharing one, or listing this term's name as one
+        linked: Set[str] = set()
+        for key in self._synonyms.get(term_id, ()):
+            linked |= self._by_synonym.get(key, set()) | self._by_name.get(key, set())
+        name_key = _normalize(node.get("name"))
+        if name_key:
+            linked |= self._by_synonym.get(name_key, set())
+        return linked - {term_id}
+
+    def traverse(
+        self, start_id: str, max_hops: int = 2, relations: Iterable[str] = RELATIONS, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Breadth-first walk from ``start_id``.
+
+        Args:
+            start_id: UUID of the starting term
+            max_hops: Maximum number of edges between the start and a returned term
+            relations: Edge types to follow
+            limit: Maximum number of terms to return
+
+        Returns:
+            Reached terms in BFS order, each with ``hops``, the ``relation`` it was reached by and
+            the FQN of the term it was reached ``from``
+        """
+        relations = tuple(relations)
+        with self._lock:
+            if start_id not in self._nodes:
+                return []
+            visited = {start_id}
+            queue = deque([(start_id, 0)])
+            reached: List[Dict[str, Any]] = []
+            while queue and len(reached) < limit:
+                term_id, hops = queue.popleft()
+                if hops >= max_hops:
+                    continue
+                for neighbor_id, relation in sorted(self.neighbors(term_id, relations)):
+                    if neighbor_id in visited:
+                        continue
+                    visited.add(neighbor_id)
+                    reached.append(
+                        {
+                            **self._nodes[neighbor_id],
+                            "hops": hops + 1,
+                            "relation": relation,
+                            "from": self._nodes[term_id]["fullyQualifiedName"],
+                        }
+                    )
+                    if len(reached) >= limit:
+                        break
+                    queue.append((neighbor_id, hops + 1))
+            return reached
+
+    def shortest_path(
+        self, start_id: str, target_id: str, max_hops: int = 6, relations: Iterable[str] = RELATIONS
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Find a shortest path between two terms with BFS.
+
+        Returns:
+            Terms along the path from start to target, each after the first with the ``relation``
+            that leads to it, or None if the target is not reachable within ``max_hops``
+        """
+        relations = tuple(relations)
+        with self._lock:
+            if start_id not in self._nodes or target_id not in self._nodes:
+                return None
+            previous: Dict[str, Optional[Tuple[str, str]]] = {start_id: None}
+            queue = deque([(start_id, 0)])
+            while queue and target_id not in previous:
+                term_id, hops = queue.popleft()
+                if hops >= max_hops:
+                    continue
+                for neighbor_id, relation in sorted(self.neighbors(term_id, relations)):
+                    if neighbor_id not in previous:
+                        previous[neighbor_id] = (term_id, relation)
+                        queue.append((neighbor_id, hops + 1))
+            if target_id not in previous:
+                return None
+            path = []
+            step: Optional[str] = target_id
+            while step is not None:
+                link = previous[step]
+                path.append({**self._nodes[step], "relation": link[1]} if link else dict(self._nodes[step]))
+                step = link[0] if link else None
+            return path[::-1]
+
+    def clear(self) -> None:
+        with self._lock:
+            for index in (
+                self._nodes,
+                self._ids_by_fqn,
+                self._parents,
+                self._children,
+                self._related,
+                self._related_in,
+                self._synonyms,
+                self._by_synonym,
+                self._by_name,
+            ):
+                index.clear()
+            self.refreshed_at = None
@@ -0,0 +1,148 @@
+"""Incremental parsing of OpenMetadata list responses.
+
+A list response is ``{"data": [entity, ...], "paging": {...}}``. ListResponseParser is fed the body in
+chunks as it arrives and hands back every entity of ``data`` as soon as its last byte is in, so only
+the entity being received is buffered instead of the whole body and then the whole decoded page.
+The top-level object is tokenized here; each entity and envelope value is decoded by ``json``.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Parser states: what the next non-whitespace character of the body must start
+_OBJECT = 0  # the top-level "{"
+_KEY = 1  # a key, or "}" after "{"
+_COLON = 2
+_VALUE = 3
+_NEXT_KEY = 4  # "," or "}"
+_FIRST_ENTITY = 5  # an entity, or "]" after "["
+_ENTITY = 6
+_NEXT_ENTITY = 7  # "," or "]"
+_END = 8
+
+_ENTITIES_KEY = "data"
+
+# Characters that end a number or literal; at the end of a chunk it may still continue
+_DELIMITERS = frozenset(",]} \t\n\r")
+
+
+class ListResponseParser:
+    """Push parser yielding the entities of a list response's top-level ``data`` array."""
+
+    def __init__(self) -> None:
+        self.bytes_received = 0
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _OBJECT
+        self._key: Optional[str] = None
+        self._envelope: Dict[str, Any] = {}
+        # Buffered characters needed before an incomplete value is decoded again; doubling it keeps
+        # entities larger than a chunk from being re-decoded on every chunk
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        """Consume the next chunk of the body.
+
+        Args:
+            chunk: Next bytes of the body
+            final: Whether this is the end of the body
+
+        Returns:
+            Entities of ``data`` completed by this chunk, in order
+
+        Raises:
+            ValueError: If the body is not a JSON object, or is incomplete at its end
+        """
+        self.bytes_received += len(chunk)
+        self._buffer += self._text.decode(chunk, final=final)
+        if final:
+            self._retry_at = 0
+        buffer = self._buffer
+        entities: List[Any] = []
+        position = 0
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            state = self._state
+            if state == _FIRST_ENTITY and char == "]":
+                self._state = _NEXT_KEY
+                position += 1
+            elif (
+                state in (_FIRST_ENTITY, _ENTITY)
+                or (state == _VALUE and (self._key != _ENTITIES_KEY or char != "["))
+                or (state == _KEY and char == '"')
+            ):
+                end = self._take(buffer, position, final, entities)
+                if end is None:
+                    break
+                position = end
+            else:
+                self._state = self._punctuation(state, char)
+                position += 1
+        self._buffer = buffer[position:]
+        if final and (self._state != _END or self._buffer):
+            raise ValueError("Incomplete or malformed list response")
+        return entities
+
+    def _take(self, buffer: str, position: int, final: bool, entities: List[Any]) -> Optional[int]:
+        # Decodes the key, envelope value or entity starting at ``position``; returns where it ends,
+        # or None if it is not complete yet
+        decoded = self._decode(buffer, position, final)
+        if decoded is None:
+            return None
+        value, end = decoded
+        if self._state == _KEY:
+            self._key = value
+            self._state = _COLON
+        elif self._state == _VALUE:
+            self._envelope[self._key] = value
+            self._state = _NEXT_KEY
+        else:
+            entities.append(value)
+            self._state = _NEXT_ENTITY
+        return end
+
+    def _punctuation(self, state: int, char: str) -> int:
+        if state == _OBJECT and char == "{":
+            return _KEY
+        if state == _KEY and char == "}":
+            return _END
+        if state == _COLON and char == ":":
+            return _VALUE
+        if state == _VALUE:  # "[" of the entities; other values are decoded whole
+            self._envelope[_ENTITIES_KEY] = []
+            return _FIRST_ENTITY
+        if state == _NEXT_KEY and char in ",}":
+            return _KEY if char == "," else _END
+        if state == _NEXT_ENTITY and char in ",]":
+            return _ENTITY if char == "," else _NEXT_KEY
+        raise ValueError(f"Unexpected {char!r} in list response")
+
+    def _decode(self, buffer: str, position: int, final: bool) -> Optional[Tuple[Any, int]]:
+        if len(buffer) - position < self._retry_at:
+            return None
+        try:
+            value, end = _DECODER.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # Most likely cut off by the chunk boundary; a malformed body is reported by ``feed(..., final=True)``
+            self._retry_at = 2 * (len(buffer) - position)
+            return None
+        if not final and not isinstance(value, (dict, list, str)) and buffer[end : end + 1] not in _DELIMITERS:
+            # A number or literal is only complete once a delimiter follows it: "12" or "1." may continue
+            # in the next chunk as "125" or "1.5"
+            self._retry_at = len(buffer) - position + 1
+            return None
+        self._retry_at = 0
+        return value, end
+
+    @property
+    def envelope(self) -> Dict[str, Any]:
+        """The response without its entities (``data`` is an empty list), complete after the final chunk."""
+        return self._envelope
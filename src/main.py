@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import click
 from mcp.server import Server
@@ -6,48 +7,170 @@ from mcp.types import Resource, TextContent, Tool
 
 from src.config import Config
 from src.mcp_components.resources import list_all_resources
-from src.mcp_components.tools import call_tool, list_all_tools
-from src.openmetadata import OpenMetadataClient
-from src.server import get_server_runner
+from src.mcp_components.tools import TOOL_REGISTRY, call_tool, list_all_tools
+from src.metrics import Metrics
+from src.openmetadata import AsyncOpenMetadataClient
+from src.quotas import CALLER_KEY, AdmissionController, QuotaExceededError, QuotaPolicy, parse_tool_quotas
+from src.resilience import CircuitBreaker, RetryPolicy
+from src.server import TRANSPORTS, get_server_runner
+from src.shared_cache import SharedCache
+from src.sync import ChangeEventSync
 
 DEFAULT_PORT = 8000
 DEFAULT_TRANSPORT = "stdio"
 SERVER_NAME = "mcp-server-openmetadata"
 
 
-@click.command()
-@click.option("--port", default=DEFAULT_PORT, help="Port to listen on for SSE")
-@click.option("--transport", default=DEFAULT_TRANSPORT, type=click.Choice(["stdio", "sse"]))
-def main(port: int, transport: str) -> int:
-    # Get OpenMetadata credentials from environment
-    config = Config.from_env()
+def _create_client(config: Config) -> AsyncOpenMetadataClient:
+    # Share cached lookups with the other SSE workers when a shared cache socket is configured
+    cache = None
+    if config.OPENMETADATA_SHARED_CACHE_SOCKET:
+        cache = SharedCache(
+            config.OPENMETADATA_SHARED_CACHE_SOCKET,
+            ttl=config.OPENMETADATA_CACHE_TTL,
+            max_entries=config.OPENMETADATA_CACHE_MAX_ENTRIES,
+        )
 
     # Initialize OpenMetadata client
-    client = OpenMetadataClient(
+    return AsyncOpenMetadataClient(
         host=config.OPENMETADATA_HOST,
         api_token=config.OPENMETADATA_JWT_TOKEN,
         username=config.OPENMETADATA_USERNAME,
         password=config.OPENMETADATA_PASSWORD,
+        cache_ttl=config.OPENMETADATA_CACHE_TTL,
+        cache_max_entries=config.OPENMETADATA_CACHE_MAX_ENTRIES,
+        max_connections=config.OPENMETADATA_MAX_CONNECTIONS,
+        max_keepalive_connections=config.OPENMETADATA_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.OPENMETADATA_KEEPALIVE_EXPIRY,
+        connect_timeout=config.OPENMETADATA_CONNECT_TIMEOUT,
+        read_timeout=config.OPENMETADATA_READ_TIMEOUT,
+        http2=config.OPENMETADATA_HTTP2,
+        max_page_size=config.OPENMETADATA_MAX_PAGE_SIZE,
+        max_response_bytes=config.OPENMETADATA_MAX_RESPONSE_BYTES,
+        retry_policy=RetryPolicy(
+            max_retries=config.OPENMETADATA_MAX_RETRIES,
+            backoff_base=config.OPENMETADATA_RETRY_BACKOFF,
+            max_delay=config.OPENMETADATA_RETRY_MAX_DELAY,
+        ),
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=config.OPENMETADATA_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=config.OPENMETADATA_CIRCUIT_RESET_TIMEOUT,
+        ),
+        snapshot_path=config.OPENMETADATA_SNAPSHOT_PATH,
+        snapshot_refresh_interval=config.OPENMETADATA_SNAPSHOT_REFRESH_INTERVAL,
+        coalesce_requests=config.OPENMETADATA_COALESCE_REQUESTS,
+        cache=cache,
+    )
+
+
+def _create_sync(client: AsyncOpenMetadataClient, config: Config) -> Optional[ChangeEventSync]:
+    # Keep cached glossary state current from OpenMetadata's change events
+    if config.OPENMETADATA_SYNC_INTERVAL <= 0:
+        return None
+    return ChangeEventSync(client, interval=config.OPENMETADATA_SYNC_INTERVAL, max_gap=config.OPENMETADATA_SYNC_MAX_GAP)
+
+
+def create_server(config: Config) -> Tuple[Server, AsyncOpenMetadataClient]:
+    """Build the MCP server and the OpenMetadata client its handlers use."""
+    client = _create_client(config)
+    sync = _create_sync(client, config)
+
+    # Keep one caller from starving the others of the shared client
+    quotas = AdmissionController(
+        session_policy=QuotaPolicy(
+            rate=config.OPENMETADATA_SESSION_RATE_LIMIT,
+            burst=config.OPENMETADATA_SESSION_BURST,
+            max_in_flight=config.OPENMETADATA_SESSION_MAX_IN_FLIGHT,
+        ),
+        tool_policies=parse_tool_quotas(config.OPENMETADATA_TOOL_QUOTAS),
+        max_wait=config.OPENMETADATA_QUOTA_MAX_WAIT,
     )
 
+    def start_background_tasks() -> None:
+        # Background tasks need the server's event loop, so they start with the first request
+        client.schedule_snapshot_revalidation()
+        if sync is not None:
+            sync.ensure_started()
+
     # Create MCP server
     app = Server(SERVER_NAME)
 
+    def caller_key() -> Optional[Hashable]:
+        # SSE and stdio calls belong to an MCP session; stateless HTTP transports name the caller instead
+        try:
+            return id(app.request_context.session)
+        except LookupError:
+            return CALLER_KEY.get()
+
     @app.list_resources()
     async def handle_list_resources() -> List[Resource]:
         return list_all_resources()
 
     @app.list_tools()
     async def handle_list_tools() -> List[Tool]:
+        start_background_tasks()
         return list_all_tools()
 
     @app.call_tool()
     async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-        return call_tool(name, arguments, client)
+        start_background_tasks()
+        started_at = time.perf_counter()
+        status = "error"
+        results: List[TextContent] = []
+        try:
+            spec = TOOL_REGISTRY.get(name)
+            if spec is None or not quotas.enabled:
+                results = await call_tool(name, arguments, client)
+            else:
+                async with quotas.admit(caller_key(), name, spec.concurrency):
+                    results = await call_tool(name, arguments, client)
+            status = "ok"
+            return results
+        except QuotaExceededError:
+            status = "rejected"
+            raise
+        finally:
+            response_bytes = sum(len(content.text) for content in results)
+            client.metrics.observe_tool(name, status, time.perf_counter() - started_at, response_bytes)
+
+    return app, client
+
+
+def create_worker_server() -> Tuple[Server, Metrics]:
+    """Build a server in an SSE worker process, configured from the environment it inherited."""
+    app, client = create_server(Config.from_env())
+    return app, client.metrics
+
+
+@click.command()
+@click.option("--port", default=DEFAULT_PORT, help="Port to listen on for SSE and Streamable HTTP")
+@click.option("--transport", default=DEFAULT_TRANSPORT, type=click.Choice(TRANSPORTS))
+@click.option("--workers", default=1, help="Number of SSE worker processes")
+@click.option("--debug/--no-debug", default=False, help="Run the HTTP app in Starlette debug mode")
+def main(port: int, transport: str, workers: int, debug: bool) -> int:
+    # Get OpenMetadata credentials from environment
+    config = Config.from_env()
+
+    # With several SSE workers each worker process builds its own server and client
+    app, metrics = None, None
+    if transport != "sse" or workers <= 1:
+        app, client = create_server(config)
+        metrics = client.metrics
 
     # Start server
     try:
-        server_runner = get_server_runner(app, transport, port=port)
+        server_runner = get_server_runner(
+            app,
+            transport,
+            port=port,
+            metrics=metrics,
+            workers=workers,
+            debug=debug,
+            worker_factory=create_worker_server,
+            shared_cache_socket=config.OPENMETADATA_SHARED_CACHE_SOCKET,
+            cache_ttl=config.OPENMETADATA_CACHE_TTL,
+            cache_max_entries=config.OPENMETADATA_CACHE_MAX_ENTRIES,
+        )
         return server_runner()
     except Exception as e:
         print(f"Server failed to start: {str(e)}")
@@ -0,0 +1,254 @@
+"""Bounded list tool results.
+
+List tools may ask for more entities than one OpenMetadata page holds. The result is assembled from
+several pages of at most ``max_page_size`` and cut off at a byte budget; a cut inside a page is
+resumed with a continuation cursor that records the page's cursor and how many of its entities
+were already returned.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from mcp.types import TextContent
+
+from src.mcp_components.serialization import Projection, _apply_projection, _projection_tree, dumps, prune, serialize
+from src.openmetadata import AsyncPageStream
+
+# Marks continuation cursors that resume inside an OpenMetadata page rather than at its start
+CONTINUATION_PREFIX = "mcp:"
+
+# Opens a stream of the page starting at a cursor (None for the first page) with the given page size
+PageFetcher = Callable[[Any, int], Awaitable[AsyncPageStream]]
+# Computes the cursor of the page after the one fetched with ``cursor`` from its paging, the number
+# of entities it held and the page size, or None at the end
+NextCursor = Callable[[Any, Dict[str, Any], int, int], Any]
+# Renders the paging fields that resume a listing at entity ``index`` of the page fetched with ``cursor``
+Continuation = Callable[[Any, int], Dict[str, Any]]
+
+
+def encode_continuation(after: Optional[str], skip: int) -> Optional[str]:
+    """Return a cursor resuming ``skip`` entities past the OpenMetadata cursor ``after``."""
+    if not skip:
+        return after
+    payload = json.dumps({"after": after, "skip": skip}, separators=(",", ":")).encode()
+    return CONTINUATION_PREFIX + base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_continuation(cursor: Optional[str]) -> Tuple[Optional[str], int]:
+    """Split a cursor into an OpenMetadata cursor and the number of entities to skip past it.
+
+    Raises:
+        ValueError: If the cursor carries the continuation prefix but cannot be decoded
+    """
+    if not cursor or not cursor.startswith(CONTINUATION_PREFIX):
+        return cursor, 0
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor[len(CONTINUATION_PREFIX) :]))
+        return payload["after"], max(0, int(payload["skip"]))
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid continuation cursor: {cursor}") from None
+
+
+def next_after(cursor: Any, paging: Dict[str, Any], received: int, page_size: int) -> Optional[str]:
+    return paging.get("after") or None
+
+
+def next_offset(offset: Any, paging: Dict[str, Any], received: int, page_size: int) -> Optional[int]:
+    return (offset or 0) + received if received >= page_size else None
+
+
+def after_continuation(cursor: Any, index: int) -> Dict[str, Any]:
+    return {"after": encode_continuation(cursor, index)}
+
+
+def offset_continuation(offset: Any, index: int) -> Dict[str, Any]:
+    return {"offset": (offset or 0) + index}
+
+
+class BoundedResult:
+    """Entities of a list result, projected and encoded as they arrive, within a count and byte budget."""
+
+    def __init__(self, limit: Optional[int], max_bytes: int, projection: Projection = None):
+        """Initialize an empty result.
+
+        Args:
+            limit: Maximum number of entities (None for no limit)
+            max_bytes: Byte budget of the encoded entities (at least one entity is always accepted)
+            projection: Dotted field paths to keep in each entity
+        """
+        self.limit = None if limit is None else max(1, limit)
+        self.max_bytes = max_bytes
+        self.encoded: List[str] = []
+        self.size = 0
+        self._tree = _projection_tree(projection)
+
+    @property
+    def full(self) -> bool:
+        return self.limit is not None and len(self.encoded) >= self.limit
+
+    def add(self, entity: Any) -> bool:
+        """Encode ``entity`` into the result; return False if it does not fit."""
+        if self.full:
+            return False
+        item = dumps(prune(_apply_projection(entity, self._tree)))
+        if self.encoded and self.size + len(item) + 1 > self.max_bytes:
+            return False
+        self.encoded.append(item)
+        self.size += len(item) + 1
+        return True
+
+
+async def _read_page(page: AsyncPageStream, result: BoundedResult, skip: int, drain: bool) -> Tuple[int, Optional[int]]:
+    # Returns the number of entities read and the index of the first one that did not fit, if any.
+    # A drained page is read to its end after the cut, so its paging (which follows the entities) is known.
+    received = 0
+    resume = None
+    try:
+        async for entity in page:
+            if resume is None and received >= skip and not result.add(entity):
+                resume = received
+                if not drain:
+                    break
+            received += 1
+    finally:
+        await page.aclose()
+    return received, resume
+
+
+async def fill_result(
+    result: BoundedResult,
+    fetch: PageFetcher,
+    next_cursor: NextCursor,
+    continuation: Continuation,
+    cursor: Any,
+    page_size: int,
+    skip: int = 0,
+) -> Dict[str, Any]:
+    """Add entities from pages of at most ``page_size`` to ``result`` until it is full or the pages end.
+
+    Args:
+        result: Result to fill
+        fetch: Opens a stream of one page for a cursor and page size
+        next_cursor: Computes the cursor of the following page
+        continuation: Renders the paging fields resuming at an entity of a page
+        cursor: Cursor of the first page (None to start at the beginning)
+        page_size: Maximum number of entities requested per page
+        skip: Entities of the first page to skip (from a continuation cursor)
+
+    Returns:
+        Paging of the result: ``before`` of the first page, ``total``, the continuation to resume from
+        and ``truncated`` when the byte budget cut the result short
+    """
+    paging: Dict[str, Any] = {}
+    first = True
+    while True:
+        requested = page_size if result.limit is None else min(page_size, skip + result.limit - len(result.encoded))
+        page = await fetch(cursor, requested)
+        received, resume = await _read_page(page, result, skip, drain=first)
+        if first and "before" in page.paging:
+            paging["before"] = page.paging["before"]
+        if "total" in page.paging:
+            paging["total"] = page.paging["total"]
+        first = False
+        if resume is not None:
+            if not result.full:
+                paging["truncated"] = True
+            paging.update(continuation(cursor, resume))
+            return paging
+        cursor = next_cursor(cursor, page.paging, received, requested)
+        skip = 0
+        if cursor is None:
+            return paging
+        if result.full:
+            paging.update(continuation(cursor, 0))
+            return paging
+
+
+async def collect_pages(
+    fetch: PageFetcher,
+    next_cursor: NextCursor,
+    continuation: Continuation,
+    cursor: Any,
+    limit: int,
+    page_size: int,
+    max_bytes: int,
+    skip: int = 0,
+    projection: Projection = None,
+    selector: Optional[str] = None,
+) -> List[TextContent]:
+    """Build a list tool result of up to ``limit`` entities from pages of at most ``page_size``.
+
+    Entities are projected and encoded as each page's body is decoded, so no raw page is held whole.
+    The result stops early once its encoded entities would exceed ``max_bytes`` (at least one entity
+    is always returned); ``paging`` then carries a continuation to resume from and ``truncated``.
+
+    Args:
+        fetch: Opens a stream of one page for a cursor and page size
+        next_cursor: Computes the cursor of the following page
+        continuation: Renders the paging fields resuming at an entity of a page
+        cursor: Cursor of the first page (None to start at the beginning)
+        limit: Maximum number of entities to return
+        page_size: Maximum number of entities requested per page
+        max_bytes: Byte budget of the encoded entities
+        skip: Entities of the first page to skip (from a continuation cursor)
+        projection: Dotted field paths to keep in each entity
+        selector: JSONPath-style selector applied to the assembled result
+    """
+    result = BoundedResult(limit, max_bytes, projection)
+    paging = await fill_result(result, fetch, next_cursor, continuation, cursor, page_size, skip)
+    return _render(result, paging, selector)
+
+
+async def collect_page_before(
+    fetch: PageFetcher,
+    cursor: str,
+    limit: int,
+    page_size: int,
+    max_bytes: int,
+    projection: Projection = None,
+    selector: Optional[str] = None,
+) -> List[TextContent]:
+    """Build a list tool result from the page of up to ``limit`` entities before ``cursor``.
+
+    Backward paging reads a single OpenMetadata page of at most ``page_size``; its ``paging.before``
+    leads further back. The page is still cut off at ``max_bytes``, in which case ``paging.after``
+    resumes forward at the first entity left out and ``truncated`` is set.
+
+    Args:
+        fetch: Opens a stream of the page before a cursor for a page size
+        cursor: ``before`` cursor of the page
+        limit: Maximum number of entities to return
+        page_size: Maximum number of entities requested
+        max_bytes: Byte budget of the encoded entities
+        projection: Dotted field paths to keep in each entity
+        selector: JSONPath-style selector applied to the assembled result
+    """
+    result = BoundedResult(limit, max_bytes, projection)
+    page = await fetch(cursor, min(result.limit, page_size))
+    _, resume = await _read_page(page, result, 0, drain=True)
+    paging = {key: page.paging[key] for key in ("before", "after", "total") if key in page.paging}
+    if resume is not None:
+        if not result.full:
+            paging["truncated"] = True
+        paging["after"] = encode_continuation(await _page_start(fetch, paging.get("before")), resume)
+    return _render(result, paging, selector)
+
+
+async def _page_start(fetch: PageFetcher, before: Optional[str]) -> Optional[str]:
+    # The ``after`` cursor of the entity preceding a page (whose ``before`` cursor is given) resumes
+    # forward at the page's first entity; the first page has no ``before`` and starts the listing
+    if not before:
+        return None
+    page = await fetch(before, 1)
+    async for _ in page:
+        pass
+    return page.paging.get("after")
+
+
+def _render(result: BoundedResult, paging: Dict[str, Any], selector: Optional[str]) -> List[TextContent]:
+    text = '{"data":[' + ",".join(result.encoded) + '],"paging":' + dumps(paging) + "}"
+    if selector:
+        text = serialize(json.loads(text), selector=selector)
+    return [TextContent(type="text", text=text)]
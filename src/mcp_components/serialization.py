@@ -0,0 +1,143 @@
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from mcp.types import TextContent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+# Comma-separated string ("name,columns.name") or list of dotted field paths; "*" keeps every field
+Projection = Union[str, Iterable[str], None]
+
+# One step of a selector: ".name", ".*", "[3]", "[*]" or "[start:end]"
+_SELECTOR_STEP = re.compile(r"\.?([A-Za-z_][\w-]*|\*)|\[(\*|-?\d+|-?\d*:-?\d*)\]")
+
+
+def dumps(value: Any) -> str:
+    """Encode ``value`` as compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def prune(value: Any) -> Any:
+    """Recursively drop None values and empty strings, lists and dicts."""
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            item = prune(item)
+            if item is None or (isinstance(item, (dict, list, str)) and not item):
+                continue
+            pruned[key] = item
+        return pruned
+    if isinstance(value, list):
+        return [prune(item) for item in value if item is not None]
+    return value
+
+
+def _projection_tree(projection: Projection) -> Dict[str, Any]:
+    if isinstance(projection, str):
+        projection = projection.split(",")
+    paths = [path.strip() for path in projection or ()]
+    if "*" in paths:
+        return {}
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        for part in path.strip().split("."):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _apply_projection(value: Any, tree: Dict[str, Any]) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_apply_projection(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: _apply_projection(value[key], subtree) for key, subtree in tree.items() if key in value}
+    return value
+
+
+def project(result: Any, projection: Projection) -> Any:
+    """Keep only the projected fields of an entity, or of every entity in a list response's ``data``.
+
+    Args:
+        result: Entity or list response returned by the OpenMetadata client
+        projection: Dotted field paths to keep, e.g. "name,description,columns.name"
+
+    Returns:
+        Projected copy of ``result``; list envelopes keep their ``paging`` metadata
+    """
+    tree = _projection_tree(projection)
+    if not tree:
+        return result
+    if isinstance(result, dict) and isinstance(result.get("data"), list):
+        return {**result, "data": _apply_projection(result["data"], tree)}
+    return _apply_projection(result, tree)
+
+
+def _select_step(value: Any, key: Optional[str], index: Optional[str]) -> List[Any]:
+    # Values one selector step picks from ``value``: a field (``key``) or a list position (``index``)
+    if key == "*" or index == "*":
+        if isinstance(value, dict):
+            return list(value.values())
+        return list(value) if isinstance(value, list) else []
+    if key is not None:
+        return [value[key]] if isinstance(value, dict) and key in value else []
+    if not isinstance(value, list):
+        return []
+    if ":" in index:
+        start, end = (int(bound) if bound else None for bound in index.split(":"))
+        return value[start:end]
+    return [value[int(index)]] if -len(value) <= int(index) < len(value) else []
+
+
+def select(result: Any, selector: Optional[str]) -> Any:
+    """Extract values from a result with a JSONPath-style selector.
+
+    Supports an optional leading ``$``, ``.field``, ``.*``, ``[index]``, ``[*]`` and ``[start:end]``
+    steps, e.g. "data[*].name" or "$.columns[0:5].dataType". Missing fields are skipped.
+
+    Args:
+        result: Tool result to select from
+        selector: Selector expression; None or empty returns ``result`` unchanged
+
+    Returns:
+        The selected value, or a list of every match once a wildcard or slice step is used
+
+    Raises:
+        ValueError: If the selector cannot be parsed
+    """
+    if not selector:
+        return result
+    expression = selector.strip()
+    if expression.startswith("$"):
+        expression = expression[1:]
+    matches = [result]
+    many = False
+    position = 0
+    while position < len(expression):
+        step = _SELECTOR_STEP.match(expression, position)
+        if step is None or (step.group(0)[0] not in ".[" and position > 0):
+            raise ValueError(f"Invalid selector {selector!r} at position {position + len(selector) - len(expression)}")
+        position = step.end()
+        key, index = step.groups()
+        many = many or key == "*" or index == "*" or (index is not None and ":" in index)
+        matches = [match for value in matches for match in _select_step(value, key, index)]
+    if many:
+        return matches
+    return matches[0] if matches else None
+
+
+def serialize(result: Any, projection: Projection = None, selector: Optional[str] = None) -> str:
+    """Project, select, prune and encode a tool result as compact JSON."""
+    return dumps(prune(select(project(result, projection), selector)))
+
+
+def to_text_content(result: Any, projection: Projection = None, selector: Optional[str] = None) -> List[TextContent]:
+    return [TextContent(type="text", text=serialize(result, projection, selector))]
@@ -1,8 +1,78 @@
-from typing import Any, Dict, List
+import asyncio
+from dataclasses import dataclass
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from mcp.types import TextContent, Tool
 
-from src.openmetadata import OpenMetadataClient
+from src.graph import RELATIONS
+from src.mcp_components.pagination import (
+    BoundedResult,
+    after_continuation,
+    collect_page_before,
+    collect_pages,
+    decode_continuation,
+    fill_result,
+    next_after,
+    next_offset,
+    offset_continuation,
+)
+from src.mcp_components.serialization import dumps, to_text_content
+from src.openmetadata import AsyncOpenMetadataClient, AsyncPageStream, OpenMetadataError
+
+# Fields kept by the table tools when no projection is given; wide tables otherwise return every
+# column's href, id, FQN and profile. Requested ``fields`` are kept on top of these.
+DEFAULT_TABLE_PROJECTION = (
+    "id,name,displayName,fullyQualifiedName,description,tableType,owners.name,tags.tagFQN,"
+    "columns.name,columns.dataType,columns.description,columns.constraint,columns.tags.tagFQN"
+)
+DEFAULT_TABLE_LIST_PROJECTION = "id,name,displayName,fullyQualifiedName,description,tableType"
+
+# Table fields OpenMetadata only returns when named in ``fields``; without explicit ``fields`` the
+# table tools request those their projection keeps
+TABLE_FIELDS = (
+    "columns",
+    "owners",
+    "tags",
+    "followers",
+    "tableConstraints",
+    "tablePartition",
+    "usageSummary",
+    "customMetrics",
+    "joins",
+    "schemaDefinition",
+    "dataModel",
+    "extension",
+    "testSuite",
+    "domain",
+    "dataProducts",
+    "lifeCycle",
+    "sourceHash",
+    "votes",
+)
+
+PROJECTION_PROPERTY = {
+    "type": "string",
+    "description": "Comma-separated dotted paths of the fields to keep in each returned entity",
+    "example": "name,fullyQualifiedName,description",
+}
+
+TABLE_PROJECTION_PROPERTY = {
+    **PROJECTION_PROPERTY,
+    "description": (
+        "Comma-separated dotted paths of the fields to keep in each returned table; defaults to a minimal "
+        'set (names, descriptions, types, tags and column basics), use "*" for whole entities'
+    ),
+}
+
+SELECT_PROPERTY = {
+    "type": "string",
+    "description": (
+        "JSONPath-style selector applied to the result after projection; supports .field, .*, [index], "
+        "[*] and [start:end]"
+    ),
+    "example": "data[*].fullyQualifiedName",
+}
 
 LIST_TABLES_TOOL = Tool(
     name="list_tables",
@@ -10,8 +80,28 @@ LIST_TABLES_TOOL = Tool(
     inputSchema={
         "type": "object",
         "properties": {
-            "limit": {"type": "integer", "description": "Maximum number of tables to return", "default": 10},
+            "limit": {
+                "type": "integer",
+                "description": (
+                    "Maximum number of tables to return; long results are cut off at the server's size budget "
+                    "with paging.truncated set and paging.offset pointing at the next table"
+                ),
+                "default": 10,
+            },
             "offset": {"type": "integer", "description": "Number of tables to skip", "default": 0},
+            "fields": {
+                "type": "string",
+                "description": "Fields to include in the response",
+                "example": "owners,tags,columns",
+            },
+            "database": {"type": "string", "description": "Only list tables of this database (fully qualified name)"},
+            "include_deleted": {
+                "type": "boolean",
+                "description": "Whether to include deleted tables",
+                "default": False,
+            },
+            "projection": TABLE_PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
         },
     },
 )
@@ -28,6 +118,8 @@ GET_TABLE_TOOL = Tool(
                 "description": "Fields to include in the response",
                 "example": "name,description,columns,tags,href",
             },
+            "projection": TABLE_PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
         },
         "required": ["table_id"],
     },
@@ -45,11 +137,44 @@ GET_TABLE_BY_NAME_TOOL = Tool(
                 "description": "Fields to include in the response",
                 "example": "name,description,columns,tags,href",
             },
+            "projection": TABLE_PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
         },
         "required": ["fqn"],
     },
 )
 
+GET_TABLES_BATCH_TOOL = Tool(
+    name="get_tables_batch",
+    description=(
+        "Get many tables by ID and/or fully qualified name in one call. Tables are fetched concurrently "
+        "(cached ones without a request) and returned together, with an error entry for each one not found."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ids": {"type": "array", "description": "IDs of the tables to retrieve", "items": {"type": "string"}},
+            "fqns": {
+                "type": "array",
+                "description": "Fully qualified names of the tables to retrieve",
+                "items": {"type": "string"},
+            },
+            "fields": {
+                "type": "string",
+                "description": "Fields to include in the response",
+                "example": "name,description,columns,tags,href",
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "description": "Maximum number of requests in flight at once",
+                "default": 8,
+            },
+            "projection": TABLE_PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
+        },
+    },
+)
+
 CREATE_TABLE_TOOL = Tool(
     name="create_table",
     description="Create a new table",
@@ -95,14 +220,26 @@ LIST_GLOSSARIES_TOOL = Tool(
     inputSchema={
         "type": "object",
         "properties": {
-            "limit": {"type": "integer", "description": "Maximum number of glossaries to return", "default": 10},
+            "limit": {
+                "type": "integer",
+                "description": (
+                    "Maximum number of glossaries to return; long results are cut off at the server's size budget "
+                    "with paging.truncated set and paging.after to continue from"
+                ),
+                "default": 10,
+            },
             "fields": {
                 "type": "string",
                 "description": "Fields to include in the returned resource",
                 "example": "owners,tags,reviewers,usageCount,termCount,domain,extension",
             },
             "before": {"type": "string", "description": "Returns list of glossaries before this cursor"},
-            "after": {"type": "string", "description": "Returns list of glossaries after this cursor"},
+            "after": {
+                "type": "string",
+                "description": "Returns list of glossaries after this cursor (paging.after of a previous result)",
+            },
+            "projection": PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
             "include": {
                 "type": "string",
                 "description": "Include all, deleted, or non-deleted entities.",
@@ -125,6 +262,8 @@ GET_GLOSSARY_BY_NAME_TOOL = Tool(
                 "description": "Fields to include in the returned resource",
                 "example": "owners,tags,reviewers,usageCount,termCount,domain,extension",
             },
+            "projection": PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
             "include": {
                 "type": "string",
                 "description": "Include all, deleted, or non-deleted entities.",
@@ -145,14 +284,26 @@ LIST_GLOSSARY_TERMS_TOOL = Tool(
         "type": "object",
         "properties": {
             "glossary_fqn": {"type": "string", "description": "Fully qualified name of the glossary to filter terms from."},
-            "limit": {"type": "integer", "description": "Maximum number of terms to return", "default": 10},
+            "limit": {
+                "type": "integer",
+                "description": (
+                    "Maximum number of terms to return; long results are cut off at the server's size budget "
+                    "with paging.truncated set and paging.after to continue from"
+                ),
+                "default": 10,
+            },
             "fields": {
                 "type": "string",
                 "description": "Fields to include in the returned resource",
                 "example": "children,relatedTerms,reviewers,owners,tags,usageCount,domain,extension,childrenCount",
             },
             "before": {"type": "string", "description": "Returns list of terms before this cursor"},
-            "after": {"type": "string", "description": "Returns list of terms after this cursor"},
+            "after": {
+                "type": "string",
+                "description": "Returns list of terms after this cursor (paging.after of a previous result)",
+            },
+            "projection": PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
             "include": {
                 "type": "string",
                 "description": "Include all, deleted, or non-deleted entities.",
@@ -175,6 +326,8 @@ GET_GLOSSARY_TERM_BY_NAME_TOOL = Tool(
                 "description": "Fields to include in the returned resource",
                 "example": "children,relatedTerms,reviewers,owners,tags,usageCount,domain,extension,childrenCount",
             },
+            "projection": PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
             "include": {
                 "type": "string",
                 "description": "Include all, deleted, or non-deleted entities.",
@@ -186,6 +339,43 @@ GET_GLOSSARY_TERM_BY_NAME_TOOL = Tool(
     },
 )
 
+GET_GLOSSARY_TERMS_BATCH_TOOL = Tool(
+    name="get_glossary_terms_batch",
+    description=(
+        "Get many glossary terms by ID and/or fully qualified name in one call. Terms are fetched concurrently "
+        "(cached ones without a request) and returned together, with an error entry for each one not found."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ids": {"type": "array", "description": "UUIDs of the glossary terms", "items": {"type": "string"}},
+            "fqns": {
+                "type": "array",
+                "description": "Fully qualified names of the glossary terms",
+                "items": {"type": "string"},
+            },
+            "fields": {
+                "type": "string",
+                "description": "Fields to include in the returned resources",
+                "example": "children,relatedTerms,reviewers,owners,tags,usageCount,domain,extension,childrenCount",
+            },
+            "include": {
+                "type": "string",
+                "description": "Include all, deleted, or non-deleted entities.",
+                "default": "non-deleted",
+                "enum": ["all", "deleted", "non-deleted"],
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "description": "Maximum number of requests in flight at once",
+                "default": 8,
+            },
+            "projection": PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
+        },
+    },
+)
+
 # --- Create Glossary Term Tool ---
 CREATE_GLOSSARY_TERM_TOOL = Tool(
     name="create_glossary_term",
@@ -197,6 +387,10 @@ CREATE_GLOSSARY_TERM_TOOL = Tool(
             "display_name": {"type": "string", "description": "Display name of the glossary term"},
             "description": {"type": "string", "description": "Description of the glossary term"},
             "glossary_fqn": {"type": "string", "description": "Fully qualified name of the parent glossary (e.g., 'main')"},
+            "parent_fqn": {
+                "type": "string",
+                "description": "Fully qualified name of the parent term, for nested terms",
+            },
         },
         "required": ["name", "display_name", "description", "glossary_fqn"]
     },
@@ -234,122 +428,701 @@ UPDATE_GLOSSARY_TERM_TOOL = Tool(
     },
 )
 
+EXPORT_GLOSSARY_TERMS_TOOL = Tool(
+    name="export_glossary_terms",
+    description=(
+        "Export every term of a glossary (or of all glossaries) by following pagination cursors. "
+        "Results are returned as several text chunks of JSON Lines, one term per line. An export larger than "
+        'the server\'s size budget ends with a chunk holding {"paging": {"after": ..., "truncated": true}}; '
+        "pass that cursor as `after` to continue."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "glossary_fqn": {
+                "type": "string",
+                "description": "Fully qualified name of the glossary to export terms from.",
+            },
+            "fields": {
+                "type": "string",
+                "description": "Fields to include in each exported term",
+                "example": "children,relatedTerms,reviewers,owners,tags,usageCount,domain,extension,childrenCount",
+            },
+            "include": {
+                "type": "string",
+                "description": "Include all, deleted, or non-deleted entities.",
+                "default": "non-deleted",
+                "enum": ["all", "deleted", "non-deleted"],
+            },
+            "chunk_size": {"type": "integer", "description": "Number of terms per returned chunk", "default": 500},
+            "after": {"type": "string", "description": "Continue a truncated export from its paging.after cursor"},
+            "projection": PROJECTION_PROPERTY,
+        },
+    },
+)
+
+
+BULK_CREATE_GLOSSARY_TERMS_TOOL = Tool(
+    name="bulk_create_glossary_terms",
+    description=(
+        "Create many glossary terms in one call. Parent terms are created before their children and "
+        "requests run concurrently. Returns a per-term success/failure report."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "terms": {
+                "type": "array",
+                "description": "Glossary terms to create",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Name of the glossary term"},
+                        "display_name": {"type": "string", "description": "Display name of the glossary term"},
+                        "description": {"type": "string", "description": "Description of the glossary term"},
+                        "glossary_fqn": {"type": "string", "description": "Fully qualified name of the glossary"},
+                        "parent_fqn": {
+                            "type": "string",
+                            "description": (
+                                "Fully qualified name of the parent term; may be a term created in the same call"
+                            ),
+                        },
+                    },
+                    "required": ["name", "description", "glossary_fqn"],
+                },
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "description": "Maximum number of create requests in flight at once",
+                "default": 8,
+            },
+        },
+        "required": ["terms"],
+    },
+)
+
+
+BULK_UPDATE_GLOSSARY_TERMS_TOOL = Tool(
+    name="bulk_update_glossary_terms",
+    description=(
+        "Apply the same JSON Patch to many glossary terms in one call. Terms are selected by ID, by FQN "
+        "and/or by glossary; updates run concurrently and are retried on 429/5xx. Returns a summary report."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "patch_template": {
+                "type": "array",
+                "description": (
+                    "JSON Patch operations applied to every selected term. $id, $fqn and $name in string values "
+                    'are replaced with the term\'s values. Example: [{"op": "add", "path": "/tags/0", '
+                    '"value": {"tagFQN": "PII.Sensitive", "source": "Classification"}}]'
+                ),
+                "items": {"type": "object"},
+            },
+            "term_ids": {"type": "array", "description": "UUIDs of the terms to update", "items": {"type": "string"}},
+            "term_fqns": {
+                "type": "array",
+                "description": "Fully qualified names of the terms to update",
+                "items": {"type": "string"},
+            },
+            "glossary_fqn": {"type": "string", "description": "Update every term of this glossary"},
+            "max_concurrency": {
+                "type": "integer",
+                "description": "Maximum number of PATCH requests in flight at once",
+                "default": 8,
+            },
+            "max_retries": {"type": "integer", "description": "Retries per term on 429 or 5xx responses", "default": 3},
+        },
+        "required": ["patch_template"],
+    },
+)
+
+
+SEARCH_GLOSSARY_TERMS_TOOL = Tool(
+    name="search_glossary_terms",
+    description=(
+        "Full-text search over glossary term names, display names, synonyms and descriptions. "
+        "Results are ranked with BM25 and support prefix and typo-tolerant matching."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Free-text search query"},
+            "glossary_fqn": {"type": "string", "description": "Only return terms of this glossary"},
+            "limit": {"type": "integer", "description": "Maximum number of results to return", "default": 10},
+            "prefix": {
+                "type": "boolean",
+                "description": "Match query words as prefixes of indexed words",
+                "default": True,
+            },
+            "fuzzy": {"type": "boolean", "description": "Match query words with small typos", "default": True},
+            "projection": PROJECTION_PROPERTY,
+            "select": SELECT_PROPERTY,
+        },
+        "required": ["query"],
+    },
+)
+
+GET_GLOSSARY_TREE_TOOL = Tool(
+    name="get_glossary_tree",
+    description=(
+        "Get the parent/child hierarchy of a glossary's terms as a nested structure. All terms are fetched "
+        "in a few bulk requests; use root_fqn for a subtree and max_depth to limit how deep it goes."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "glossary_fqn": {"type": "string", "description": "Fully qualified name of the glossary"},
+            "root_fqn": {"type": "string", "description": "Fully qualified name of the term whose subtree to return"},
+            "max_depth": {
+                "type": "integer",
+                "description": (
+                    "Levels of terms below the root (or glossary) to include; deeper nodes report childrenCount"
+                ),
+            },
+            "fields": {
+                "type": "string",
+                "description": "Extra fields to include on every node",
+                "example": "description,synonyms,tags",
+            },
+            "include": {
+                "type": "string",
+                "description": "Include all, deleted, or non-deleted entities.",
+                "default": "non-deleted",
+                "enum": ["all", "deleted", "non-deleted"],
+            },
+            "select": SELECT_PROPERTY,
+        },
+        "required": ["glossary_fqn"],
+    },
+)
+
+TRAVERSE_GLOSSARY_GRAPH_TOOL = Tool(
+    name="traverse_glossary_graph",
+    description=(
+        "Explore how glossary terms connect through related terms, parent/child links and synonyms. "
+        "Returns every term within max_hops of the start term, or the shortest path to target_fqn when given."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "start_fqn": {"type": "string", "description": "Fully qualified name of the term to start from"},
+            "target_fqn": {
+                "type": "string",
+                "description": "Fully qualified name of a term to find the shortest path to",
+            },
+            "max_hops": {
+                "type": "integer",
+                "description": "Maximum number of links to follow (default: 2, or 6 when looking for a path)",
+            },
+            "relations": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(RELATIONS)},
+                "description": "Link types to follow (default: all)",
+            },
+            "limit": {"type": "integer", "description": "Maximum number of terms to return", "default": 100},
+            "select": SELECT_PROPERTY,
+        },
+        "required": ["start_fqn"],
+    },
+)
+
+GET_SERVER_METRICS_TOOL = Tool(
+    name="get_server_metrics",
+    description=(
+        "Debugging aid: report this server's tool call counts and latencies, OpenMetadata request "
+        "status codes, latencies and payload sizes, cache hit rates and connection pool usage."
+    ),
+    inputSchema={"type": "object", "properties": {}},
+)
+
+
+def _table_projection(arguments: Dict[str, Any], default: str) -> str:
+    """Return the requested projection, or ``default`` extended with the top-level ``fields`` asked for."""
+    projection = arguments.get("projection")
+    if projection:
+        return projection
+    fields = [field.strip() for field in (arguments.get("fields") or "").split(",") if field.strip()]
+    return ",".join([default, *fields])
+
+
+def _table_fields(arguments: Dict[str, Any], projection: str) -> Optional[str]:
+    """Return the requested ``fields``, or the ones ``projection`` keeps (None for whole entities)."""
+    if arguments.get("fields"):
+        return arguments["fields"]
+    kept = {path.strip().split(".")[0] for path in projection.split(",")}
+    if "*" in kept:
+        return None
+    return ",".join(field for field in TABLE_FIELDS if field in kept) or None
+
+
+# Concurrency classes: requests to OpenMetadata that read, write or walk many entities, and tools
+# answered from in-memory indexes without a request
+READ = "read"
+WRITE = "write"
+BULK = "bulk"
+LOCAL = "local"
+
+ToolHandler = Callable[[Dict[str, Any], AsyncOpenMetadataClient], Awaitable[List[TextContent]]]
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A tool's schema and handler, with the traits that per-tool policies key on.
+
+    Attributes:
+        tool: MCP tool definition (name, description and input schema)
+        handler: Coroutine answering a call with the tool's arguments and the OpenMetadata client
+        cacheable: Whether results depend only on the arguments and OpenMetadata's state (no side effects),
+            so identical calls in flight at once share one run
+        concurrency: One of READ, WRITE, BULK or LOCAL
+    """
+
+    tool: Tool
+    handler: ToolHandler
+    cacheable: bool = False
+    concurrency: str = READ
+
+
+# Tool name -> spec, in the order the tools are listed
+TOOL_REGISTRY: Dict[str, ToolSpec] = {}
+
+# Listed on every list_tools request, so built once as tools are registered
+_TOOL_LIST: List[Tool] = []
+
+# (tool name, client id, encoded arguments) -> run of a cacheable tool call in flight
+_SHARED_CALLS: Dict[Tuple[str, int, str], "asyncio.Future[List[TextContent]]"] = {}
+
+
+def register(tool: Tool, cacheable: bool = False, concurrency: str = READ) -> Callable[[ToolHandler], ToolHandler]:
+    """Register the decorated coroutine as the handler of ``tool``."""
+
+    def decorator(handler: ToolHandler) -> ToolHandler:
+        if tool.name in TOOL_REGISTRY:
+            raise ValueError(f"Tool {tool.name} is already registered")
+        TOOL_REGISTRY[tool.name] = ToolSpec(tool, handler, cacheable=cacheable, concurrency=concurrency)
+        _TOOL_LIST.append(tool)
+        return handler
+
+    return decorator
+
+
 def list_all_tools() -> List[Tool]:
-    return [
-        LIST_TABLES_TOOL,
-        GET_TABLE_TOOL,
-        GET_TABLE_BY_NAME_TOOL,
-        CREATE_TABLE_TOOL,
-        UPDATE_TABLE_TOOL,
-        DELETE_TABLE_TOOL,
-        LIST_GLOSSARIES_TOOL,
-        GET_GLOSSARY_BY_NAME_TOOL,
-        LIST_GLOSSARY_TERMS_TOOL,
-        GET_GLOSSARY_TERM_BY_NAME_TOOL,
-        CREATE_GLOSSARY_TERM_TOOL,
-        UPDATE_GLOSSARY_TERM_TOOL,
-        DELETE_GLOSSARY_TERM_TOOL,
-    ]
-
-
-def call_tool(name: str, arguments: Dict[str, Any], client: OpenMetadataClient) -> List[TextContent]:
-    if name == LIST_TABLES_TOOL.name:
-        limit = arguments.get("limit", 10)
-        offset = arguments.get("offset", 0)
-        results = client.list_tables(limit=limit, offset=offset)
-        return [TextContent(type="text", text=str(results))]
-    elif name == GET_TABLE_TOOL.name:
-        table_id = arguments["table_id"]
-        fields = arguments.get("fields")
-        results = client.get_table(table_id=table_id, fields=fields)
-        return [TextContent(type="text", text=str(results))]
-    elif name == GET_TABLE_BY_NAME_TOOL.name:
-        fqn = arguments["fqn"]
-        fields = arguments.get("fields")
-        results = client.get_table_by_name(fqn=fqn, fields=fields)
-        return [TextContent(type="text", text=str(results))]
-    elif name == CREATE_TABLE_TOOL.name:
-        table_data = arguments["table_data"]
-        results = client.create_table(table_data=table_data)
-        return [TextContent(type="text", text=str(results))]
-    elif name == UPDATE_TABLE_TOOL.name:
-        table_id = arguments["table_id"]
-        table_data = arguments["table_data"]
-        results = client.update_table(table_id=table_id, table_data=table_data)
-        return [TextContent(type="text", text=str(results))]
-    elif name == DELETE_TABLE_TOOL.name:
-        table_id = arguments["table_id"]
-        hard_delete = arguments.get("hard_delete", False)
-        recursive = arguments.get("recursive", False)
-        client.delete_table(table_id=table_id, hard_delete=hard_delete, recursive=recursive)
-        return [TextContent(type="text", text=f"Table {table_id} deleted successfully")]
-    elif name == LIST_GLOSSARIES_TOOL.name:
-        limit = arguments.get("limit", 10)
-        fields = arguments.get("fields")
-        before = arguments.get("before")
-        after = arguments.get("after")
-        include = arguments.get("include", "non-deleted")
-        results = client.list_glossaries(limit=limit, fields=fields, before=before, after=after, include=include)
-        return [TextContent(type="text", text=str(results))]
-    elif name == GET_GLOSSARY_BY_NAME_TOOL.name:
-        fqn = arguments["fqn"]
-        fields = arguments.get("fields")
-        include = arguments.get("include", "non-deleted")
-        results = client.get_glossary_by_name(fqn=fqn, fields=fields, include=include)
-        return [TextContent(type="text", text=str(results))]
-    elif name == LIST_GLOSSARY_TERMS_TOOL.name:
-        glossary_fqn = arguments.get("glossary_fqn")
-        limit = arguments.get("limit", 10)
-        fields = arguments.get("fields")
-        before = arguments.get("before")
-        after = arguments.get("after")
-        include = arguments.get("include", "non-deleted")
-
-        glossary_id_to_use = None
-        if glossary_fqn:
-            try:
-                # Get the glossary ID using the FQN
-                glossary_details = client.get_glossary_by_name(fqn=glossary_fqn, fields="id")
-                glossary_id_to_use = glossary_details.get("id")
-                if not glossary_id_to_use:
-                    return [TextContent(type="text", text=f"Error: Could not find ID for glossary FQN '{glossary_fqn}'.")]
-            except Exception as e:
-                # Handle cases where glossary lookup fails (e.g., not found, API error)
-                return [TextContent(type="text", text=f"Error looking up glossary '{glossary_fqn}': {e}")]
-
-        # Call list_glossary_terms with the resolved ID (or None if no FQN provided)
-        results = client.list_glossary_terms(
-            glossary_id=glossary_id_to_use, limit=limit, fields=fields, before=before, after=after, include=include
+    return _TOOL_LIST
+
+
+async def call_tool(name: str, arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    spec = TOOL_REGISTRY.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown tool: {name}")
+    if not spec.cacheable:
+        return await spec.handler(arguments, client)
+
+    # Identical concurrent calls share one run; a caller giving up does not cancel it for the others
+    key = (name, id(client), json.dumps(arguments, sort_keys=True, default=str))
+    shared = _SHARED_CALLS.get(key)
+    if shared is None:
+        shared = asyncio.ensure_future(spec.handler(arguments, client))
+        _SHARED_CALLS[key] = shared
+        shared.add_done_callback(lambda _: _SHARED_CALLS.pop(key, None))
+    return await asyncio.shield(shared)
+
+
+@register(LIST_TABLES_TOOL, cacheable=True, concurrency=READ)
+async def _list_tables(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    limit = arguments.get("limit", 10)
+    offset = arguments.get("offset", 0)
+    projection = _table_projection(arguments, DEFAULT_TABLE_LIST_PROJECTION)
+    fields = _table_fields(arguments, projection)
+    database = arguments.get("database")
+    include_deleted = arguments.get("include_deleted", False)
+
+    async def fetch(page_offset: int, page_size: int) -> AsyncPageStream:
+        return await client.list_tables(
+            limit=page_size,
+            offset=page_offset,
+            fields=fields,
+            database=database,
+            include_deleted=include_deleted,
+            stream=True,
+        )
+
+    return await collect_pages(
+        fetch,
+        next_offset,
+        offset_continuation,
+        cursor=offset,
+        limit=limit,
+        page_size=client.max_page_size,
+        max_bytes=client.max_response_bytes,
+        projection=projection,
+        selector=arguments.get("select"),
+    )
+
+
+@register(GET_TABLE_TOOL, cacheable=True, concurrency=READ)
+async def _get_table(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    table_id = arguments["table_id"]
+    projection = _table_projection(arguments, DEFAULT_TABLE_PROJECTION)
+    results = await client.get_table(table_id=table_id, fields=_table_fields(arguments, projection))
+    return to_text_content(results, projection, arguments.get("select"))
+
+
+@register(GET_TABLE_BY_NAME_TOOL, cacheable=True, concurrency=READ)
+async def _get_table_by_name(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    fqn = arguments["fqn"]
+    projection = _table_projection(arguments, DEFAULT_TABLE_PROJECTION)
+    results = await client.get_table_by_name(fqn=fqn, fields=_table_fields(arguments, projection))
+    return to_text_content(results, projection, arguments.get("select"))
+
+
+@register(GET_TABLES_BATCH_TOOL, cacheable=True, concurrency=READ)
+async def _get_tables_batch(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    ids = arguments.get("ids")
+    fqns = arguments.get("fqns")
+    max_concurrency = arguments.get("max_concurrency", 8)
+    if not (ids or fqns):
+        return [TextContent(type="text", text="Error: provide ids or fqns.")]
+    projection = _table_projection(arguments, DEFAULT_TABLE_PROJECTION)
+    fields = _table_fields(arguments, projection)
+    results = await client.get_tables_batch(ids=ids, fqns=fqns, fields=fields, max_concurrency=max_concurrency)
+    return to_text_content(results, projection, arguments.get("select"))
+
+
+@register(CREATE_TABLE_TOOL, concurrency=WRITE)
+async def _create_table(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    table_data = arguments["table_data"]
+    results = await client.create_table(table_data=table_data)
+    return to_text_content(results)
+
+
+@register(UPDATE_TABLE_TOOL, concurrency=WRITE)
+async def _update_table(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    table_id = arguments["table_id"]
+    table_data = arguments["table_data"]
+    results = await client.update_table(table_id=table_id, table_data=table_data)
+    return to_text_content(results)
+
+
+@register(DELETE_TABLE_TOOL, concurrency=WRITE)
+async def _delete_table(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    table_id = arguments["table_id"]
+    hard_delete = arguments.get("hard_delete", False)
+    recursive = arguments.get("recursive", False)
+    await client.delete_table(table_id=table_id, hard_delete=hard_delete, recursive=recursive)
+    return [TextContent(type="text", text=f"Table {table_id} deleted successfully")]
+
+
+@register(LIST_GLOSSARIES_TOOL, cacheable=True, concurrency=READ)
+async def _list_glossaries(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    limit = arguments.get("limit", 10)
+    fields = arguments.get("fields")
+    before = arguments.get("before")
+    after = arguments.get("after")
+    include = arguments.get("include", "non-deleted")
+
+    async def fetch(cursor: Optional[str], page_size: int) -> AsyncPageStream:
+        return await client.list_glossaries(limit=page_size, fields=fields, after=cursor, include=include, stream=True)
+
+    async def fetch_before(cursor: str, page_size: int) -> AsyncPageStream:
+        return await client.list_glossaries(limit=page_size, fields=fields, before=cursor, include=include, stream=True)
+
+    if before:
+        return await collect_page_before(
+            fetch_before,
+            before,
+            limit=limit,
+            page_size=client.max_page_size,
+            max_bytes=client.max_response_bytes,
+            projection=arguments.get("projection"),
+            selector=arguments.get("select"),
+        )
+
+    after, skip = decode_continuation(after)
+    return await collect_pages(
+        fetch,
+        next_after,
+        after_continuation,
+        cursor=after,
+        limit=limit,
+        page_size=client.max_page_size,
+        max_bytes=client.max_response_bytes,
+        skip=skip,
+        projection=arguments.get("projection"),
+        selector=arguments.get("select"),
+    )
+
+
+@register(GET_GLOSSARY_BY_NAME_TOOL, cacheable=True, concurrency=READ)
+async def _get_glossary_by_name(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    fqn = arguments["fqn"]
+    fields = arguments.get("fields")
+    include = arguments.get("include", "non-deleted")
+    results = await client.get_glossary_by_name(fqn=fqn, fields=fields, include=include)
+    return to_text_content(results, arguments.get("projection"), arguments.get("select"))
+
+
+@register(LIST_GLOSSARY_TERMS_TOOL, cacheable=True, concurrency=READ)
+async def _list_glossary_terms(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    glossary_fqn = arguments.get("glossary_fqn")
+    limit = arguments.get("limit", 10)
+    fields = arguments.get("fields")
+    before = arguments.get("before")
+    after = arguments.get("after")
+    include = arguments.get("include", "non-deleted")
+
+    glossary_id_to_use = None
+    if glossary_fqn:
+        try:
+            # Resolve the glossary ID through the client's FQN index (no request on a hit)
+            glossary_id_to_use = await client.resolve_glossary_id(glossary_fqn)
+        except OpenMetadataError as e:
+            return [TextContent(type="text", text=f"Error: {e}.")]
+        except Exception as e:
+            # Handle cases where glossary lookup fails (e.g., not found, API error)
+            return [TextContent(type="text", text=f"Error looking up glossary '{glossary_fqn}': {e}")]
+
+    # Call list_glossary_terms with the resolved ID (or None if no FQN provided)
+    async def fetch(cursor: Optional[str], page_size: int) -> AsyncPageStream:
+        return await client.list_glossary_terms(
+            glossary_id=glossary_id_to_use, limit=page_size, fields=fields, after=cursor, include=include, stream=True
         )
-        return [TextContent(type="text", text=str(results))]
-    elif name == GET_GLOSSARY_TERM_BY_NAME_TOOL.name:
-        fqn = arguments["fqn"]
-        fields = arguments.get("fields")
-        include = arguments.get("include", "non-deleted")
-        results = client.get_glossary_term_by_name(fqn=fqn, fields=fields, include=include)
-        return [TextContent(type="text", text=str(results))]
-    elif name == CREATE_GLOSSARY_TERM_TOOL.name:
-        name_arg = arguments["name"]
-        display_name = arguments["display_name"]
-        description = arguments["description"]
-        glossary_fqn_arg = arguments["glossary_fqn"]
-        results = client.create_glossary_term(
-            name=name_arg,
-            display_name=display_name,
-            description=description,
-            glossary_fqn=glossary_fqn_arg,
+
+    async def fetch_before(cursor: str, page_size: int) -> AsyncPageStream:
+        return await client.list_glossary_terms(
+            glossary_id=glossary_id_to_use, limit=page_size, fields=fields, before=cursor, include=include, stream=True
         )
-        return [TextContent(type="text", text=str(results))]
-    elif name == DELETE_GLOSSARY_TERM_TOOL.name:
-        term_id = arguments["term_id"]
-        hard_delete = arguments.get("hard_delete", False)
-        recursive = arguments.get("recursive", False)
-        client.delete_glossary_term(term_id=term_id, hard_delete=hard_delete, recursive=recursive)
-        return [TextContent(type="text", text=f"Glossary term {term_id} deleted successfully.")]
-    elif name == UPDATE_GLOSSARY_TERM_TOOL.name:
-        term_id = arguments["term_id"]
-        patch_data = arguments["patch_data"]
-        results = client.update_glossary_term(term_id=term_id, patch_data=patch_data)
-        return [TextContent(type="text", text=str(results))]
-    else:
-        raise ValueError(f"Unknown tool: {name}")
+
+    if before:
+        return await collect_page_before(
+            fetch_before,
+            before,
+            limit=limit,
+            page_size=client.max_page_size,
+            max_bytes=client.max_response_bytes,
+            projection=arguments.get("projection"),
+            selector=arguments.get("select"),
+        )
+
+    after, skip = decode_continuation(after)
+    return await collect_pages(
+        fetch,
+        next_after,
+        after_continuation,
+        cursor=after,
+        limit=limit,
+        page_size=client.max_page_size,
+        max_bytes=client.max_response_bytes,
+        skip=skip,
+        projection=arguments.get("projection"),
+        selector=arguments.get("select"),
+    )
+
+
+@register(GET_GLOSSARY_TERM_BY_NAME_TOOL, cacheable=True, concurrency=READ)
+async def _get_glossary_term_by_name(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    fqn = arguments["fqn"]
+    fields = arguments.get("fields")
+    include = arguments.get("include", "non-deleted")
+    results = await client.get_glossary_term_by_name(fqn=fqn, fields=fields, include=include)
+    return to_text_content(results, arguments.get("projection"), arguments.get("select"))
+
+
+@register(GET_GLOSSARY_TERMS_BATCH_TOOL, cacheable=True, concurrency=READ)
+async def _get_glossary_terms_batch(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    ids = arguments.get("ids")
+    fqns = arguments.get("fqns")
+    fields = arguments.get("fields")
+    include = arguments.get("include", "non-deleted")
+    max_concurrency = arguments.get("max_concurrency", 8)
+    if not (ids or fqns):
+        return [TextContent(type="text", text="Error: provide ids or fqns.")]
+    results = await client.get_glossary_terms_batch(
+        ids=ids, fqns=fqns, fields=fields, include=include, max_concurrency=max_concurrency
+    )
+    return to_text_content(results, arguments.get("projection"), arguments.get("select"))
+
+
+@register(CREATE_GLOSSARY_TERM_TOOL, concurrency=WRITE)
+async def _create_glossary_term(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    name_arg = arguments["name"]
+    display_name = arguments["display_name"]
+    description = arguments["description"]
+    glossary_fqn_arg = arguments["glossary_fqn"]
+    parent_fqn = arguments.get("parent_fqn")
+    results = await client.create_glossary_term(
+        name=name_arg,
+        display_name=display_name,
+        description=description,
+        glossary_fqn=glossary_fqn_arg,
+        parent_fqn=parent_fqn,
+    )
+    return to_text_content(results)
+
+
+@register(UPDATE_GLOSSARY_TERM_TOOL, concurrency=WRITE)
+async def _update_glossary_term(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    term_id = arguments["term_id"]
+    patch_data = arguments["patch_data"]
+    results = await client.update_glossary_term(term_id=term_id, patch_data=patch_data)
+    return to_text_content(results)
+
+
+@register(DELETE_GLOSSARY_TERM_TOOL, concurrency=WRITE)
+async def _delete_glossary_term(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    term_id = arguments["term_id"]
+    hard_delete = arguments.get("hard_delete", False)
+    recursive = arguments.get("recursive", False)
+    await client.delete_glossary_term(term_id=term_id, hard_delete=hard_delete, recursive=recursive)
+    return [TextContent(type="text", text=f"Glossary term {term_id} deleted successfully.")]
+
+
+@register(EXPORT_GLOSSARY_TERMS_TOOL, concurrency=BULK)
+async def _export_glossary_terms(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    glossary_fqn = arguments.get("glossary_fqn")
+    fields = arguments.get("fields")
+    include = arguments.get("include", "non-deleted")
+    chunk_size = max(1, arguments.get("chunk_size", 500))
+
+    glossary_id_to_use = None
+    if glossary_fqn:
+        try:
+            glossary_id_to_use = await client.resolve_glossary_id(glossary_fqn)
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error looking up glossary '{glossary_fqn}': {e}")]
+
+    async def fetch(cursor: Optional[str], page_size: int) -> AsyncPageStream:
+        return await client.list_glossary_terms(
+            glossary_id=glossary_id_to_use, limit=page_size, fields=fields, after=cursor, include=include, stream=True
+        )
+
+    # Terms are encoded as each page is decoded, and the export stops at the response byte budget
+    after, skip = decode_continuation(arguments.get("after"))
+    result = BoundedResult(None, client.max_response_bytes, arguments.get("projection"))
+    paging = await fill_result(
+        result, fetch, next_after, after_continuation, after, min(chunk_size, client.max_page_size), skip
+    )
+    lines = result.encoded
+    chunks = [
+        TextContent(type="text", text="\n".join(lines[start : start + chunk_size]))
+        for start in range(0, len(lines), chunk_size)
+    ] or [TextContent(type="text", text="")]
+    if paging.get("truncated"):
+        chunks.append(TextContent(type="text", text=dumps({"paging": paging})))
+    return chunks
+
+
+@register(BULK_CREATE_GLOSSARY_TERMS_TOOL, concurrency=BULK)
+async def _bulk_create_glossary_terms(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    terms = arguments["terms"]
+    max_concurrency = arguments.get("max_concurrency", 8)
+    results = await client.bulk_create_glossary_terms(terms=terms, max_concurrency=max_concurrency)
+    return to_text_content(results)
+
+
+@register(BULK_UPDATE_GLOSSARY_TERMS_TOOL, concurrency=BULK)
+async def _bulk_update_glossary_terms(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    patch_template = arguments["patch_template"]
+    term_ids = arguments.get("term_ids")
+    term_fqns = arguments.get("term_fqns")
+    glossary_fqn = arguments.get("glossary_fqn")
+    max_concurrency = arguments.get("max_concurrency", 8)
+    max_retries = arguments.get("max_retries", 3)
+    if not (term_ids or term_fqns or glossary_fqn):
+        return [TextContent(type="text", text="Error: provide term_ids, term_fqns or glossary_fqn.")]
+
+    glossary_id_to_use = None
+    if glossary_fqn:
+        try:
+            glossary_id_to_use = await client.resolve_glossary_id(glossary_fqn)
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error looking up glossary '{glossary_fqn}': {e}")]
+
+    results = await client.bulk_update_glossary_terms(
+        patch_template=patch_template,
+        term_ids=term_ids,
+        term_fqns=term_fqns,
+        glossary_id=glossary_id_to_use,
+        max_concurrency=max_concurrency,
+        max_retries=max_retries,
+    )
+    return to_text_content(results)
+
+
+@register(SEARCH_GLOSSARY_TERMS_TOOL, cacheable=True, concurrency=LOCAL)
+async def _search_glossary_terms(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    query = arguments["query"]
+    glossary_fqn = arguments.get("glossary_fqn")
+    limit = arguments.get("limit", 10)
+    prefix = arguments.get("prefix", True)
+    fuzzy = arguments.get("fuzzy", True)
+
+    # The first search builds the index (unless the snapshot seeds it); later ones answer immediately
+    # and refresh in the background
+    await client.load_snapshot()
+    if not client.search_index.is_built:
+        await client.refresh_search_index()
+    elif client.search_index.is_stale:
+        client.schedule_search_index_refresh()
+
+    results = client.search_index.search(query, limit=limit, glossary_fqn=glossary_fqn, prefix=prefix, fuzzy=fuzzy)
+    result = {"data": results, "total": len(results)}
+    return to_text_content(result, arguments.get("projection"), arguments.get("select"))
+
+
+@register(GET_GLOSSARY_TREE_TOOL, cacheable=True, concurrency=READ)
+async def _get_glossary_tree(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    glossary_fqn = arguments["glossary_fqn"]
+    root_fqn = arguments.get("root_fqn")
+    max_depth = arguments.get("max_depth")
+    fields = arguments.get("fields")
+    include = arguments.get("include", "non-deleted")
+    node_fields = tuple(field.strip() for field in fields.split(",") if field.strip()) if fields else ()
+    try:
+        results = await client.get_glossary_tree(
+            glossary_fqn, root_fqn=root_fqn, max_depth=max_depth, node_fields=node_fields, include=include
+        )
+    except OpenMetadataError as e:
+        return [TextContent(type="text", text=f"Error: {e}.")]
+    return to_text_content(results, selector=arguments.get("select"))
+
+
+@register(TRAVERSE_GLOSSARY_GRAPH_TOOL, cacheable=True, concurrency=LOCAL)
+async def _traverse_glossary_graph(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    start_fqn = arguments["start_fqn"]
+    target_fqn = arguments.get("target_fqn")
+    max_hops = arguments.get("max_hops", 6 if target_fqn else 2)
+    relations = arguments.get("relations") or RELATIONS
+    limit = arguments.get("limit", 100)
+
+    # The first traversal builds the graph; later ones answer immediately and refresh in the background
+    graph = client.glossary_graph
+    if not graph.is_built:
+        await client.refresh_glossary_graph()
+    elif graph.is_stale:
+        client.schedule_glossary_graph_refresh()
+
+    start_id = graph.get_id(start_fqn)
+    if start_id is None:
+        return [TextContent(type="text", text=f"Error: Glossary term '{start_fqn}' not found.")]
+    if target_fqn is None:
+        results = graph.traverse(start_id, max_hops=max_hops, relations=relations, limit=limit)
+        return to_text_content(
+            {"start": start_fqn, "data": results, "total": len(results)}, selector=arguments.get("select")
+        )
+
+    target_id = graph.get_id(target_fqn)
+    if target_id is None:
+        return [TextContent(type="text", text=f"Error: Glossary term '{target_fqn}' not found.")]
+    path = graph.shortest_path(start_id, target_id, max_hops=max_hops, relations=relations)
+    if path is None:
+        message = f"No path within {max_hops} hops from '{start_fqn}' to '{target_fqn}'."
+        return [TextContent(type="text", text=message)]
+    result = {"start": start_fqn, "target": target_fqn, "path": path, "hops": len(path) - 1}
+    return to_text_content(result, selector=arguments.get("select"))
+
+
+@register(GET_SERVER_METRICS_TOOL, concurrency=LOCAL)
+async def _get_server_metrics(arguments: Dict[str, Any], client: AsyncOpenMetadataClient) -> List[TextContent]:
+    return to_text_content(client.metrics.snapshot())
@@ -0,0 +1,246 @@
+from bisect import bisect_left
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Upper bounds of the latency histogram buckets, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Upper bounds of the payload size histogram buckets, in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# (name, type, help, [(labels, value)]) as produced by a collector at scrape time
+Sample = Tuple[str, str, str, List[Tuple[Dict[str, Any], float]]]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    rendered = ",".join(
+        '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return f"{{{rendered}}}" if rendered else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _with_label(sample: str, label: str, value: str) -> str:
+    name, _, rest = sample.rpartition(" ")
+    extra = _format_labels([(label, value)])[1:-1]
+    if name.endswith("}"):
+        return f"{name[:-1]},{extra}}} {rest}"
+    return f"{name}{{{extra}}} {rest}"
+
+
+def merge_expositions(expositions: List[Optional[str]], label: str) -> str:
+    """Merge text expositions from several processes, tagging each sample with ``label`` set to its index.
+
+    Metric families keep a single HELP/TYPE header and list the samples of every process together.
+    Missing expositions (e.g. from a process that could not be scraped) are skipped.
+    """
+    headers: Dict[str, List[str]] = {}
+    samples: Dict[str, List[str]] = {}
+    for index, exposition in enumerate(expositions):
+        family = ""
+        for line in (exposition or "").splitlines():
+            if line.startswith("# "):
+                family = line.split()[2]
+                headers.setdefault(family, [])
+                if len(headers[family]) < 2 and line not in headers[family]:
+                    headers[family].append(line)
+            elif line.strip():
+                samples.setdefault(family, []).append(_with_label(line, label, str(index)))
+    lines = []
+    for family, family_headers in headers.items():
+        lines.extend(family_headers)
+        lines.extend(samples.get(family, ()))
+    return "\n".join(lines) + "\n"
+
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(_labels(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in values]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{**dict(labels), "value": value} for labels, value in sorted(self._values.items())]
+
+
+class Histogram:
+    """Cumulative bucketed distribution per label set, with its sum and count."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts (the last one is +Inf), then the sum
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, list(values)) for labels, values in self._series.items())
+        lines = []
+        for labels, values in series:
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), values[:-1]):
+                cumulative += count
+                bucket_labels = (*labels, ("le", bound if isinstance(bound, str) else _format_value(bound)))
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(values[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+        return lines
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Summarize every series as count, sum, mean and bucket-interpolated p50/p99."""
+        with self._lock:
+            series = sorted((labels, list(values)) for labels, values in self._series.items())
+        summaries = []
+        for labels, values in series:
+            count = sum(values[:-1])
+            summaries.append(
+                {
+                    **dict(labels),
+                    "count": int(count),
+                    "sum": round(values[-1], 6),
+                    "mean": round(values[-1] / count, 6) if count else 0.0,
+                    "p50": self._quantile(values, 0.5),
+                    "p99": self._quantile(values, 0.99),
+                }
+            )
+        return summaries
+
+    def _quantile(self, values: List[float], quantile: float) -> Optional[float]:
+        count = sum(values[:-1])
+        if not count:
+            return None
+        rank = quantile * count
+        cumulative = 0.0
+        for index, bucket_count in enumerate(values[:-1]):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index >= len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return round(lower + (self.buckets[index] - lower) * (rank - cumulative) / bucket_count, 6)
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+
+class Metrics:
+    """Registry of the server's tool and upstream request metrics.
+
+    Values owned by other components (cache hit counts, connection pool usage) are read at scrape
+    time through collectors instead of being copied on every change.
+    """
+
+    def __init__(self):
+        self.tool_calls = Counter("mcp_tool_calls_total", "MCP tool calls by tool and outcome")
+        self.tool_duration = Histogram(
+            "mcp_tool_duration_seconds", "MCP tool call latency in seconds", DURATION_BUCKETS
+        )
+        self.tool_response_bytes = Histogram(
+            "mcp_tool_response_bytes", "Size of MCP tool results in bytes", SIZE_BUCKETS
+        )
+        self.upstream_requests = Counter(
+            "openmetadata_requests_total", "OpenMetadata API requests by method, endpoint and status code"
+        )
+        self.upstream_duration = Histogram(
+            "openmetadata_request_duration_seconds", "OpenMetadata API request latency in seconds", DURATION_BUCKETS
+        )
+        self.upstream_response_bytes = Histogram(
+            "openmetadata_response_bytes", "Size of OpenMetadata API response bodies in bytes", SIZE_BUCKETS
+        )
+        self._metrics = [
+            self.tool_calls,
+            self.tool_duration,
+            self.tool_response_bytes,
+            self.upstream_requests,
+            self.upstream_duration,
+            self.upstream_response_bytes,
+        ]
+        self._collectors: List[Callable[[], List[Sample]]] = []
+
+    def add_collector(self, collector: Callable[[], List[Sample]]) -> None:
+        self._collectors.append(collector)
+
+    def observe_tool(self, tool: str, status: str, duration: float, response_bytes: int) -> None:
+        self.tool_calls.inc(tool=tool, status=status)
+        self.tool_duration.observe(duration, tool=tool)
+        self.tool_response_bytes.observe(response_bytes, tool=tool)
+
+    def observe_upstream(
+        self, method: str, endpoint: str, status: str, duration: float, response_bytes: Optional[int] = None
+    ) -> None:
+        self.upstream_requests.inc(method=method, endpoint=endpoint, status=status)
+        self.upstream_duration.observe(duration, method=method, endpoint=endpoint)
+        if response_bytes is not None:
+            self.upstream_response_bytes.observe(response_bytes, endpoint=endpoint)
+
+    def _collect(self) -> List[Sample]:
+        samples: List[Sample] = []
+        for collector in self._collectors:
+            samples.extend(collector())
+        return samples
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render())
+        for name, metric_type, help, values in self._collect():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in values:
+                lines.append(f"{name}{_format_labels(_labels(labels))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize every metric as JSON-friendly data, with histograms reduced to count/mean/p50/p99."""
+        result: Dict[str, Any] = {metric.name: metric.snapshot() for metric in self._metrics}
+        for name, _, _, values in self._collect():
+            if len(values) == 1 and not values[0][0]:
+                result[name] = values[0][1]
+            else:
+                result[name] = [{**labels, "value": value} for labels, value in values]
+        return result
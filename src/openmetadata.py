@@ -1,11 +1,63 @@
-from typing import Any, Dict, Optional, List
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, List, Set, Tuple, Union
 
+import asyncio
 import httpx
-import json
+import importlib.util
 import logging
+import random
+import re
+import threading
+import time
+
+from src.cache import TTLCache
+from src.fqn_index import GLOSSARY, GLOSSARY_TERM, INDEXED_ENDPOINTS, FqnIndex
+from src.glossary_tree import api_fields, build_glossary_tree
+from src.graph import GlossaryGraph
+from src.json_stream import ListResponseParser
+from src.metrics import Metrics, Sample
+from src.resilience import CircuitBreaker, RetryPolicy
+from src.search import GlossarySearchIndex
+from src.shared_cache import SharedCache
+from src.snapshot import GlossarySnapshot, SnapshotRevalidation
 
 logger = logging.getLogger(__name__)
 
+# Term writes change parent terms' children and the glossary's termCount as well
+GLOSSARY_TERM_ENDPOINTS = ("glossaryTerms", "glossaries")
+
+# Page size used when walking every glossary to warm the FQN index
+INDEX_WARM_PAGE_SIZE = 1000
+
+# Default page size of the iter_* helpers
+DEFAULT_ITER_PAGE_SIZE = 100
+
+# Default cap on the number of entities requested from OpenMetadata in one list request
+DEFAULT_MAX_PAGE_SIZE = 1000
+
+# Default byte budget of a tool result assembled from several list pages
+DEFAULT_MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Default number of in-flight requests for bulk operations
+DEFAULT_BULK_CONCURRENCY = 8
+
+# Default number of retries of a bulk item on a 429/5xx response
+DEFAULT_BULK_RETRIES = 3
+BULK_RETRY_BASE_DELAY = 0.5
+
+# Placeholders of a bulk patch template; any other "$" is left as is
+PATCH_PLACEHOLDER = re.compile(r"\$(id|fqn|name)\b")
+
+# (endpoint, path including the id/fqn, sorted query params) identifying a cacheable lookup
+CacheKey = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+
+# Fetches one list page for a cursor (None for the first page); async clients return an awaitable
+PageFetcher = Callable[[Any], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+# Computes the cursor of the page following ``page`` (fetched with ``cursor``), or None at the end
+NextCursor = Callable[[Any, Dict[str, Any]], Any]
+
 
 class OpenMetadataError(Exception):
     """Base exception for OpenMetadata client errors."""
@@ -13,11 +65,119 @@ class OpenMetadataError(Exception):
     pass
 
 
-class OpenMetadataClient:
-    """Client for interacting with OpenMetadata API."""
+class CircuitOpenError(OpenMetadataError):
+    """Raised without contacting OpenMetadata while the circuit breaker is open."""
+
+    pass
+
+
+class _PageStreamBase:
+    """Entities of one list response, decoded as its body is read.
+
+    Iterating yields the entities of ``data`` one at a time (recording each in the client's indexes),
+    so the whole page is never held at once; ``paging`` is filled in once the body has been read to
+    the end. Exhausting or closing the stream releases its connection.
+    """
 
     def __init__(
-        self, host: str, api_token: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None
+        self,
+        client: "_BaseOpenMetadataClient",
+        path: str,
+        response: httpx.Response,
+        started_at: float,
+        in_flight: ExitStack,
+    ):
+        self.paging: Dict[str, Any] = {}
+        self._client = client
+        self._path = path
+        self._response = response
+        self._started_at = started_at
+        self._in_flight = in_flight
+        self._parser = ListResponseParser()
+        self._closed = False
+
+    def _decode(self, chunk: bytes, final: bool = False) -> List[Any]:
+        entities = self._parser.feed(chunk, final)
+        for entity in entities:
+            self._client._index_response(self._path, entity)
+        if final:
+            self.paging = self._parser.envelope.get("paging") or {}
+        return entities
+
+    def _release(self) -> None:
+        self._closed = True
+        self._in_flight.close()
+        self._client._observe_upstream(
+            "GET", self._path, self._started_at, self._response, response_bytes=self._parser.bytes_received
+        )
+
+
+class PageStream(_PageStreamBase):
+    """List response of ``OpenMetadataClient`` decoded as its body is read."""
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        try:
+            for chunk in self._response.iter_bytes():
+                yield from self._decode(chunk)
+            yield from self._decode(b"", final=True)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._response.close()
+            self._release()
+
+
+class AsyncPageStream(_PageStreamBase):
+    """List response of ``AsyncOpenMetadataClient`` decoded as its body is read."""
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            async for chunk in self._response.aiter_bytes():
+                for entity in self._decode(chunk):
+                    yield entity
+            for entity in self._decode(b"", final=True):
+                yield entity
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            await self._response.aclose()
+            self._release()
+
+
+class _BaseOpenMetadataClient(ABC):
+    """Shared endpoint surface for the sync and async OpenMetadata clients.
+
+    Every API method builds its request and hands it to ``_request``; subclasses decide
+    whether that call blocks or returns an awaitable.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        api_token: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        cache_ttl: float = 60.0,
+        cache_max_entries: int = 1024,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        snapshot_path: Optional[str] = None,
+        snapshot_refresh_interval: float = 600.0,
+        coalesce_requests: bool = True,
+        metrics: Optional[Metrics] = None,
+        cache: Optional[Union[TTLCache, SharedCache]] = None,
+        max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
     ):
         """Initialize OpenMetadata client.
 
@@ -26,12 +186,59 @@ class OpenMetadataClient:
             api_token: API token for authentication
             username: Username for basic auth
             password: Password for basic auth
+            cache_ttl: Seconds a cached entity lookup stays valid (0 disables the cache)
+            cache_max_entries: Maximum number of cached entity lookups
+            max_connections: Maximum number of concurrent connections to OpenMetadata
+            max_keepalive_connections: Maximum number of idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for response data (also used for writes and pool acquisition)
+            http2: Whether to negotiate HTTP/2 (requires the ``h2`` package)
+            retry_policy: How failed requests are retried (default: RetryPolicy())
+            circuit_breaker: Breaker that fails requests fast while OpenMetadata is down (default: CircuitBreaker())
+            snapshot_path: SQLite file holding glossaries and terms across restarts (None disables snapshots)
+            snapshot_refresh_interval: Seconds between background revalidations of the snapshot
+            coalesce_requests: Whether concurrent identical GETs share one upstream request and its parsed result
+            metrics: Registry that upstream requests are recorded in (default: a new Metrics())
+            cache: Lookup cache to use instead of a private TTLCache built from cache_ttl and cache_max_entries
+            max_page_size: Largest ``limit`` sent in one list request; larger limits are clamped to it
+            max_response_bytes: Byte budget of tool results assembled from several list pages
 
         Raises:
             OpenMetadataError: If neither API token nor username/password is provided
         """
         self.host = host.rstrip("/")
-        self.session = httpx.Client()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.http2 = http2 and self._http2_available()
+        self.session = self._create_session()
+        self.cache = cache or TTLCache(ttl=cache_ttl, max_entries=cache_max_entries)
+        self.fqn_index = FqnIndex()
+        self.search_index = GlossarySearchIndex()
+        self.glossary_graph = GlossaryGraph()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._pool_lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._saturated_requests = 0
+        self.coalesce_requests = coalesce_requests
+        self._coalesce_lock = threading.Lock()
+        self._shared_requests: Dict[Tuple[Any, ...], Any] = {}
+        self._coalesced_requests = 0
+        self.metrics = metrics or Metrics()
+        self.metrics.add_collector(self._collect_metrics)
+        self.max_page_size = max(1, max_page_size)
+        self.max_response_bytes = max_response_bytes
+        self.snapshot = GlossarySnapshot(snapshot_path) if snapshot_path else None
+        self.snapshot_refresh_interval = snapshot_refresh_interval
+        self.snapshot_revalidated_at: Optional[float] = None
+        if self.snapshot is not None:
+            self._load_snapshot()
 
         # Set up authentication
         if api_token:
@@ -42,6 +249,473 @@ class OpenMetadataClient:
         else:
             raise OpenMetadataError("Either API token or username/password must be provided")
 
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1")
+            return False
+        return True
+
+    @abstractmethod
+    def _create_session(self) -> Any: ...
+
+    @contextmanager
+    def _track_in_flight(self) -> Iterator[None]:
+        with self._pool_lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            # Requests beyond max_connections wait for a pooled connection to be released
+            saturated = self._in_flight > self.limits.max_connections
+            if saturated:
+                self._saturated_requests += 1
+        if saturated:
+            logger.debug("Connection pool saturated: %d requests in flight", self._in_flight)
+        try:
+            yield
+        finally:
+            with self._pool_lock:
+                self._in_flight -= 1
+
+    def _observe_upstream(
+        self,
+        method: str,
+        path: str,
+        started_at: float,
+        response: Optional[httpx.Response] = None,
+        response_bytes: Optional[int] = None,
+    ) -> None:
+        if response is not None and response_bytes is None:
+            response_bytes = len(response.content)
+        self.metrics.observe_upstream(
+            method,
+            path.split("/")[3],
+            str(response.status_code) if response is not None else "error",
+            time.perf_counter() - started_at,
+            response_bytes,
+        )
+
+    def _collect_metrics(self) -> List[Sample]:
+        stats = self.pool_stats()
+        return [
+            ("openmetadata_cache_hits_total", "counter", "Lookups answered from the cache", [({}, self.cache.hits)]),
+            ("openmetadata_cache_misses_total", "counter", "Lookups not found in the cache", [({}, self.cache.misses)]),
+            ("openmetadata_cache_entries", "gauge", "Entries currently cached", [({}, len(self.cache))]),
+            ("openmetadata_pool_in_flight", "gauge", "Requests currently in flight", [({}, stats["in_flight"])]),
+            ("openmetadata_pool_peak_in_flight", "gauge", "Peak requests in flight", [({}, stats["peak_in_flight"])]),
+            ("openmetadata_pool_max_connections", "gauge", "Connection pool size", [({}, stats["max_connections"])]),
+            (
+                "openmetadata_pool_saturated_requests_total",
+                "counter",
+                "Requests that waited for a free pooled connection",
+                [({}, stats["saturated_requests"])],
+            ),
+            (
+                "openmetadata_coalesced_requests_total",
+                "counter",
+                "Requests answered by an identical request already in flight",
+                [({}, stats["coalesced_requests"])],
+            ),
+            (
+                "openmetadata_circuit_open",
+                "gauge",
+                "Whether the circuit breaker is failing requests fast",
+                [({}, int(self.circuit_breaker.state != CircuitBreaker.CLOSED))],
+            ),
+        ]
+
+    def _check_circuit(self) -> None:
+        reason = self.circuit_breaker.blocked_reason()
+        if reason is not None:
+            raise CircuitOpenError(reason)
+
+    def _retry_delay(
+        self,
+        method: str,
+        path: str,
+        started_at: float,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        # Records a failed or final attempt (a response, or the transport error raised instead) and returns
+        # how long to wait before retrying it, or None if it is not retried
+        self._observe_upstream(method, path, started_at, response)
+        if response is None:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_response(response)
+        delay = self.retry_policy.delay_for(method, attempt, response=response, error=error)
+        if delay is not None:
+            logger.debug("Retrying %s %s in %.2fs (attempt %d)", method, path, delay, attempt + 1)
+        return delay
+
+    def _finish_request(
+        self,
+        path: str,
+        response: httpx.Response,
+        expect_json: bool,
+        cache_key: Optional[CacheKey],
+        invalidates: Tuple[str, ...],
+        on_success: Optional[Callable[[], None]] = None,
+    ) -> Any:
+        self._invalidate(invalidates)
+        response.raise_for_status()
+        if on_success is not None:
+            on_success()
+        if not expect_json:
+            return None
+
+        result = response.json()
+        self._index_response(path, result)
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Report connection pool usage.
+
+        Returns:
+            In-flight and peak request counts, the pool size, the current saturation ratio, the
+            number of requests that had to wait for a free connection and the number of requests
+            answered by an identical request already in flight
+        """
+        max_connections = self.limits.max_connections
+        return {
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "max_connections": max_connections,
+            "saturation": self._in_flight / max_connections if max_connections else 0.0,
+            "saturated_requests": self._saturated_requests,
+            "coalesced_requests": self._coalesced_requests,
+        }
+
+    @abstractmethod
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        expect_json: bool = True,
+        cacheable: bool = False,
+        invalidates: Tuple[str, ...] = (),
+        on_success: Optional[Callable[[], None]] = None,
+        stream: bool = False,
+    ) -> Any: ...
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+        # (endpoint, path including the id/fqn, sorted query params such as fields and include)
+        return path.split("/")[3], path, tuple(sorted((params or {}).items()))
+
+    def _coalesce_key(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        expect_json: bool,
+    ) -> Optional[Tuple[Any, ...]]:
+        # Only reads are shared; writes must each reach the server
+        if not self.coalesce_requests or method != "GET" or not expect_json:
+            return None
+        return (*self._cache_key(path, params), tuple(sorted((headers or {}).items())))
+
+    def _release_shared_request(self, coalesce_key: Tuple[Any, ...], shared: Any) -> None:
+        with self._coalesce_lock:
+            if self._shared_requests.get(coalesce_key) is shared:
+                del self._shared_requests[coalesce_key]
+        # Mark a failure as retrieved when every waiter has gone away, so asyncio does not log it
+        if isinstance(shared, asyncio.Future) and not shared.cancelled():
+            shared.exception()
+
+    def _invalidate(self, endpoints: Tuple[str, ...]) -> None:
+        if endpoints:
+            self.cache.invalidate_prefixes(endpoints)
+            # Reads already in flight may predate the write; later callers start a fresh request
+            with self._coalesce_lock:
+                for coalesce_key in [key for key in self._shared_requests if key[0] in endpoints]:
+                    del self._shared_requests[coalesce_key]
+
+    def _index_response(self, path: str, result: Any) -> None:
+        kind = INDEXED_ENDPOINTS.get(path.split("/")[3])
+        if kind is None:
+            return
+        self.fqn_index.record(kind, result)
+        # Once built, the search index and graph follow every term the client sees between full refreshes
+        if kind == GLOSSARY_TERM and isinstance(result, dict):
+            for term in result["data"] if isinstance(result.get("data"), list) else [result]:
+                if isinstance(term, dict) and "name" in term:
+                    if self.search_index.is_built:
+                        self._observe_term(term)
+                    if self.glossary_graph.is_built:
+                        self.glossary_graph.upsert(term)
+
+    def _observe_term(self, term: Dict[str, Any]) -> None:
+        term_id = term.get("id")
+        if term_id not in self.search_index or self.search_index.version_of(term_id) != term.get("updatedAt"):
+            self.search_index.upsert(term)
+
+    def _load_snapshot(self) -> None:
+        """Seed the FQN index, search index and lookup cache from the on-disk snapshot."""
+        self._seed_from_snapshot(*self._read_snapshot())
+
+    def _read_snapshot(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        return list(self.snapshot.load(GLOSSARY)), list(self.snapshot.load(GLOSSARY_TERM))
+
+    def _seed_from_snapshot(self, glossaries: List[Dict[str, Any]], terms: List[Dict[str, Any]]) -> None:
+        for glossary in glossaries:
+            self.fqn_index.record(GLOSSARY, glossary)
+            self._seed_cache(f"/api/v1/glossaries/name/{glossary.get('fullyQualifiedName')}", glossary)
+        if glossaries:
+            self.fqn_index.mark_warm(GLOSSARY)
+
+        term_ids = set()
+        for term in terms:
+            self.fqn_index.record(GLOSSARY_TERM, term)
+            self.search_index.upsert(term)
+            self._seed_cache(f"/api/v1/glossaryTerms/name/{term.get('fullyQualifiedName')}", term)
+            term_ids.add(term.get("id"))
+        if term_ids:
+            self.search_index.replace_all(term_ids)
+        logger.info(
+            "Loaded %d glossaries and %d terms from snapshot %s", len(glossaries), len(term_ids), self.snapshot.path
+        )
+
+    def _seed_cache(self, path: str, entity: Dict[str, Any]) -> None:
+        # Matches the key of a get_*_by_name call with default fields and include
+        self.cache.set(self._cache_key(path, {"include": "non-deleted"}), entity)
+
+    def _finish_snapshot_kind(self, revalidation: SnapshotRevalidation, removed: Set[str]) -> None:
+        # ``removed`` holds the IDs ``revalidation.finish()`` deleted from the snapshot
+        if revalidation.changed or removed:
+            self._invalidate(("glossaries",) if revalidation.kind == GLOSSARY else GLOSSARY_TERM_ENDPOINTS)
+        if revalidation.kind == GLOSSARY:
+            self.fqn_index.mark_warm(GLOSSARY)
+        else:
+            for term_id in removed:
+                self._forget_term(term_id=term_id)
+            self.search_index.replace_all(revalidation.seen)
+        logger.info(
+            "Snapshot revalidated %s: %d changed, %d removed", revalidation.kind, revalidation.changed, len(removed)
+        )
+
+    @property
+    def snapshot_due(self) -> bool:
+        """Whether the snapshot has never been revalidated or its refresh interval has elapsed."""
+        if self.snapshot is None:
+            return False
+        return (
+            self.snapshot_revalidated_at is None
+            or time.monotonic() - self.snapshot_revalidated_at >= self.snapshot_refresh_interval
+        )
+
+    def _apply_entity_change(
+        self, kind: str, entity: Optional[Dict[str, Any]], entity_id: Optional[str], deleted: bool
+    ) -> Optional[Callable[[], None]]:
+        # Updates the in-memory state and returns the snapshot write recording the change, if any
+        entity_id = entity_id or (entity or {}).get("id")
+        self._invalidate(GLOSSARY_TERM_ENDPOINTS if kind == GLOSSARY_TERM else ("glossaries",))
+        snapshot = self.snapshot
+        if deleted:
+            nested_fqn = None
+            if kind == GLOSSARY_TERM:
+                self._forget_term(fqn=(entity or {}).get("fullyQualifiedName"), term_id=entity_id)
+            else:
+                # A glossary's terms are deleted with it
+                nested_fqn = self._forget_glossary(fqn=(entity or {}).get("fullyQualifiedName"), glossary_id=entity_id)
+            if snapshot is None:
+                return None
+
+            def delete() -> None:
+                if nested_fqn:
+                    snapshot.delete_nested(GLOSSARY_TERM, nested_fqn)
+                if entity_id:
+                    snapshot.delete(kind, [entity_id])
+
+            return delete
+
+        self.fqn_index.record(kind, entity)
+        if kind == GLOSSARY_TERM and self.search_index.is_built:
+            self._observe_term(entity)
+        if kind == GLOSSARY_TERM and self.glossary_graph.is_built:
+            self.glossary_graph.upsert(entity)
+        if snapshot is None:
+            return None
+        return lambda: snapshot.upsert(kind, [entity])
+
+    def _forget_term(self, fqn: Optional[str] = None, term_id: Optional[str] = None, recursive: bool = True) -> None:
+        fqn = fqn or (self.fqn_index.get_fqn(GLOSSARY_TERM, term_id) if term_id else None)
+        if fqn and recursive:
+            self.search_index.remove_prefix(fqn)
+            self.glossary_graph.remove_prefix(fqn)
+        else:
+            term_id = term_id or (self.fqn_index.get_id(GLOSSARY_TERM, fqn) if fqn else None)
+            if term_id:
+                self.search_index.remove(term_id)
+                self.glossary_graph.remove(term_id)
+        self.fqn_index.discard(GLOSSARY_TERM, fqn=fqn, entity_id=term_id, nested=recursive)
+
+    def _forget_glossary(self, fqn: Optional[str] = None, glossary_id: Optional[str] = None) -> Optional[str]:
+        # Returns the glossary's FQN when known
+        fqn = fqn or (self.fqn_index.get_fqn(GLOSSARY, glossary_id) if glossary_id else None)
+        if fqn:
+            # A glossary's terms are deleted with it; their FQNs all start with the glossary's
+            self.search_index.remove_prefix(fqn)
+            self.glossary_graph.remove_prefix(fqn)
+            self.fqn_index.discard(GLOSSARY_TERM, fqn=fqn)
+        self.fqn_index.discard(GLOSSARY, fqn=fqn, entity_id=glossary_id)
+        return fqn
+
+    @abstractmethod
+    def _iter_entities(self, fetch: PageFetcher, next_cursor: NextCursor) -> Any: ...
+
+    @staticmethod
+    def _next_after(cursor: Optional[str], page: Dict[str, Any]) -> Optional[str]:
+        return page.get("paging", {}).get("after") or None
+
+    @staticmethod
+    def _next_offset(page_size: int) -> NextCursor:
+        def next_offset(offset: Optional[int], page: Dict[str, Any]) -> Optional[int]:
+            data = page.get("data", [])
+            return (offset or 0) + len(data) if len(data) >= page_size else None
+
+        return next_offset
+
+    # --- Bulk Helpers ---
+
+    @staticmethod
+    def _term_spec_fqn(spec: Dict[str, Any]) -> str:
+        return f"{spec.get('parent_fqn') or spec.get('glossary_fqn')}.{spec.get('name')}"
+
+    @classmethod
+    def _plan_term_levels(cls, terms: List[Dict[str, Any]]) -> List[List[int]]:
+        """Group term spec indexes so every term comes after the batch term it is nested under."""
+        index_by_fqn = {cls._term_spec_fqn(spec): i for i, spec in enumerate(terms)}
+        depths: Dict[int, int] = {}
+        for start in range(len(terms)):
+            chain = []
+            i: Optional[int] = start
+            while i is not None and i not in depths and i not in chain:
+                chain.append(i)
+                parent_fqn = terms[i].get("parent_fqn")
+                i = index_by_fqn.get(parent_fqn) if parent_fqn else None
+            depth = depths[i] + 1 if i is not None and i in depths else 0
+            for i in reversed(chain):
+                depths[i] = depth
+                depth += 1
+
+        levels: List[List[int]] = [[] for _ in range(max(depths.values(), default=-1) + 1)]
+        for i, depth in depths.items():
+            levels[depth].append(i)
+        return levels
+
+    @staticmethod
+    def _bulk_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        succeeded = sum(1 for result in results if result["status"] == "success")
+        return {"total": len(results), "succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
+
+    def _create_term_from_spec(self, spec: Dict[str, Any]) -> Any:
+        missing = [key for key in ("name", "description", "glossary_fqn") if not spec.get(key)]
+        if missing:
+            raise OpenMetadataError(f"Term spec is missing {', '.join(missing)}")
+        return self.create_glossary_term(
+            name=spec["name"],
+            display_name=spec.get("display_name", spec["name"]),
+            description=spec["description"],
+            glossary_fqn=spec["glossary_fqn"],
+            parent_fqn=spec.get("parent_fqn"),
+        )
+
+    @staticmethod
+    def _render_patch(patch_template: List[Dict[str, Any]], term_id: str, fqn: Optional[str]) -> List[Dict[str, Any]]:
+        """Substitute $id, $fqn and $name in the string values of a JSON Patch template."""
+        mapping = {"id": term_id, "fqn": fqn or "", "name": (fqn or "").rsplit(".", 1)[-1]}
+
+        def render(value: Any) -> Any:
+            if isinstance(value, str):
+                return PATCH_PLACEHOLDER.sub(lambda match: mapping[match.group(1)], value)
+            if isinstance(value, list):
+                return [render(item) for item in value]
+            if isinstance(value, dict):
+                return {key: render(item) for key, item in value.items()}
+            return value
+
+        return render(patch_template)
+
+    @staticmethod
+    def _should_retry_bulk_item(error: Exception, attempt: int, max_retries: int) -> bool:
+        # 429s are already retried by _request; PATCH is not idempotent in general, so 5xx retries are opt-in here
+        if attempt >= max_retries or not isinstance(error, httpx.HTTPStatusError):
+            return False
+        return error.response.status_code >= 500
+
+    @staticmethod
+    def _bulk_retry_delay(attempt: int) -> float:
+        return BULK_RETRY_BASE_DELAY * (2**attempt) * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def _dedupe_targets(targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        seen = set()
+        unique = []
+        for target in targets:
+            if target.get("id") is not None:
+                if target["id"] in seen:
+                    continue
+                seen.add(target["id"])
+            unique.append(target)
+        return unique
+
+    @staticmethod
+    def _update_result(
+        target: Dict[str, Any], updated: Any, error: Optional[Exception], attempts: int
+    ) -> Dict[str, Any]:
+        result = {"selector": target["selector"], "id": target.get("id"), "attempts": attempts}
+        if error is not None:
+            return {**result, "status": "failed", "error": str(error)}
+        fqn = updated.get("fullyQualifiedName", target.get("fqn"))
+        return {**result, "status": "success", "fullyQualifiedName": fqn}
+
+    @classmethod
+    def _term_result(cls, index: int, spec: Dict[str, Any], created: Any, error: Optional[Exception]) -> Dict[str, Any]:
+        if error is not None:
+            return {"index": index, "name": spec.get("name"), "status": "failed", "error": str(error)}
+        return {
+            "index": index,
+            "name": spec.get("name"),
+            "status": "success",
+            "id": created.get("id"),
+            "fullyQualifiedName": created.get("fullyQualifiedName", cls._term_spec_fqn(spec)),
+        }
+
+    @staticmethod
+    def _batch_selectors(ids: Optional[List[str]], fqns: Optional[List[str]]) -> List[Tuple[str, str]]:
+        """Return unique (kind, value) selectors, IDs first, each in input order."""
+        selectors = [("id", term_id) for term_id in ids or []] + [("fqn", fqn) for fqn in fqns or []]
+        return list(dict.fromkeys(selectors))
+
+    @staticmethod
+    def _batch_report(
+        selectors: List[Tuple[str, str]], outcomes: List[Tuple[Any, Optional[Exception]]]
+    ) -> Dict[str, Any]:
+        data = []
+        errors = []
+        seen_ids = set()
+        for (kind, value), (entity, error) in zip(selectors, outcomes):
+            if error is None:
+                # An entity asked for by both its ID and its FQN is returned once
+                if entity.get("id") not in seen_ids:
+                    seen_ids.add(entity.get("id"))
+                    data.append(entity)
+                continue
+            if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404:
+                message = "Not found"
+            else:
+                message = str(error)
+            errors.append({kind: value, "error": message})
+        return {"data": data, "errors": errors, "total": len(selectors), "found": len(data)}
+
     def list_tables(
         self,
         limit: int = 10,
@@ -49,23 +723,25 @@ class OpenMetadataClient:
         fields: Optional[str] = None,
         database: Optional[str] = None,
         include_deleted: bool = False,
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+    ) -> Any:
         """List tables with pagination.
 
         Args:
-            limit: Maximum number of tables to return (1 to 1000000)
+            limit: Maximum number of tables to return (1 to max_page_size)
             offset: Number of tables to skip
             fields: Comma-separated list of fields to include
             database: Filter tables by database fully qualified name
             include_deleted: Whether to include deleted tables
+            stream: Return a page stream decoding the tables as the response arrives
 
         Returns:
-            Dictionary containing table list and metadata
+            Dictionary containing table list and metadata, or a PageStream/AsyncPageStream of the tables
 
         Raises:
             OpenMetadataError: If the API request fails
         """
-        params = {"limit": min(max(1, limit), 1000000), "offset": max(0, offset)}
+        params = {"limit": min(max(1, limit), self.max_page_size), "offset": max(0, offset)}
         if fields:
             params["fields"] = fields
         if database:
@@ -73,9 +749,7 @@ class OpenMetadataClient:
         if include_deleted:
             params["include"] = "all"
 
-        response = self.session.get(f"{self.host}/api/v1/tables", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", "/api/v1/tables", params=params, stream=stream)
 
     def get_table(self, table_id: str, fields: Optional[str] = None) -> Dict[str, Any]:
         """Get details of a specific table by ID.
@@ -94,9 +768,7 @@ class OpenMetadataClient:
         if fields:
             params["fields"] = fields
 
-        response = self.session.get(f"{self.host}/api/v1/tables/{table_id}", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", f"/api/v1/tables/{table_id}", params=params, cacheable=True)
 
     def get_table_by_name(self, fqn: str, fields: Optional[str] = None) -> Dict[str, Any]:
         """Get details of a specific table by fully qualified name.
@@ -115,9 +787,7 @@ class OpenMetadataClient:
         if fields:
             params["fields"] = fields
 
-        response = self.session.get(f"{self.host}/api/v1/tables/name/{fqn}", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", f"/api/v1/tables/name/{fqn}", params=params, cacheable=True)
 
     def create_table(self, table_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new table.
@@ -131,9 +801,7 @@ class OpenMetadataClient:
         Raises:
             OpenMetadataError: If the API request fails
         """
-        response = self.session.post(f"{self.host}/api/v1/tables", json=table_data)
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", "/api/v1/tables", json=table_data, invalidates=("tables",))
 
     def update_table(self, table_id: str, table_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing table.
@@ -148,9 +816,7 @@ class OpenMetadataClient:
         Raises:
             OpenMetadataError: If the API request fails
         """
-        response = self.session.put(f"{self.host}/api/v1/tables/{table_id}", json=table_data)
-        response.raise_for_status()
-        return response.json()
+        return self._request("PUT", f"/api/v1/tables/{table_id}", json=table_data, invalidates=("tables",))
 
     def delete_table(self, table_id: str, hard_delete: bool = False, recursive: bool = False) -> None:
         """Delete a table.
@@ -164,8 +830,40 @@ class OpenMetadataClient:
             OpenMetadataError: If the API request fails
         """
         params = {"hardDelete": hard_delete, "recursive": recursive}
-        response = self.session.delete(f"{self.host}/api/v1/tables/{table_id}", params=params)
-        response.raise_for_status()
+        return self._request(
+            "DELETE", f"/api/v1/tables/{table_id}", params=params, expect_json=False, invalidates=("tables",)
+        )
+
+    def iter_tables(
+        self,
+        page_size: int = DEFAULT_ITER_PAGE_SIZE,
+        fields: Optional[str] = None,
+        database: Optional[str] = None,
+        include_deleted: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every table, fetching the next page while the current one is consumed.
+
+        Args:
+            page_size: Number of tables requested per page (at most max_page_size)
+            fields: Comma-separated list of fields to include
+            database: Filter tables by database fully qualified name
+            include_deleted: Whether to include deleted tables
+
+        Returns:
+            Iterator of table entities (an async iterator on ``AsyncOpenMetadataClient``)
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        # list_tables clamps the limit, and a short page is what ends the walk, so both must agree
+        page_size = min(max(1, page_size), self.max_page_size)
+
+        def fetch(offset: Optional[int]) -> Any:
+            return self.list_tables(
+                limit=page_size, offset=offset or 0, fields=fields, database=database, include_deleted=include_deleted
+            )
+
+        return self._iter_entities(fetch, self._next_offset(page_size))
 
     # --- Glossary Methods ---
 
@@ -176,24 +874,26 @@ class OpenMetadataClient:
         before: Optional[str] = None,
         after: Optional[str] = None,
         include: str = "non-deleted",
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+    ) -> Any:
         """List glossaries with pagination and filtering.
 
         Args:
-            limit: Maximum number of glossaries to return (1 to 1000000)
+            limit: Maximum number of glossaries to return (1 to max_page_size)
             fields: Comma-separated list of fields to include (e.g., owners,tags,reviewers,usageCount,termCount,domain,extension)
             before: Returns list of glossaries before this cursor
             after: Returns list of glossaries after this cursor
             include: Include all, deleted, or non-deleted entities (default: non-deleted)
+            stream: Return a page stream decoding the glossaries as the response arrives
 
         Returns:
-            Dictionary containing glossary list and metadata
+            Dictionary containing glossary list and metadata, or a PageStream/AsyncPageStream of the glossaries
 
         Raises:
             OpenMetadataError: If the API request fails
         """
         params = {
-            "limit": min(max(1, limit), 1000000),
+            "limit": min(max(1, limit), self.max_page_size),
             "include": include,
         }
         if fields:
@@ -203,9 +903,29 @@ class OpenMetadataClient:
         if after:
             params["after"] = after
 
-        response = self.session.get(f"{self.host}/api/v1/glossaries", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", "/api/v1/glossaries", params=params, stream=stream)
+
+    def get_glossary(
+        self, glossary_id: str, fields: Optional[str] = None, include: str = "non-deleted"
+    ) -> Dict[str, Any]:
+        """Get details of a specific glossary by ID.
+
+        Args:
+            glossary_id: UUID of the glossary
+            fields: Comma-separated list of fields to include
+            include: Include all, deleted, or non-deleted entities (default: non-deleted)
+
+        Returns:
+            Glossary details
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        params = {"include": include}
+        if fields:
+            params["fields"] = fields
+
+        return self._request("GET", f"/api/v1/glossaries/{glossary_id}", params=params, cacheable=True)
 
     def get_glossary_by_name(self, fqn: str, fields: Optional[str] = None, include: str = "non-deleted") -> Dict[str, Any]:
         """Get details of a specific glossary by fully qualified name.
@@ -225,9 +945,29 @@ class OpenMetadataClient:
         if fields:
             params["fields"] = fields
 
-        response = self.session.get(f"{self.host}/api/v1/glossaries/name/{fqn}", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", f"/api/v1/glossaries/name/{fqn}", params=params, cacheable=True)
+
+    def iter_glossaries(
+        self, page_size: int = DEFAULT_ITER_PAGE_SIZE, fields: Optional[str] = None, include: str = "non-deleted"
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every glossary, following ``paging.after`` cursors.
+
+        Args:
+            page_size: Number of glossaries requested per page
+            fields: Comma-separated list of fields to include
+            include: Include all, deleted, or non-deleted entities (default: non-deleted)
+
+        Returns:
+            Iterator of glossary entities (an async iterator on ``AsyncOpenMetadataClient``)
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+
+        def fetch(after: Optional[str]) -> Any:
+            return self.list_glossaries(limit=page_size, fields=fields, after=after, include=include)
+
+        return self._iter_entities(fetch, self._next_after)
 
     # --- Glossary Term Methods ---
 
@@ -239,25 +979,27 @@ class OpenMetadataClient:
         before: Optional[str] = None,
         after: Optional[str] = None,
         include: str = "non-deleted",
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+    ) -> Any:
         """List glossary terms with pagination and filtering.
 
         Args:
             glossary_id: UUID of the glossary to filter terms from.
-            limit: Maximum number of terms to return (1 to 1000000)
+            limit: Maximum number of terms to return (1 to max_page_size)
             fields: Comma-separated list of fields to include (e.g., owners,tags,reviewers,usageCount,relatedTerms,synonyms,domain,extension)
             before: Returns list of terms before this cursor
             after: Returns list of terms after this cursor
             include: Include all, deleted, or non-deleted entities (default: non-deleted)
+            stream: Return a page stream decoding the terms as the response arrives
 
         Returns:
-            Dictionary containing glossary term list and metadata
+            Dictionary containing glossary term list and metadata, or a PageStream/AsyncPageStream of the terms
 
         Raises:
             OpenMetadataError: If the API request fails
         """
         params = {
-            "limit": min(max(1, limit), 1000000),
+            "limit": min(max(1, limit), self.max_page_size),
             "include": include,
         }
         if glossary_id:
@@ -269,9 +1011,58 @@ class OpenMetadataClient:
         if after:
             params["after"] = after
 
-        response = self.session.get(f"{self.host}/api/v1/glossaryTerms", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", "/api/v1/glossaryTerms", params=params, stream=stream)
+
+    def iter_glossary_terms(
+        self,
+        glossary_id: Optional[str] = None,
+        page_size: int = DEFAULT_ITER_PAGE_SIZE,
+        fields: Optional[str] = None,
+        include: str = "non-deleted",
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every glossary term, following ``paging.after`` cursors.
+
+        Args:
+            glossary_id: UUID of the glossary to filter terms from.
+            page_size: Number of terms requested per page
+            fields: Comma-separated list of fields to include
+            include: Include all, deleted, or non-deleted entities (default: non-deleted)
+
+        Returns:
+            Iterator of glossary term entities (an async iterator on ``AsyncOpenMetadataClient``)
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+
+        def fetch(after: Optional[str]) -> Any:
+            return self.list_glossary_terms(
+                glossary_id=glossary_id, limit=page_size, fields=fields, after=after, include=include
+            )
+
+        return self._iter_entities(fetch, self._next_after)
+
+    def get_glossary_term(
+        self, term_id: str, fields: Optional[str] = None, include: str = "non-deleted"
+    ) -> Dict[str, Any]:
+        """Get details of a specific glossary term by ID.
+
+        Args:
+            term_id: UUID of the glossary term
+            fields: Comma-separated list of fields to include
+            include: Include all, deleted, or non-deleted entities (default: non-deleted)
+
+        Returns:
+            Glossary term details
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        params = {"include": include}
+        if fields:
+            params["fields"] = fields
+
+        return self._request("GET", f"/api/v1/glossaryTerms/{term_id}", params=params, cacheable=True)
 
     def get_glossary_term_by_name(self, fqn: str, fields: Optional[str] = None, include: str = "non-deleted") -> Dict[str, Any]:
         """Get details of a specific glossary term by fully qualified name.
@@ -291,9 +1082,7 @@ class OpenMetadataClient:
         if fields:
             params["fields"] = fields
 
-        response = self.session.get(f"{self.host}/api/v1/glossaryTerms/name/{fqn}", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", f"/api/v1/glossaryTerms/name/{fqn}", params=params, cacheable=True)
 
     def delete_glossary_term_by_name(self, fqn: str, hard_delete: bool = False, recursive: bool = False) -> None:
         """Delete a glossary term by fully qualified name.
@@ -307,10 +1096,18 @@ class OpenMetadataClient:
             OpenMetadataError: If the API request fails
         """
         params = {"hardDelete": hard_delete, "recursive": recursive}
-        response = self.session.delete(f"{self.host}/api/v1/glossaryTerms/name/{fqn}", params=params)
-        response.raise_for_status()
-
-    def create_glossary_term(self, name: str, display_name: str, description: str, glossary_fqn: str) -> Dict[str, Any]:
+        return self._request(
+            "DELETE",
+            f"/api/v1/glossaryTerms/name/{fqn}",
+            params=params,
+            expect_json=False,
+            invalidates=GLOSSARY_TERM_ENDPOINTS,
+            on_success=lambda: self._forget_term(fqn=fqn, recursive=recursive),
+        )
+
+    def create_glossary_term(
+        self, name: str, display_name: str, description: str, glossary_fqn: str, parent_fqn: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Create a new glossary term.
 
         Args:
@@ -318,6 +1115,7 @@ class OpenMetadataClient:
             display_name: Display name of the glossary term
             description: Description of the glossary term
             glossary_fqn: Fully qualified name of the parent glossary
+            parent_fqn: Fully qualified name of the parent glossary term, for nested terms
 
         Returns:
             Created glossary term details
@@ -331,9 +1129,9 @@ class OpenMetadataClient:
             "description": description,
             "glossary": glossary_fqn,
         }
-        response = self.session.post(f"{self.host}/api/v1/glossaryTerms", json=payload)
-        response.raise_for_status()
-        return response.json()
+        if parent_fqn:
+            payload["parent"] = parent_fqn
+        return self._request("POST", "/api/v1/glossaryTerms", json=payload, invalidates=GLOSSARY_TERM_ENDPOINTS)
 
     def update_glossary_term(self, term_id: str, patch_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Update an existing glossary term using JSON Patch via its ID.
@@ -350,9 +1148,13 @@ class OpenMetadataClient:
             OpenMetadataError: If the API request fails
         """
         headers = {"Content-Type": "application/json-patch+json"}
-        response = self.session.patch(f"{self.host}/api/v1/glossaryTerms/{term_id}", json=patch_data, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return self._request(
+            "PATCH",
+            f"/api/v1/glossaryTerms/{term_id}",
+            json=patch_data,
+            headers=headers,
+            invalidates=GLOSSARY_TERM_ENDPOINTS,
+        )
 
     def delete_glossary_term(self, term_id: str, hard_delete: bool = False, recursive: bool = False) -> None:
         """Delete a glossary term by its ID.
@@ -366,5 +1168,1022 @@ class OpenMetadataClient:
             OpenMetadataError: If the API request fails
         """
         params = {"hardDelete": hard_delete, "recursive": recursive}
-        response = self.session.delete(f"{self.host}/api/v1/glossaryTerms/{term_id}", params=params)
-        response.raise_for_status()
+        return self._request(
+            "DELETE",
+            f"/api/v1/glossaryTerms/{term_id}",
+            params=params,
+            expect_json=False,
+            invalidates=GLOSSARY_TERM_ENDPOINTS,
+            on_success=lambda: self._forget_term(term_id=term_id, recursive=recursive),
+        )
+
+    # --- Change Event Methods ---
+
+    def list_change_events(self, entity_types: List[str], timestamp: int) -> Dict[str, Any]:
+        """List change events for the given entity types since a point in time.
+
+        Args:
+            entity_types: Entity types to report created, updated and deleted events for (e.g., glossaryTerm)
+            timestamp: Only return events after this epoch timestamp in milliseconds
+
+        Returns:
+            Dictionary containing the list of change events
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        types = ",".join(entity_types)
+        params = {"entityCreated": types, "entityUpdated": types, "entityDeleted": types, "timestamp": timestamp}
+        return self._request("GET", "/api/v1/events", params=params)
+
+
+class OpenMetadataClient(_BaseOpenMetadataClient):
+    """Client for interacting with OpenMetadata API."""
+
+    def _create_session(self) -> httpx.Client:
+        return httpx.Client(limits=self.limits, timeout=self.timeout, http2=self.http2)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        expect_json: bool = True,
+        cacheable: bool = False,
+        invalidates: Tuple[str, ...] = (),
+        on_success: Optional[Callable[[], None]] = None,
+        stream: bool = False,
+    ) -> Any:
+        if stream:
+            # A stream is read by one caller only, so it bypasses the cache and request coalescing
+            return self._stream(method, path, params)
+        cache_key = self._cache_key(path, params) if cacheable else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        coalesce_key = self._coalesce_key(method, path, params, headers, expect_json)
+        if coalesce_key is None:
+            return self._send(method, path, params, json, headers, expect_json, cache_key, invalidates, on_success)
+        with self._coalesce_lock:
+            shared = self._shared_requests.get(coalesce_key)
+            leader = shared is None
+            if leader:
+                shared = self._shared_requests[coalesce_key] = Future()
+            else:
+                self._coalesced_requests += 1
+        if not leader:
+            return shared.result()
+
+        try:
+            result = self._send(method, path, params, json, headers, expect_json, cache_key, invalidates, on_success)
+        except BaseException as e:
+            shared.set_exception(e)
+            raise
+        else:
+            shared.set_result(result)
+            return result
+        finally:
+            self._release_shared_request(coalesce_key, shared)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        headers: Optional[Dict[str, str]],
+        expect_json: bool,
+        cache_key: Optional[CacheKey],
+        invalidates: Tuple[str, ...],
+        on_success: Optional[Callable[[], None]],
+    ) -> Any:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            started_at = time.perf_counter()
+            try:
+                with self._track_in_flight():
+                    response = self.session.request(
+                        method, f"{self.host}{path}", params=params, json=json, headers=headers
+                    )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, path, started_at, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, path, started_at, attempt, response=response)
+                if delay is None:
+                    return self._finish_request(path, response, expect_json, cache_key, invalidates, on_success)
+            time.sleep(delay)
+            attempt += 1
+
+    def _stream(self, method: str, path: str, params: Optional[Dict[str, Any]]) -> PageStream:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            started_at = time.perf_counter()
+            in_flight = ExitStack()
+            in_flight.enter_context(self._track_in_flight())
+            try:
+                request = self.session.build_request(method, f"{self.host}{path}", params=params)
+                response = self.session.send(request, stream=True)
+            except httpx.TransportError as e:
+                in_flight.close()
+                delay = self._retry_delay(method, path, started_at, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                if response.is_success:
+                    # The stream observes the request once its body has been read
+                    self.circuit_breaker.record_response(response)
+                    return PageStream(self, path, response, started_at, in_flight)
+                try:
+                    response.read()
+                finally:
+                    response.close()
+                    in_flight.close()
+                delay = self._retry_delay(method, path, started_at, attempt, response=response)
+                if delay is None:
+                    response.raise_for_status()
+            time.sleep(delay)
+            attempt += 1
+
+    def _iter_entities(self, fetch: PageFetcher, next_cursor: NextCursor) -> Iterator[Dict[str, Any]]:
+        # At most two pages are held at once: the one being yielded and the one being prefetched
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            cursor = None
+            pending = prefetcher.submit(fetch, cursor)
+            while pending is not None:
+                page = pending.result()
+                cursor = next_cursor(cursor, page)
+                pending = prefetcher.submit(fetch, cursor) if cursor is not None else None
+                yield from page.get("data", [])
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and the snapshot."""
+        self.session.close()
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+    # --- Bulk Operations ---
+
+    def bulk_create_glossary_terms(
+        self, terms: List[Dict[str, Any]], max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """Create many glossary terms, parents before children, with bounded concurrency.
+
+        Args:
+            terms: Term specs with name, display_name, description, glossary_fqn and optional parent_fqn
+            max_concurrency: Maximum number of create requests in flight at once
+
+        Returns:
+            Report with total/succeeded/failed counts and one result per spec, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(terms)
+        failed_fqns: set = set()
+
+        def create(index: int) -> None:
+            spec = terms[index]
+            try:
+                if spec.get("parent_fqn") in failed_fqns:
+                    raise OpenMetadataError(f"Parent term '{spec['parent_fqn']}' was not created")
+                created = self._create_term_from_spec(spec)
+                results[index] = self._term_result(index, spec, created, None)
+            except Exception as e:
+                failed_fqns.add(self._term_spec_fqn(spec))
+                results[index] = self._term_result(index, spec, None, e)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            for level in self._plan_term_levels(terms):
+                list(pool.map(create, level))
+        return self._bulk_report(results)
+
+    def _resolve_update_targets(
+        self,
+        term_ids: Optional[List[str]],
+        term_fqns: Optional[List[str]],
+        glossary_id: Optional[str],
+        max_concurrency: int,
+    ) -> List[Dict[str, Any]]:
+        targets = [
+            {"selector": term_id, "id": term_id, "fqn": self.fqn_index.get_fqn(GLOSSARY_TERM, term_id)}
+            for term_id in term_ids or []
+        ]
+
+        def resolve(fqn: str) -> Dict[str, Any]:
+            try:
+                return {"selector": fqn, "id": self.resolve_glossary_term_id(fqn), "fqn": fqn}
+            except Exception as e:
+                return {"selector": fqn, "id": None, "fqn": fqn, "error": e}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            targets.extend(pool.map(resolve, term_fqns or []))
+        if glossary_id:
+            for term in self.iter_glossary_terms(glossary_id=glossary_id, page_size=INDEX_WARM_PAGE_SIZE):
+                fqn = term["fullyQualifiedName"]
+                targets.append({"selector": fqn, "id": term["id"], "fqn": fqn})
+        return self._dedupe_targets(targets)
+
+    def bulk_update_glossary_terms(
+        self,
+        patch_template: List[Dict[str, Any]],
+        term_ids: Optional[List[str]] = None,
+        term_fqns: Optional[List[str]] = None,
+        glossary_id: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        max_retries: int = DEFAULT_BULK_RETRIES,
+    ) -> Dict[str, Any]:
+        """Apply one JSON Patch template to many glossary terms concurrently.
+
+        Args:
+            patch_template: JSON Patch operations; $id, $fqn and $name in string values are substituted per term
+            term_ids: UUIDs of the terms to update
+            term_fqns: Fully qualified names of the terms to update
+            glossary_id: UUID of a glossary whose terms should all be updated
+            max_concurrency: Maximum number of PATCH requests in flight at once
+            max_retries: Retries per term on 429 or 5xx responses
+
+        Returns:
+            Report with total/succeeded/failed counts and one result per selected term
+        """
+        targets = self._resolve_update_targets(term_ids, term_fqns, glossary_id, max_concurrency)
+
+        def update(target: Dict[str, Any]) -> Dict[str, Any]:
+            if target.get("error") is not None:
+                return self._update_result(target, None, target["error"], 0)
+            attempt = 0
+            while True:
+                try:
+                    patch = self._render_patch(patch_template, target["id"], target["fqn"])
+                    updated = self.update_glossary_term(term_id=target["id"], patch_data=patch)
+                    return self._update_result(target, updated, None, attempt + 1)
+                except Exception as e:
+                    if not self._should_retry_bulk_item(e, attempt, max_retries):
+                        return self._update_result(target, None, e, attempt + 1)
+                time.sleep(self._bulk_retry_delay(attempt))
+                attempt += 1
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            return self._bulk_report(list(pool.map(update, targets)))
+
+    def get_tables_batch(
+        self,
+        ids: Optional[List[str]] = None,
+        fqns: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Fetch many tables by ID and/or FQN concurrently; cached tables are served without a request.
+
+        Args:
+            ids: UUIDs of the tables
+            fqns: Fully qualified names of the tables
+            fields: Comma-separated list of fields to include
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            The found tables in input order under ``data``, and one entry per failed selector under ``errors``
+        """
+        selectors = self._batch_selectors(ids, fqns)
+
+        def fetch(selector: Tuple[str, str]) -> Tuple[Any, Optional[Exception]]:
+            kind, value = selector
+            get = self.get_table if kind == "id" else self.get_table_by_name
+            try:
+                return get(value, fields=fields), None
+            except Exception as e:
+                return None, e
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            return self._batch_report(selectors, list(pool.map(fetch, selectors)))
+
+    def get_glossary_terms_batch(
+        self,
+        ids: Optional[List[str]] = None,
+        fqns: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        include: str = "non-deleted",
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Fetch many glossary terms by ID and/or FQN concurrently; cached terms are served without a request.
+
+        Args:
+            ids: UUIDs of the terms
+            fqns: Fully qualified names of the terms
+            fields: Comma-separated list of fields to include
+            include: Include all, deleted, or non-deleted entities
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            The found terms in input order under ``data``, and one entry per failed selector under ``errors``
+        """
+        selectors = self._batch_selectors(ids, fqns)
+
+        def fetch(selector: Tuple[str, str]) -> Tuple[Any, Optional[Exception]]:
+            kind, value = selector
+            get = self.get_glossary_term if kind == "id" else self.get_glossary_term_by_name
+            try:
+                return get(value, fields=fields, include=include), None
+            except Exception as e:
+                return None, e
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            return self._batch_report(selectors, list(pool.map(fetch, selectors)))
+
+    # --- Search Index ---
+
+    def refresh_search_index(self) -> None:
+        """Stream every glossary term into the search index, re-indexing only changed terms.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        seen = set()
+        for term in self.iter_glossary_terms(page_size=INDEX_WARM_PAGE_SIZE):
+            seen.add(term["id"])
+            self._observe_term(term)
+        self.search_index.replace_all(seen)
+
+    # --- Glossary Graph ---
+
+    def refresh_glossary_graph(self) -> None:
+        """Stream every glossary term with its related terms into the glossary graph.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        seen = set()
+        for term in self.iter_glossary_terms(page_size=INDEX_WARM_PAGE_SIZE, fields="relatedTerms"):
+            seen.add(term["id"])
+            self.glossary_graph.upsert(term)
+        self.glossary_graph.replace_all(seen)
+
+    # --- Snapshot ---
+
+    def apply_entity_change(
+        self, kind: str, entity: Optional[Dict[str, Any]] = None, entity_id: Optional[str] = None, deleted: bool = False
+    ) -> None:
+        """Apply a change made outside this client to the cache, FQN index, search index and snapshot.
+
+        Args:
+            kind: Entity kind, either "glossary" or "glossaryTerm"
+            entity: Current entity, required unless ``deleted`` (for a deletion, supplies its FQN if known)
+            entity_id: UUID of the entity; defaults to ``entity["id"]``
+            deleted: Whether the entity was deleted
+        """
+        write = self._apply_entity_change(kind, entity, entity_id, deleted)
+        if write is not None:
+            write()
+
+    def revalidate_snapshot(self) -> None:
+        """Re-list every glossary and term and write only entities whose version or updatedAt changed.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        if self.snapshot is None:
+            return
+        glossaries = SnapshotRevalidation(self.snapshot, GLOSSARY)
+        for glossary in self.iter_glossaries(page_size=INDEX_WARM_PAGE_SIZE):
+            if glossaries.observe(glossary):
+                glossaries.flush()
+        self._finish_snapshot_kind(glossaries, glossaries.finish())
+
+        terms = SnapshotRevalidation(self.snapshot, GLOSSARY_TERM)
+        for term in self.iter_glossary_terms(page_size=INDEX_WARM_PAGE_SIZE):
+            if terms.observe(term):
+                terms.flush()
+            # The listing rebuilds the search index too; _finish_snapshot_kind drops terms it did not include
+            self._observe_term(term)
+        self._finish_snapshot_kind(terms, terms.finish())
+        self.snapshot_revalidated_at = time.monotonic()
+
+    # --- FQN Resolution ---
+
+    def warm_glossary_index(self) -> None:
+        """Load the FQN <-> ID mapping of every glossary.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        for _ in self.iter_glossaries(page_size=INDEX_WARM_PAGE_SIZE):
+            pass
+        self.fqn_index.mark_warm(GLOSSARY)
+
+    def resolve_glossary_id(self, fqn: str) -> str:
+        """Resolve a glossary FQN to its UUID, hitting the API only when the index misses.
+
+        Args:
+            fqn: Fully qualified name of the glossary
+
+        Returns:
+            UUID of the glossary
+
+        Raises:
+            OpenMetadataError: If the glossary cannot be found
+        """
+        glossary_id = self.fqn_index.get_id(GLOSSARY, fqn)
+        if glossary_id is None and not self.fqn_index.is_warm(GLOSSARY):
+            self.warm_glossary_index()
+            glossary_id = self.fqn_index.get_id(GLOSSARY, fqn)
+        if glossary_id is None:
+            glossary_id = self.get_glossary_by_name(fqn=fqn).get("id")
+        if not glossary_id:
+            raise OpenMetadataError(f"Could not find ID for glossary FQN '{fqn}'")
+        return glossary_id
+
+    def resolve_glossary_term_id(self, fqn: str) -> str:
+        """Resolve a glossary term FQN to its UUID, hitting the API only when the index misses.
+
+        Args:
+            fqn: Fully qualified name of the glossary term
+
+        Returns:
+            UUID of the glossary term
+
+        Raises:
+            OpenMetadataError: If the glossary term cannot be found
+        """
+        term_id = self.fqn_index.get_id(GLOSSARY_TERM, fqn)
+        if term_id is None:
+            term_id = self.get_glossary_term_by_name(fqn=fqn).get("id")
+        if not term_id:
+            raise OpenMetadataError(f"Could not find ID for glossary term FQN '{fqn}'")
+        return term_id
+
+    # --- Glossary Tree ---
+
+    def get_glossary_tree(
+        self,
+        glossary_fqn: str,
+        root_fqn: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        node_fields: Tuple[str, ...] = (),
+        include: str = "non-deleted",
+    ) -> Dict[str, Any]:
+        """Build a glossary's term hierarchy from a few paged bulk listings instead of one request per node.
+
+        Args:
+            glossary_fqn: Fully qualified name of the glossary
+            root_fqn: FQN of the term whose subtree is returned (default: the whole glossary)
+            max_depth: Levels of terms below the root to include (default: unlimited)
+            node_fields: Extra entity fields copied onto every node (e.g. description, synonyms, tags)
+            include: Include all, deleted, or non-deleted entities (default: non-deleted)
+
+        Returns:
+            Nested term tree, see ``build_glossary_tree``
+
+        Raises:
+            OpenMetadataError: If the glossary or the root term cannot be found
+        """
+        glossary_id = self.resolve_glossary_id(glossary_fqn)
+        terms = list(
+            self.iter_glossary_terms(
+                glossary_id=glossary_id, page_size=INDEX_WARM_PAGE_SIZE, fields=api_fields(node_fields), include=include
+            )
+        )
+        try:
+            return build_glossary_tree(terms, glossary_fqn, root_fqn, max_depth, node_fields)
+        except KeyError:
+            raise OpenMetadataError(f"Glossary term '{root_fqn}' is not part of glossary '{glossary_fqn}'") from None
+
+
+class AsyncOpenMetadataClient(_BaseOpenMetadataClient):
+    """Asynchronous client for interacting with OpenMetadata API.
+
+    Exposes the same methods as ``OpenMetadataClient``; each one returns an awaitable
+    resolving to what the synchronous client would return.
+    """
+
+    _search_refresh_task: Optional[asyncio.Future] = None
+    _graph_refresh_task: Optional[asyncio.Future] = None
+    _snapshot_task: Optional[asyncio.Future] = None
+    _snapshot_load: Optional[asyncio.Future] = None
+    _snapshot_loaded = False
+
+    def _create_session(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        expect_json: bool = True,
+        cacheable: bool = False,
+        invalidates: Tuple[str, ...] = (),
+        on_success: Optional[Callable[[], None]] = None,
+        stream: bool = False,
+    ) -> Any:
+        if not self._snapshot_loaded and self.snapshot is not None:
+            await self.load_snapshot()
+        if stream:
+            # A stream is read by one caller only, so it bypasses the cache and request coalescing
+            return await self._stream(method, path, params)
+        cache_key = self._cache_key(path, params) if cacheable else None
+        if cache_key is not None:
+            # A shared cache lookup is a socket round trip, awaited off the event loop
+            if isinstance(self.cache, SharedCache):
+                cached = await self.cache.aget(cache_key)
+            else:
+                cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        coalesce_key = self._coalesce_key(method, path, params, headers, expect_json)
+        if coalesce_key is None:
+            return await self._send(
+                method, path, params, json, headers, expect_json, cache_key, invalidates, on_success
+            )
+        with self._coalesce_lock:
+            shared = self._shared_requests.get(coalesce_key)
+            if shared is None:
+                shared = asyncio.ensure_future(
+                    self._send(method, path, params, json, headers, expect_json, cache_key, invalidates, on_success)
+                )
+                self._shared_requests[coalesce_key] = shared
+                shared.add_done_callback(lambda future: self._release_shared_request(coalesce_key, future))
+            else:
+                self._coalesced_requests += 1
+        # Shielded so a caller that gives up does not cancel the request for everyone else waiting on it
+        return await asyncio.shield(shared)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        headers: Optional[Dict[str, str]],
+        expect_json: bool,
+        cache_key: Optional[CacheKey],
+        invalidates: Tuple[str, ...],
+        on_success: Optional[Callable[[], None]],
+    ) -> Any:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            started_at = time.perf_counter()
+            try:
+                with self._track_in_flight():
+                    response = await self.session.request(
+                        method, f"{self.host}{path}", params=params, json=json, headers=headers
+                    )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, path, started_at, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, path, started_at, attempt, response=response)
+                if delay is None:
+                    return self._finish_request(path, response, expect_json, cache_key, invalidates, on_success)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _stream(self, method: str, path: str, params: Optional[Dict[str, Any]]) -> AsyncPageStream:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            started_at = time.perf_counter()
+            in_flight = ExitStack()
+            in_flight.enter_context(self._track_in_flight())
+            try:
+                request = self.session.build_request(method, f"{self.host}{path}", params=params)
+                response = await self.session.send(request, stream=True)
+            except httpx.TransportError as e:
+                in_flight.close()
+                delay = self._retry_delay(method, path, started_at, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                if response.is_success:
+                    # The stream observes the request once its body has been read
+                    self.circuit_breaker.record_response(response)
+                    return AsyncPageStream(self, path, response, started_at, in_flight)
+                try:
+                    await response.aread()
+                finally:
+                    await response.aclose()
+                    in_flight.close()
+                delay = self._retry_delay(method, path, started_at, attempt, response=response)
+                if delay is None:
+                    response.raise_for_status()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _iter_entities(self, fetch: PageFetcher, next_cursor: NextCursor) -> AsyncIterator[Dict[str, Any]]:
+        # At most two pages are held at once: the one being yielded and the one being prefetched
+        cursor = None
+        pending = asyncio.ensure_future(fetch(cursor))
+        try:
+            while pending is not None:
+                page = await pending
+                cursor = next_cursor(cursor, page)
+                pending = asyncio.ensure_future(fetch(cursor)) if cursor is not None else None
+                for entity in page.get("data", []):
+                    yield entity
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session and the snapshot."""
+        await self.session.aclose()
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+    # --- Bulk Operations ---
+
+    async def bulk_create_glossary_terms(
+        self, terms: List[Dict[str, Any]], max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """Create many glossary terms, parents before children, with bounded concurrency.
+
+        Args:
+            terms: Term specs with name, display_name, description, glossary_fqn and optional parent_fqn
+            max_concurrency: Maximum number of create requests in flight at once
+
+        Returns:
+            Report with total/succeeded/failed counts and one result per spec, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(terms)
+        failed_fqns: set = set()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def create(index: int) -> None:
+            spec = terms[index]
+            try:
+                if spec.get("parent_fqn") in failed_fqns:
+                    raise OpenMetadataError(f"Parent term '{spec['parent_fqn']}' was not created")
+                async with semaphore:
+                    created = await self._create_term_from_spec(spec)
+                results[index] = self._term_result(index, spec, created, None)
+            except Exception as e:
+                failed_fqns.add(self._term_spec_fqn(spec))
+                results[index] = self._term_result(index, spec, None, e)
+
+        for level in self._plan_term_levels(terms):
+            await asyncio.gather(*(create(index) for index in level))
+        return self._bulk_report(results)
+
+    async def _resolve_update_targets(
+        self,
+        term_ids: Optional[List[str]],
+        term_fqns: Optional[List[str]],
+        glossary_id: Optional[str],
+        max_concurrency: int,
+    ) -> List[Dict[str, Any]]:
+        await self.load_snapshot()
+        targets = [
+            {"selector": term_id, "id": term_id, "fqn": self.fqn_index.get_fqn(GLOSSARY_TERM, term_id)}
+            for term_id in term_ids or []
+        ]
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def resolve(fqn: str) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    return {"selector": fqn, "id": await self.resolve_glossary_term_id(fqn), "fqn": fqn}
+            except Exception as e:
+                return {"selector": fqn, "id": None, "fqn": fqn, "error": e}
+
+        targets.extend(await asyncio.gather(*(resolve(fqn) for fqn in term_fqns or [])))
+        if glossary_id:
+            async for term in self.iter_glossary_terms(glossary_id=glossary_id, page_size=INDEX_WARM_PAGE_SIZE):
+                fqn = term["fullyQualifiedName"]
+                targets.append({"selector": fqn, "id": term["id"], "fqn": fqn})
+        return self._dedupe_targets(targets)
+
+    async def bulk_update_glossary_terms(
+        self,
+        patch_template: List[Dict[str, Any]],
+        term_ids: Optional[List[str]] = None,
+        term_fqns: Optional[List[str]] = None,
+        glossary_id: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        max_retries: int = DEFAULT_BULK_RETRIES,
+    ) -> Dict[str, Any]:
+        """Apply one JSON Patch template to many glossary terms concurrently.
+
+        Args:
+            patch_template: JSON Patch operations; $id, $fqn and $name in string values are substituted per term
+            term_ids: UUIDs of the terms to update
+            term_fqns: Fully qualified names of the terms to update
+            glossary_id: UUID of a glossary whose terms should all be updated
+            max_concurrency: Maximum number of PATCH requests in flight at once
+            max_retries: Retries per term on 429 or 5xx responses
+
+        Returns:
+            Report with total/succeeded/failed counts and one result per selected term
+        """
+        targets = await self._resolve_update_targets(term_ids, term_fqns, glossary_id, max_concurrency)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def update(target: Dict[str, Any]) -> Dict[str, Any]:
+            if target.get("error") is not None:
+                return self._update_result(target, None, target["error"], 0)
+            attempt = 0
+            while True:
+                try:
+                    patch = self._render_patch(patch_template, target["id"], target["fqn"])
+                    async with semaphore:
+                        updated = await self.update_glossary_term(term_id=target["id"], patch_data=patch)
+                    return self._update_result(target, updated, None, attempt + 1)
+                except Exception as e:
+                    if not self._should_retry_bulk_item(e, attempt, max_retries):
+                        return self._update_result(target, None, e, attempt + 1)
+                await asyncio.sleep(self._bulk_retry_delay(attempt))
+                attempt += 1
+
+        return self._bulk_report(list(await asyncio.gather(*(update(target) for target in targets))))
+
+    async def get_tables_batch(
+        self,
+        ids: Optional[List[str]] = None,
+        fqns: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Fetch many tables by ID and/or FQN concurrently; cached tables are served without a request.
+
+        Args:
+            ids: UUIDs of the tables
+            fqns: Fully qualified names of the tables
+            fields: Comma-separated list of fields to include
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            The found tables in input order under ``data``, and one entry per failed selector under ``errors``
+        """
+        selectors = self._batch_selectors(ids, fqns)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(selector: Tuple[str, str]) -> Tuple[Any, Optional[Exception]]:
+            kind, value = selector
+            get = self.get_table if kind == "id" else self.get_table_by_name
+            try:
+                async with semaphore:
+                    return await get(value, fields=fields), None
+            except Exception as e:
+                return None, e
+
+        return self._batch_report(selectors, list(await asyncio.gather(*(fetch(selector) for selector in selectors))))
+
+    async def get_glossary_terms_batch(
+        self,
+        ids: Optional[List[str]] = None,
+        fqns: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        include: str = "non-deleted",
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Fetch many glossary terms by ID and/or FQN concurrently; cached terms are served without a request.
+
+        Args:
+            ids: UUIDs of the terms
+            fqns: Fully qualified names of the terms
+            fields: Comma-separated list of fields to include
+            include: Include all, deleted, or non-deleted entities
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            The found terms in input order under ``data``, and one entry per failed selector under ``errors``
+        """
+        selectors = self._batch_selectors(ids, fqns)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(selector: Tuple[str, str]) -> Tuple[Any, Optional[Exception]]:
+            kind, value = selector
+            get = self.get_glossary_term if kind == "id" else self.get_glossary_term_by_name
+            try:
+                async with semaphore:
+                    return await get(value, fields=fields, include=include), None
+            except Exception as e:
+                return None, e
+
+        return self._batch_report(selectors, list(await asyncio.gather(*(fetch(selector) for selector in selectors))))
+
+    # --- Search Index ---
+
+    async def refresh_search_index(self) -> None:
+        """Stream every glossary term into the search index, re-indexing only changed terms.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        seen = set()
+        async for term in self.iter_glossary_terms(page_size=INDEX_WARM_PAGE_SIZE):
+            seen.add(term["id"])
+            self._observe_term(term)
+        self.search_index.replace_all(seen)
+
+    def schedule_search_index_refresh(self) -> None:
+        """Refresh the search index in the background unless a refresh is already running."""
+        if self._search_refresh_task is None or self._search_refresh_task.done():
+            self._search_refresh_task = asyncio.ensure_future(self._refresh_search_index_quietly())
+
+    async def _refresh_search_index_quietly(self) -> None:
+        try:
+            await self.refresh_search_index()
+        except Exception:
+            logger.exception("Background search index refresh failed")
+
+    # --- Glossary Graph ---
+
+    async def refresh_glossary_graph(self) -> None:
+        """Stream every glossary term with its related terms into the glossary graph.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        seen = set()
+        async for term in self.iter_glossary_terms(page_size=INDEX_WARM_PAGE_SIZE, fields="relatedTerms"):
+            seen.add(term["id"])
+            self.glossary_graph.upsert(term)
+        self.glossary_graph.replace_all(seen)
+
+    def schedule_glossary_graph_refresh(self) -> None:
+        """Refresh the glossary graph in the background unless a refresh is already running."""
+        if self._graph_refresh_task is None or self._graph_refresh_task.done():
+            self._graph_refresh_task = asyncio.ensure_future(self._refresh_glossary_graph_quietly())
+
+    async def _refresh_glossary_graph_quietly(self) -> None:
+        try:
+            await self.refresh_glossary_graph()
+        except Exception:
+            logger.exception("Background glossary graph refresh failed")
+
+    # --- Snapshot ---
+
+    def _load_snapshot(self) -> None:
+        # Reading the snapshot blocks, so load_snapshot does it on a worker thread before the first request
+        pass
+
+    async def load_snapshot(self) -> None:
+        """Seed the FQN index, search index and lookup cache from the on-disk snapshot, once.
+
+        The snapshot is read on a worker thread. Requests, tool calls and snapshot updates wait for
+        this first, so they never see state older than the snapshot.
+        """
+        if self.snapshot is None or self._snapshot_loaded:
+            return
+        if self._snapshot_load is None:
+            self._snapshot_load = asyncio.ensure_future(asyncio.to_thread(self._read_snapshot))
+        glossaries, terms = await asyncio.shield(self._snapshot_load)
+        if not self._snapshot_loaded:
+            self._snapshot_loaded = True
+            self._seed_from_snapshot(glossaries, terms)
+
+    async def apply_entity_change(
+        self, kind: str, entity: Optional[Dict[str, Any]] = None, entity_id: Optional[str] = None, deleted: bool = False
+    ) -> None:
+        """Apply a change made outside this client to the cache, FQN index, search index and snapshot.
+
+        Args:
+            kind: Entity kind, either "glossary" or "glossaryTerm"
+            entity: Current entity, required unless ``deleted`` (for a deletion, supplies its FQN if known)
+            entity_id: UUID of the entity; defaults to ``entity["id"]``
+            deleted: Whether the entity was deleted
+        """
+        await self.load_snapshot()
+        write = self._apply_entity_change(kind, entity, entity_id, deleted)
+        if write is not None:
+            await asyncio.to_thread(write)
+
+    async def revalidate_snapshot(self) -> None:
+        """Re-list every glossary and term and write only entities whose version or updatedAt changed.
+
+        Snapshot reads and writes run on worker threads.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        if self.snapshot is None:
+            return
+        await self.load_snapshot()
+        glossaries = await asyncio.to_thread(SnapshotRevalidation, self.snapshot, GLOSSARY)
+        async for glossary in self.iter_glossaries(page_size=INDEX_WARM_PAGE_SIZE):
+            if glossaries.observe(glossary):
+                await asyncio.to_thread(glossaries.flush)
+        self._finish_snapshot_kind(glossaries, await asyncio.to_thread(glossaries.finish))
+
+        terms = await asyncio.to_thread(SnapshotRevalidation, self.snapshot, GLOSSARY_TERM)
+        async for term in self.iter_glossary_terms(page_size=INDEX_WARM_PAGE_SIZE):
+            if terms.observe(term):
+                await asyncio.to_thread(terms.flush)
+            # The listing rebuilds the search index too; _finish_snapshot_kind drops terms it did not include
+            self._observe_term(term)
+        self._finish_snapshot_kind(terms, await asyncio.to_thread(terms.finish))
+        self.snapshot_revalidated_at = time.monotonic()
+
+    def schedule_snapshot_revalidation(self) -> None:
+        """Revalidate the snapshot in the background when it is due and no revalidation is running."""
+        if not self.snapshot_due:
+            return
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.ensure_future(self._revalidate_snapshot_quietly())
+
+    async def _revalidate_snapshot_quietly(self) -> None:
+        try:
+            await self.revalidate_snapshot()
+        except Exception:
+            logger.exception("Background snapshot revalidation failed")
+
+    # --- FQN Resolution ---
+
+    async def warm_glossary_index(self) -> None:
+        """Load the FQN <-> ID mapping of every glossary.
+
+        Raises:
+            OpenMetadataError: If the API request fails
+        """
+        async for _ in self.iter_glossaries(page_size=INDEX_WARM_PAGE_SIZE):
+            pass
+        self.fqn_index.mark_warm(GLOSSARY)
+
+    async def resolve_glossary_id(self, fqn: str) -> str:
+        """Resolve a glossary FQN to its UUID, hitting the API only when the index misses.
+
+        Args:
+            fqn: Fully qualified name of the glossary
+
+        Returns:
+            UUID of the glossary
+
+        Raises:
+            OpenMetadataError: If the glossary cannot be found
+        """
+        await self.load_snapshot()
+        glossary_id = self.fqn_index.get_id(GLOSSARY, fqn)
+        if glossary_id is None and not self.fqn_index.is_warm(GLOSSARY):
+            await self.warm_glossary_index()
+            glossary_id = self.fqn_index.get_id(GLOSSARY, fqn)
+        if glossary_id is None:
+            glossary_id = (await self.get_glossary_by_name(fqn=fqn)).get("id")
+        if not glossary_id:
+            raise OpenMetadataError(f"Could not find ID for glossary FQN '{fqn}'")
+        return glossary_id
+
+    async def resolve_glossary_term_id(self, fqn: str) -> str:
+        """Resolve a glossary term FQN to its UUID, hitting the API only when the index misses.
+
+        Args:
+            fqn: Fully qualified name of the glossary term
+
+        Returns:
+            UUID of the glossary term
+
+        Raises:
+            OpenMetadataError: If the glossary term cannot be found
+        """
+        await self.load_snapshot()
+        term_id = self.fqn_index.get_id(GLOSSARY_TERM, fqn)
+        if term_id is None:
+            term_id = (await self.get_glossary_term_by_name(fqn=fqn)).get("id")
+        if not term_id:
+            raise OpenMetadataError(f"Could not find ID for glossary term FQN '{fqn}'")
+        return term_id
+
+    # --- Glossary Tree ---
+
+    async def get_glossary_tree(
+        self,
+        glossary_fqn: str,
+        root_fqn: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        node_fields: Tuple[str, ...] = (),
+        include: str = "non-deleted",
+    ) -> Dict[str, Any]:
+        """Build a glossary's term hierarchy from a few paged bulk listings instead of one request per node.
+
+        Args:
+            glossary_fqn: Fully qualified name of the glossary
+            root_fqn: FQN of the term whose subtree is returned (default: the whole glossary)
+            max_depth: Levels of terms below the root to include (default: unlimited)
+            node_fields: Extra entity fields copied onto every node (e.g. description, synonyms, tags)
+            include: Include all, deleted, or non-deleted entities (default: non-deleted)
+
+        Returns:
+            Nested term tree, see ``build_glossary_tree``
+
+        Raises:
+            OpenMetadataError: If the glossary or the root term cannot be found
+        """
+        glossary_id = await self.resolve_glossary_id(glossary_fqn)
+        terms = [
+            term
+            async for term in self.iter_glossary_terms(
+                glossary_id=glossary_id, page_size=INDEX_WARM_PAGE_SIZE, fields=api_fields(node_fields), include=include
+            )
+        ]
+        try:
+            return build_glossary_tree(terms, glossary_fqn, root_fqn, max_depth, node_fields)
+        except KeyError:
+            raise OpenMetadataError(f"Glossary term '{root_fqn}' is not part of glossary '{glossary_fqn}'") from None
@@ -0,0 +1,247 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Tuple
+
+# Identifies the caller of a tool when the transport has no MCP session object (stateless HTTP)
+CALLER_KEY: ContextVar[Optional[str]] = ContextVar("quota_caller_key", default=None)
+
+# Number of tracked callers above which idle ones are forgotten
+MAX_TRACKED_CALLERS = 1024
+
+
+@dataclass(frozen=True)
+class QuotaPolicy:
+    """Limits applied to one caller, or to one caller's calls of one tool.
+
+    Attributes:
+        rate: Calls per second refilled into the token bucket (0 means unlimited)
+        burst: Calls that may be made at once before the rate applies
+        max_in_flight: Calls that may run concurrently (0 means unlimited)
+    """
+
+    rate: float = 0.0
+    burst: int = 1
+    max_in_flight: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 or self.max_in_flight > 0
+
+
+def parse_tool_quotas(spec: Optional[str]) -> Dict[str, QuotaPolicy]:
+    """Parse ``name=rate:burst:max_in_flight`` entries separated by commas.
+
+    ``name`` is a tool name or a concurrency class (read, write, bulk, local); trailing parts may be
+    omitted, e.g. ``export_glossary_terms=0.2:1:1,bulk=1``.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    policies = {}
+    for entry in (spec or "").split(","):
+        if not entry.strip():
+            continue
+        error = f"Invalid tool quota {entry.strip()!r}; expected name=rate:burst:max_in_flight"
+        name, separator, limits = entry.partition("=")
+        parts = limits.split(":")
+        if not separator or not name.strip() or len(parts) > 3:
+            raise ValueError(error)
+        try:
+            rate = float(parts[0]) if parts[0] else 0.0
+            burst = int(parts[1]) if len(parts) > 1 and parts[1] else max(1, int(rate))
+            max_in_flight = int(parts[2]) if len(parts) > 2 and parts[2] else 0
+        except ValueError:
+            raise ValueError(error) from None
+        policies[name.strip()] = QuotaPolicy(rate=rate, burst=max(1, burst), max_in_flight=max_in_flight)
+    return policies
+
+
+class QuotaExceededError(Exception):
+    """A tool call was rejected because the caller is over a rate or concurrency limit.
+
+    The message is a JSON object so clients can act on it: ``{"error": "quota_exceeded", "limit": ...,
+    "scope": ..., "tool": ..., "retry_after": ...}``.
+    """
+
+    def __init__(self, limit: str, scope: str, tool: str, retry_after: Optional[float]):
+        self.limit = limit
+        self.scope = scope
+        self.tool = tool
+        self.retry_after = retry_after
+        super().__init__(json.dumps(self.to_dict()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        limits = {"rate": "rate limit", "in_flight": "concurrent call limit"}
+        return {
+            "error": "quota_exceeded",
+            "limit": self.limit,
+            "scope": self.scope,
+            "tool": self.tool,
+            "retry_after": None if self.retry_after is None else round(self.retry_after, 3),
+            "message": f"Over the {self.scope} {limits[self.limit]} for {self.tool}; retry later",
+        }
+
+
+class _TokenBucket:
+    """Token bucket that hands out reservations, so waiting callers are served in arrival order."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Take a token, possibly borrowing against future refills; return the seconds to wait for it."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+    def refund(self) -> None:
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def idle(self, now: float) -> bool:
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+
+class _Limiter:
+    def __init__(self, policy: QuotaPolicy):
+        self.bucket = _TokenBucket(policy.rate, policy.burst) if policy.rate > 0 else None
+        self.slots = asyncio.Semaphore(policy.max_in_flight) if policy.max_in_flight > 0 else None
+        self.in_flight = 0
+
+    def idle(self, now: float) -> bool:
+        return self.in_flight == 0 and (self.bucket is None or self.bucket.idle(now))
+
+
+class AdmissionController:
+    """Per-caller and per-caller-per-tool token-bucket rate limits and in-flight quotas.
+
+    A call over a limit waits its turn (rate limits hand out reservations in arrival order, and
+    in-flight slots are granted first come, first served) for at most ``max_wait`` seconds; calls
+    that would wait longer are rejected immediately with QuotaExceededError.
+    """
+
+    def __init__(
+        self,
+        session_policy: Optional[QuotaPolicy] = None,
+        tool_policies: Optional[Dict[str, QuotaPolicy]] = None,
+        max_wait: float = 1.0,
+    ):
+        """Initialize the controller.
+
+        Args:
+            session_policy: Limits on all of a caller's tool calls together (default: unlimited)
+            tool_policies: Limits on a caller's calls of one tool, by tool name or concurrency class
+            max_wait: Seconds an over-limit call may be queued before it is rejected instead
+        """
+        self.session_policy = session_policy or QuotaPolicy()
+        self.tool_policies = {name: policy for name, policy in (tool_policies or {}).items() if policy.enabled}
+        self.max_wait = max_wait
+        self.rejected = 0
+        self._limiters: Dict[Tuple[Hashable, Optional[str]], _Limiter] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.session_policy.enabled or bool(self.tool_policies)
+
+    def _policy_for(self, tool: str, concurrency: str) -> Optional[Tuple[str, QuotaPolicy]]:
+        # A tool's own policy wins; a concurrency class policy is shared by every tool of the class
+        for name in (tool, concurrency):
+            if name in self.tool_policies:
+                return name, self.tool_policies[name]
+        return None
+
+    def _limiter(self, key: Tuple[Hashable, Optional[str]], policy: QuotaPolicy) -> _Limiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            if len(self._limiters) >= MAX_TRACKED_CALLERS:
+                now = time.monotonic()
+                for stale in [tracked for tracked, existing in self._limiters.items() if existing.idle(now)]:
+                    del self._limiters[stale]
+            limiter = self._limiters[key] = _Limiter(policy)
+        return limiter
+
+    def _reject(self, limit: str, scope: str, tool: str, retry_after: Optional[float]) -> QuotaExceededError:
+        self.rejected += 1
+        return QuotaExceededError(limit, scope, tool, retry_after)
+
+    def _scoped_limiters(self, caller: Hashable, tool: str, concurrency: str) -> List[Tuple[str, _Limiter]]:
+        scoped: List[Tuple[str, _Limiter]] = []
+        if self.session_policy.enabled:
+            scoped.append(("session", self._limiter((caller, None), self.session_policy)))
+        tool_policy = self._policy_for(tool, concurrency)
+        if tool_policy is not None:
+            name, policy = tool_policy
+            scoped.append(("tool", self._limiter((caller, name), policy)))
+        return scoped
+
+    async def _reserve_rate(self, scoped: List[Tuple[str, _Limiter]], tool: str) -> List[_TokenBucket]:
+        # Takes a token from every rate-limited scope and waits for the latest of them; returns the buckets
+        now = time.monotonic()
+        reserved: List[_TokenBucket] = []
+        wait = 0.0
+        for scope, limiter in scoped:
+            if limiter.bucket is None:
+                continue
+            reserved.append(limiter.bucket)
+            needed = limiter.bucket.reserve(now)
+            if needed > self.max_wait:
+                for bucket in reserved:
+                    bucket.refund()
+                raise self._reject("rate", scope, tool, needed)
+            wait = max(wait, needed)
+        if wait:
+            await asyncio.sleep(wait)
+        return reserved
+
+    async def _acquire_slots(
+        self, scoped: List[Tuple[str, _Limiter]], tool: str, deadline: float, acquired: List[_Limiter]
+    ) -> None:
+        # Appends each limiter to ``acquired`` as its slot is taken, so the caller releases exactly those
+        for scope, limiter in scoped:
+            if limiter.slots is not None:
+                remaining = deadline - time.monotonic()
+                if limiter.slots.locked() and remaining <= 0:
+                    raise self._reject("in_flight", scope, tool, None)
+                try:
+                    await asyncio.wait_for(limiter.slots.acquire(), max(remaining, 0.001))
+                except asyncio.TimeoutError:
+                    raise self._reject("in_flight", scope, tool, None) from None
+            limiter.in_flight += 1
+            acquired.append(limiter)
+
+    @asynccontextmanager
+    async def admit(self, caller: Hashable, tool: str, concurrency: str) -> AsyncIterator[None]:
+        """Hold the caller's quotas for one call of ``tool`` for the duration of the block.
+
+        Raises:
+            QuotaExceededError: If the call would have to wait longer than ``max_wait``
+        """
+        scoped = self._scoped_limiters(caller, tool, concurrency)
+        if not scoped:
+            yield
+            return
+
+        deadline = time.monotonic() + self.max_wait
+        reserved = await self._reserve_rate(scoped, tool)
+        acquired: List[_Limiter] = []
+        try:
+            try:
+                await self._acquire_slots(scoped, tool, deadline, acquired)
+            except QuotaExceededError:
+                # A call rejected for in-flight slots never runs, so it gives back its rate tokens
+                for bucket in reserved:
+                    bucket.refund()
+                raise
+            yield
+        finally:
+            for limiter in acquired:
+                limiter.in_flight -= 1
+                if limiter.slots is not None:
+                    limiter.slots.release()
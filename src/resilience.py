@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be replayed without changing the outcome on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses worth retrying for idempotent requests
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Transport errors raised before the request reached the server, safe to retry for any method
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass
+class RetryPolicy:
+    """How failed OpenMetadata requests are retried.
+
+    Idempotent requests are retried on 429/502/503/504 and transport errors; other requests only on
+    429 and on errors raised before the request was sent.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    max_delay: float = 10.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given zero-based attempt."""
+        return random.uniform(0, min(self.max_delay, self.backoff_base * (2**attempt)))
+
+    def delay_for(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Return how long to wait before retrying, or None if the request should not be retried."""
+        if attempt >= self.max_retries:
+            return None
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            retryable = isinstance(error, UNSENT_ERRORS) or (idempotent and isinstance(error, httpx.TransportError))
+            return self.backoff(attempt) if retryable else None
+        if response is None or response.status_code not in RETRYABLE_STATUSES:
+            return None
+        if response.status_code != 429 and not idempotent:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures (5xx responses or transport errors) the circuit
+    opens and requests fail fast for ``reset_timeout`` seconds. A single trial request is then let
+    through; its outcome closes the circuit or opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (0 disables the breaker)
+            reset_timeout: Seconds the circuit stays open before a trial request is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def blocked_reason(self) -> Optional[str]:
+        """Return why a request must not be sent right now, or None to let it through."""
+        if self.failure_threshold <= 0:
+            return None
+        with self._lock:
+            if self.state == self.CLOSED:
+                return None
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    return f"OpenMetadata circuit is open; retry in {remaining:.1f}s"
+                self.state = self.HALF_OPEN
+            # A trial that never reported back (e.g. a cancelled task) stops blocking after reset_timeout
+            if self._trial_in_flight and time.monotonic() - self._trial_started_at < self.reset_timeout:
+                return "OpenMetadata circuit is half-open; a trial request is in flight"
+            self._trial_in_flight = True
+            self._trial_started_at = time.monotonic()
+            return None
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("OpenMetadata circuit closed")
+            self.state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("OpenMetadata circuit opened after %d consecutive failures", self._failures)
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_response(self, response: httpx.Response) -> None:
+        if response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
@@ -0,0 +1,255 @@
+from bisect import bisect_left
+from collections import Counter
+from itertools import islice
+import math
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[0-9a-z])(?=[A-Z])")
+
+# Relative weight of each indexed field in a term's bag of words
+FIELD_WEIGHTS = {"name": 3.0, "displayName": 3.0, "synonyms": 2.0, "description": 1.0}
+
+# Score multipliers for query tokens matched through expansion instead of exactly
+PREFIX_MATCH_WEIGHT = 0.8
+FUZZY_MATCH_WEIGHT = 0.5
+
+# Score multiplier for terms whose name or display name is exactly the query
+EXACT_NAME_BOOST = 2.0
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Length of the description excerpt kept per term for search results
+DESCRIPTION_EXCERPT_LENGTH = 200
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric tokens, breaking camelCase words apart."""
+    return TOKEN_PATTERN.findall(CAMEL_CASE_BOUNDARY.sub(" ", text).lower()) if text else []
+
+
+def _within_edit_distance(a: str, b: str, max_distance: int) -> bool:
+    """Bounded Levenshtein check that gives up as soon as every row exceeds ``max_distance``."""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > max_distance:
+            return False
+        previous = current
+    return previous[-1] <= max_distance
+
+
+class GlossarySearchIndex:
+    """In-process inverted index over glossary terms with BM25 ranking.
+
+    Indexes name, displayName, synonyms and description. Query tokens match exactly, as a prefix of
+    an indexed token, or within a small edit distance. Terms are added and removed one at a time, so
+    the index can be kept current from individual API responses between full refreshes.
+    """
+
+    def __init__(self, max_age: float = 300.0):
+        """Initialize the index.
+
+        Args:
+            max_age: Seconds after the last full refresh before the index is considered stale
+        """
+        self.max_age = max_age
+        self.refreshed_at: Optional[float] = None
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._doc_tokens: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._name_keys: Dict[str, Set[str]] = {}
+        self._total_length = 0.0
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._sorted_vocabulary: Optional[List[str]] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, term_id: str) -> bool:
+        return term_id in self._docs
+
+    @property
+    def is_built(self) -> bool:
+        return self.refreshed_at is not None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at >= self.max_age
+
+    def version_of(self, term_id: str) -> Optional[Any]:
+        """Return the ``updatedAt`` of an indexed term, or None if it is not indexed."""
+        doc = self._docs.get(term_id)
+        return doc.get("updatedAt") if doc else None
+
+    @staticmethod
+    def _weighted_tokens(term: Dict[str, Any]) -> Dict[str, float]:
+        weights: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            value = term.get(field)
+            values = value if isinstance(value, list) else [value]
+            for text in values:
+                for token in tokenize(text if isinstance(text, str) else None):
+                    weights[token] += weight
+        return dict(weights)
+
+    def upsert(self, term: Dict[str, Any]) -> None:
+        """Add a glossary term entity, replacing any previous version of it."""
+        term_id = term.get("id")
+        if not term_id:
+            return
+        fqn = term.get("fullyQualifiedName") or ""
+        glossary = term.get("glossary")
+        glossary_fqn = glossary.get("fullyQualifiedName") if isinstance(glossary, dict) else fqn.split(".", 1)[0]
+        tokens = self._weighted_tokens(term)
+        with self._lock:
+            self._remove_locked(term_id)
+            self._docs[term_id] = {
+                "id": term_id,
+                "fullyQualifiedName": fqn,
+                "name": term.get("name"),
+                "displayName": term.get("displayName"),
+                "glossary": glossary_fqn,
+                "description": (term.get("description") or "")[:DESCRIPTION_EXCERPT_LENGTH],
+                "updatedAt": term.get("updatedAt"),
+            }
+            self._doc_tokens[term_id] = tokens
+            self._name_keys[term_id] = {" ".join(tokenize(term.get(field))) for field in ("name", "displayName")}
+            length = sum(tokens.values())
+            self._doc_lengths[term_id] = length
+            self._total_length += length
+            for token, weight in tokens.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    self._sorted_vocabulary = None
+                postings[term_id] = weight
+
+    def remove(self, term_id: str) -> None:
+        with self._lock:
+            self._remove_locked(term_id)
+
+    def _remove_locked(self, term_id: str) -> None:
+        tokens = self._doc_tokens.pop(term_id, None)
+        if tokens is None:
+            return
+        self._docs.pop(term_id, None)
+        self._name_keys.pop(term_id, None)
+        self._total_length -= self._doc_lengths.pop(term_id, 0.0)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(term_id, None)
+            if not postings:
+                del self._postings[token]
+                self._sorted_vocabulary = None
+
+    def remove_prefix(self, fqn: str) -> None:
+        """Remove a term and every term nested under its FQN."""
+        prefix = f"{fqn}."
+        with self._lock:
+            stale = [
+                term_id
+                for term_id, doc in self._docs.items()
+                if doc["fullyQualifiedName"] == fqn or doc["fullyQualifiedName"].startswith(prefix)
+            ]
+            for term_id in stale:
+                self._remove_locked(term_id)
+
+    def replace_all(self, term_ids: Set[str]) -> None:
+        """Finish a full refresh: drop every term not seen in it and mark the index fresh."""
+        with self._lock:
+            for term_id in [term_id for term_id in self._docs if term_id not in term_ids]:
+                self._remove_locked(term_id)
+            self.refreshed_at = time.monotonic()
+
+    def _vocabulary(self) -> List[str]:
+        if self._sorted_vocabulary is None:
+            self._sorted_vocabulary = sorted(self._postings)
+        return self._sorted_vocabulary
+
+    def _expand(self, token: str, prefix: bool, fuzzy: bool) -> Iterable[Tuple[str, float]]:
+        if token in self._postings:
+            yield token, 1.0
+        vocabulary = self._vocabulary()
+        if prefix and len(token) >= 2:
+            for candidate in islice(vocabulary, bisect_left(vocabulary, token), None):
+                if not candidate.startswith(token):
+                    break
+                if candidate != token:
+                    yield candidate, PREFIX_MATCH_WEIGHT
+        if fuzzy and len(token) >= 4 and token not in self._postings:
+            max_distance = 1 if len(token) < 8 else 2
+            for candidate in vocabulary:
+                if candidate[0] == token[0] and _within_edit_distance(token, candidate, max_distance):
+                    yield candidate, FUZZY_MATCH_WEIGHT
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        glossary_fqn: Optional[str] = None,
+        prefix: bool = True,
+        fuzzy: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Rank indexed terms against ``query`` with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            glossary_fqn: Only return terms of this glossary
+            prefix: Whether query tokens also match indexed tokens they are a prefix of
+            fuzzy: Whether query tokens without an exact match also match tokens within a small edit distance
+
+        Returns:
+            Matching terms, best first, each with its ``score``
+        """
+        with self._lock:
+            doc_count = len(self._docs)
+            if not doc_count:
+                return []
+            average_length = self._total_length / doc_count or 1.0
+            scores: Dict[str, float] = {}
+            query_tokens = tokenize(query)
+            for token in set(query_tokens):
+                matched: Dict[str, float] = {}
+                for candidate, weight in self._expand(token, prefix, fuzzy):
+                    matched[candidate] = max(weight, matched.get(candidate, 0.0))
+                for candidate, weight in matched.items():
+                    postings = self._postings[candidate]
+                    idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for term_id, tf in postings.items():
+                        if glossary_fqn and self._docs[term_id]["glossary"] != glossary_fqn:
+                            continue
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[term_id] / average_length)
+                        score = weight * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                        scores[term_id] = scores.get(term_id, 0.0) + score
+
+            query_key = " ".join(query_tokens)
+            for term_id in scores:
+                if query_key in self._name_keys[term_id]:
+                    scores[term_id] *= EXACT_NAME_BOOST
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[: max(1, limit)]
+            return [{**self._docs[term_id], "score": round(score, 4)} for term_id, score in ranked]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._doc_tokens.clear()
+            self._doc_lengths.clear()
+            self._name_keys.clear()
+            self._postings.clear()
+            self._total_length = 0.0
+            self._sorted_vocabulary = None
+            self.refreshed_at = None
@@ -1,38 +1,181 @@
-from typing import Callable
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional, get_args
 
 import anyio
+from mcp import types
+from mcp.server import Server
 from mcp.server.stdio import stdio_server
+from mcp.shared.exceptions import McpError
+from pydantic import ValidationError
 from starlette.applications import Starlette
 
+from src.metrics import CONTENT_TYPE, Metrics
+from src.quotas import CALLER_KEY
+
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
 
 def get_server_runner(app: Starlette, transport: str, **kwargs) -> Callable:
     if transport == "stdio":
         return _get_stdio_server_runner(app)
     elif transport == "sse":
         port = kwargs.pop("port")
-        return _get_sse_server_runner(app, port)
+        workers = kwargs.pop("workers", 1)
+        debug = kwargs.pop("debug", False)
+        if workers > 1:
+            from src.sse_workers import get_multi_worker_sse_runner
+
+            return get_multi_worker_sse_runner(port, workers, debug=debug, **kwargs)
+        return _get_sse_server_runner(app, port, metrics=kwargs.pop("metrics", None), debug=debug)
+    elif transport == "streamable-http":
+        if kwargs.get("workers", 1) > 1:
+            raise ValueError("streamable-http is stateless; run several instances behind a load balancer instead")
+        return _get_http_server_runner(
+            app, kwargs.pop("port"), metrics=kwargs.pop("metrics", None), debug=kwargs.pop("debug", False)
+        )
     else:
         raise ValueError(f"Invalid transport: {transport}")
 
 
-def _get_sse_server_runner(app: Starlette, port: int) -> Callable:
+def create_sse_app(
+    app: Starlette, messages_path: str = "/messages/", metrics: Optional[Metrics] = None, debug: bool = False
+) -> Starlette:
+    """Build the Starlette app serving one MCP server over SSE, plus ``/metrics`` when given a registry."""
+    from mcp.server.sse import SseServerTransport
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+
+    sse = SseServerTransport(messages_path)
+
+    async def handle_sse(request):
+        async with sse.connect_sse(request.scope, request.receive, request._send) as streams:
+            await app.run(streams[0], streams[1], app.create_initialization_options())
+
+    routes: List = [
+        Route("/sse", endpoint=handle_sse),
+        Mount(messages_path, app=sse.handle_post_message),
+    ]
+    if metrics is not None:
+
+        async def handle_metrics(request):
+            return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+        routes.append(Route("/metrics", endpoint=handle_metrics))
+
+    return Starlette(debug=debug, routes=routes)
+
+
+def _get_sse_server_runner(
+    app: Starlette, port: int, metrics: Optional[Metrics] = None, debug: bool = False
+) -> Callable:
     def run():
-        from mcp.server.sse import SseServerTransport
-        from starlette.routing import Mount, Route
+        starlette_app = create_sse_app(app, metrics=metrics, debug=debug)
 
-        sse = SseServerTransport("/messages/")
+        import uvicorn
+
+        uvicorn.run(starlette_app, host="0.0.0.0", port=port)
+        return 0
+
+    return run
 
-        async def handle_sse(request):
-            async with sse.connect_sse(request.scope, request.receive, request._send) as streams:
-                await app.run(streams[0], streams[1], app.create_initialization_options())
 
-        starlette_app = Starlette(
-            debug=True,
-            routes=[
-                Route("/sse", endpoint=handle_sse),
-                Mount("/messages/", app=sse.handle_post_message),
-            ],
+def _jsonrpc_error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+async def handle_jsonrpc_message(app: Server, message: Any) -> Optional[Dict[str, Any]]:
+    """Answer one JSON-RPC message with the server's request handlers, without a session.
+
+    Notifications (messages without an ``id``) get no response: with no session there is no
+    state for them to change.
+    """
+    if not isinstance(message, dict):
+        return _jsonrpc_error(None, types.INVALID_REQUEST, "Invalid request")
+    if message.get("jsonrpc") != "2.0" or not isinstance(message.get("method"), str):
+        return _jsonrpc_error(message.get("id"), types.INVALID_REQUEST, "Invalid request")
+    if "id" not in message:
+        return None
+    request_id, method = message["id"], message["method"]
+
+    if method == "initialize":
+        options = app.create_initialization_options()
+        result: types.Result = types.InitializeResult(
+            protocolVersion=types.LATEST_PROTOCOL_VERSION,
+            capabilities=options.capabilities,
+            serverInfo=types.Implementation(name=options.server_name, version=options.server_version),
         )
+    else:
+        try:
+            request = types.ClientRequest.model_validate({"method": method, "params": message.get("params")}).root
+        except ValidationError:
+            handled = [get_args(t.model_fields["method"].annotation) for t in app.request_handlers]
+            if (method,) in handled:
+                return _jsonrpc_error(request_id, types.INVALID_PARAMS, f"Invalid params for {method}")
+            return _jsonrpc_error(request_id, types.METHOD_NOT_FOUND, "Method not found")
+        handler = app.request_handlers.get(type(request))
+        if handler is None:
+            return _jsonrpc_error(request_id, types.METHOD_NOT_FOUND, "Method not found")
+        try:
+            result = (await handler(request)).root
+        except McpError as e:
+            return {"jsonrpc": "2.0", "id": request_id, "error": e.error.model_dump(mode="json", exclude_none=True)}
+        except Exception as e:
+            return _jsonrpc_error(request_id, types.INTERNAL_ERROR, str(e))
+
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": result.model_dump(by_alias=True, mode="json", exclude_none=True),
+    }
+
+
+def create_http_app(
+    app: Server, path: str = "/mcp", metrics: Optional[Metrics] = None, debug: bool = False
+) -> Starlette:
+    """Build the Starlette app serving one MCP server over stateless Streamable HTTP.
+
+    Every JSON-RPC message (or batch) is POSTed to ``path`` and answered in the same HTTP response
+    as ``application/json``. No session is kept and no server-initiated stream is offered, so any
+    instance can answer any request.
+    """
+    from starlette.responses import JSONResponse, Response
+    from starlette.routing import Route
+
+    async def handle_mcp(request):
+        if request.method != "POST":
+            return Response(status_code=405, headers={"Allow": "POST"})
+        # Quotas apply per client-chosen session ID, or per client address without one
+        CALLER_KEY.set(request.headers.get("mcp-session-id") or (request.client.host if request.client else None))
+        try:
+            body = json.loads(await request.body())
+        except ValueError:
+            return JSONResponse(_jsonrpc_error(None, types.PARSE_ERROR, "Parse error"), status_code=400)
+
+        if isinstance(body, list):
+            if not body:
+                return JSONResponse(_jsonrpc_error(None, types.INVALID_REQUEST, "Empty batch"), status_code=400)
+            # Messages of a batch are independent, so they are answered concurrently
+            answers = await asyncio.gather(*(handle_jsonrpc_message(app, message) for message in body))
+            responses = [answer for answer in answers if answer is not None]
+            return JSONResponse(responses) if responses else Response(status_code=202)
+        response = await handle_jsonrpc_message(app, body)
+        return JSONResponse(response) if response is not None else Response(status_code=202)
+
+    routes: List = [Route(path, endpoint=handle_mcp, methods=["GET", "POST", "DELETE"])]
+    if metrics is not None:
+
+        async def handle_metrics(request):
+            return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+        routes.append(Route("/metrics", endpoint=handle_metrics))
+
+    return Starlette(debug=debug, routes=routes)
+
+
+def _get_http_server_runner(app: Server, port: int, metrics: Optional[Metrics] = None, debug: bool = False) -> Callable:
+    def run():
+        starlette_app = create_http_app(app, metrics=metrics, debug=debug)
 
         import uvicorn
 
@@ -0,0 +1,293 @@
+"""Cache shared by several server processes over a local Unix socket.
+
+A small line-delimited JSON protocol in front of a TTLCache, so SSE workers started with ``--workers``
+see each other's cached lookups. Run standalone with ``python -m src.shared_cache SOCKET_PATH``.
+"""
+
+import asyncio
+from concurrent.futures import Future
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+import click
+
+from src.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cache operation may take before the caller treats it as a miss
+SHARED_CACHE_TIMEOUT = 0.5
+
+# Operations waiting to be sent beyond which new writes are dropped
+SHARED_CACHE_MAX_PENDING = 1024
+
+
+def _encode_key(key: Hashable) -> str:
+    return json.dumps(key, separators=(",", ":"), default=str)
+
+
+class _CacheRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        cache: TTLCache = self.server.cache  # type: ignore[attr-defined]
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = self._dispatch(cache, request)
+                response["size"] = len(cache)
+            except Exception as e:
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+
+    @staticmethod
+    def _dispatch(cache: TTLCache, request: Any) -> Any:
+        op = request["op"]
+        if op == "get":
+            value = cache.get(request["key"])
+            return {"hit": value is not None, "value": value}
+        if op == "set":
+            cache.set(request["key"], request["value"])
+            return {}
+        if op == "keys":
+            return {"keys": cache.keys()}
+        if op == "delete":
+            keys = set(request["keys"])
+            return {"deleted": cache.invalidate(lambda key: key in keys)}
+        if op == "delete_prefixes":
+            prefixes = tuple(request["prefixes"])
+            return {"deleted": cache.invalidate(lambda key: key.startswith(prefixes))}
+        if op == "clear":
+            cache.clear()
+            return {}
+        if op == "size":
+            return {"size": len(cache)}
+        raise ValueError(f"Unknown cache operation: {op}")
+
+
+class _UnixCacheServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class SharedCacheServer:
+    """Serves one TTLCache on a Unix socket from a background thread."""
+
+    def __init__(self, path: str, ttl: float = 60.0, max_entries: int = 1024):
+        """Create the server; ``start`` begins accepting connections.
+
+        Args:
+            path: Path of the Unix socket (an existing stale socket file is replaced)
+            ttl: Seconds an entry stays valid after it is stored
+            max_entries: Maximum number of entries kept before the least recently used is evicted
+        """
+        self.path = path
+        if os.path.exists(path):
+            os.unlink(path)
+        self._server = _UnixCacheServer(path, _CacheRequestHandler)
+        self._server.cache = TTLCache(ttl=ttl, max_entries=max_entries)  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="shared-cache", daemon=True)
+
+    def start(self) -> "SharedCacheServer":
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class SharedCache:
+    """TTLCache-compatible client of a SharedCacheServer.
+
+    Keys and values must be JSON-serializable; tuple keys come back as lists when matched against
+    an ``invalidate`` predicate. When the server cannot be reached every lookup misses and writes
+    are dropped, so the client keeps working uncached.
+
+    Every operation is sent by one worker thread in the order it was issued. Writes and
+    invalidations are queued without waiting for the server, and ``aget`` awaits a lookup without
+    blocking the event loop, so the cache is safe to use from async code.
+    """
+
+    def __init__(self, path: str, ttl: float = 60.0, max_entries: int = 1024):
+        """Initialize the client.
+
+        Args:
+            path: Path of the server's Unix socket
+            ttl: Expiry of entries, used only to decide whether caching is enabled (the server applies its own)
+            max_entries: Entry limit, used only to decide whether caching is enabled
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Number of entries the server reported in its last response
+        self.size = 0
+        self._socket: Optional[socket.socket] = None
+        self._reader: Any = None
+        self._available = True
+        self._pending: "queue.Queue[Optional[Tuple[Callable[[], Any], Optional[Future]]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _submit(self, job: Callable[[], Any], wait: bool) -> Optional[Future]:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._work, name="shared-cache-client", daemon=True)
+                self._worker.start()
+        future: Optional[Future] = Future() if wait else None
+        self._pending.put((job, future))
+        return future
+
+    def _send(self, request: Any) -> None:
+        if request["op"] == "set" and self._pending.qsize() >= SHARED_CACHE_MAX_PENDING:
+            # The server is not keeping up; skipping a write only costs a later miss
+            return
+        self._submit(lambda: self._call(request), wait=False)
+
+    def _ask(self, request: Any) -> Future:
+        return self._submit(lambda: self._call(request), wait=True)
+
+    def _work(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                self._disconnect()
+                return
+            job, future = item
+            try:
+                result = job()
+            except Exception as e:
+                logger.warning("Shared cache operation failed: %s", e)
+                result = None
+            if future is not None:
+                future.set_result(result)
+
+    def _call(self, request: Any) -> Optional[Any]:
+        # Runs on the worker thread only
+        try:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.settimeout(SHARED_CACHE_TIMEOUT)
+                self._socket.connect(self.path)
+                self._reader = self._socket.makefile("rb")
+            self._socket.sendall(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+            response = json.loads(self._reader.readline())
+        except (OSError, ValueError) as e:
+            self._disconnect()
+            if self._available:
+                logger.warning("Shared cache at %s is unavailable: %s", self.path, e)
+                self._available = False
+            return None
+        if not self._available:
+            logger.info("Shared cache at %s is available again", self.path)
+            self._available = True
+        if "error" in response:
+            logger.warning("Shared cache error: %s", response["error"])
+            return None
+        self.size = response.get("size", self.size)
+        return response
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._reader = None
+
+    def __len__(self) -> int:
+        # Reported with every response, so reading it never waits for the server
+        return self.size
+
+    def _lookup(self, response: Optional[Any]) -> Optional[Any]:
+        if response and response["hit"]:
+            self.hits += 1
+            return response["value"]
+        self.misses += 1
+        return None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if it is missing, expired or the server is down."""
+        if not self.enabled:
+            return None
+        return self._lookup(self._ask({"op": "get", "key": _encode_key(key)}).result())
+
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        """Like ``get``, awaiting the server's response instead of blocking the event loop."""
+        if not self.enabled:
+            return None
+        return self._lookup(await asyncio.wrap_future(self._ask({"op": "get", "key": _encode_key(key)})))
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.enabled:
+            self._send({"op": "set", "key": _encode_key(key), "value": value})
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``.
+
+        Every key is fetched from the server to be matched here; prefer ``invalidate_prefixes``.
+
+        Returns:
+            Number of entries removed
+        """
+
+        def job() -> int:
+            response = self._call({"op": "keys"})
+            if not response:
+                return 0
+            stale: List[str] = [key for key in response["keys"] if predicate(json.loads(key))]
+            if not stale:
+                return 0
+            response = self._call({"op": "delete", "keys": stale})
+            return response["deleted"] if response else 0
+
+        return self._submit(job, wait=True).result()
+
+    def invalidate_prefixes(self, prefixes: Iterable[Hashable]) -> None:
+        """Drop every entry whose key's first element is one of ``prefixes``, in one request to the server.
+
+        The request is queued; it is applied before any operation issued after it.
+        """
+        self._send({"op": "delete_prefixes", "prefixes": [_encode_key([prefix])[:-1] + "," for prefix in prefixes]})
+
+    def clear(self) -> None:
+        self._send({"op": "clear"})
+
+    def close(self) -> None:
+        """Stop the worker once the operations already queued are sent."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._pending.put(None)
+                self._worker = None
+
+
+@click.command()
+@click.argument("path")
+@click.option("--ttl", default=60.0, help="Seconds an entry stays valid")
+@click.option("--max-entries", default=1024, help="Maximum number of entries")
+def main(path: str, ttl: float, max_entries: int) -> None:
+    server = SharedCacheServer(path, ttl=ttl, max_entries=max_entries)
+    click.echo(f"Serving shared cache on {path}")
+    try:
+        server.serve_forever()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Number of changed entities buffered before they are written in one transaction
+SNAPSHOT_WRITE_BATCH = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    fqn TEXT NOT NULL,
+    version REAL,
+    updated_at INTEGER,
+    body TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS entities_fqn ON entities (kind, fqn);
+"""
+
+# (version, updatedAt) of a stored entity, compared against fresh API responses
+EntityVersion = Tuple[Optional[float], Optional[int]]
+
+
+def entity_version(entity: Dict[str, Any]) -> EntityVersion:
+    return entity.get("version"), entity.get("updatedAt")
+
+
+class GlossarySnapshot:
+    """SQLite-backed on-disk copy of glossary and glossary term entities for warm starts."""
+
+    def __init__(self, path: str):
+        """Open (or create) the snapshot database.
+
+        Args:
+            path: Path of the SQLite file
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def load(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """Yield every stored entity of ``kind``."""
+        with self._lock:
+            rows = self._connection.execute("SELECT body FROM entities WHERE kind = ?", (kind,)).fetchall()
+        for (body,) in rows:
+            yield json.loads(body)
+
+    def versions(self, kind: str) -> Dict[str, EntityVersion]:
+        """Return the stored (version, updatedAt) of every entity of ``kind`` by ID."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, version, updated_at FROM entities WHERE kind = ?", (kind,)
+            ).fetchall()
+        return {entity_id: (version, updated_at) for entity_id, version, updated_at in rows}
+
+    def upsert(self, kind: str, entities: Iterable[Dict[str, Any]]) -> None:
+        rows = [
+            (kind, entity["id"], entity.get("fullyQualifiedName") or "", *entity_version(entity), json.dumps(entity))
+            for entity in entities
+            if entity.get("id")
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._connection.execute("COMMIT")
+
+    def delete(self, kind: str, entity_ids: Iterable[str]) -> None:
+        rows = [(kind, entity_id) for entity_id in entity_ids]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("DELETE FROM entities WHERE kind = ? AND id = ?", rows)
+            self._connection.execute("COMMIT")
+
+    def delete_nested(self, kind: str, fqn: str) -> None:
+        """Delete every entity of ``kind`` nested under ``fqn``."""
+        prefix = f"{fqn}."
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM entities WHERE kind = ? AND substr(fqn, 1, ?) = ?", (kind, len(prefix), prefix)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SnapshotRevalidation:
+    """Diffs one full listing of an entity kind against the snapshot and writes only what changed."""
+
+    def __init__(self, snapshot: GlossarySnapshot, kind: str):
+        self.snapshot = snapshot
+        self.kind = kind
+        self.seen: Set[str] = set()
+        self.changed = 0
+        self._known = snapshot.versions(kind)
+        self._pending: List[Dict[str, Any]] = []
+
+    def observe(self, entity: Dict[str, Any]) -> bool:
+        """Record a listed entity; return whether a full batch of changes now waits for ``flush()``."""
+        entity_id = entity.get("id")
+        if not entity_id:
+            return False
+        self.seen.add(entity_id)
+        if self._known.get(entity_id) != entity_version(entity):
+            self._pending.append(entity)
+        return len(self._pending) >= SNAPSHOT_WRITE_BATCH
+
+    def flush(self) -> None:
+        """Write the changes observed so far in one transaction."""
+        self.snapshot.upsert(self.kind, self._pending)
+        self.changed += len(self._pending)
+        self._pending = []
+
+    def finish(self) -> Set[str]:
+        """Write the remaining changes, delete entities that were not listed and return their IDs."""
+        self.flush()
+        removed = set(self._known) - self.seen
+        self.snapshot.delete(self.kind, removed)
+        return removed
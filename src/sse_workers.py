@@ -0,0 +1,219 @@
+"""Multi-process SSE deployment.
+
+The MCP SSE transport keeps each session's state in the process that holds its event stream, so
+plain multi-process uvicorn would deliver ``/messages/`` posts to workers that do not know the
+session. Instead every worker listens on its own Unix socket and advertises a worker-specific
+message endpoint (``/messages/<worker>/``); a lightweight router in the parent process spreads new
+SSE streams over the workers and forwards each post to the worker named in its path.
+"""
+
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from src.metrics import CONTENT_TYPE, Metrics, merge_expositions
+from src.shared_cache import SharedCacheServer
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for every worker to start listening
+WORKER_STARTUP_TIMEOUT = 30.0
+
+# Headers of an upstream response that are passed through the router
+FORWARDED_RESPONSE_HEADERS = ("content-type", "cache-control")
+
+# Builds a worker's MCP server and its metrics registry; must be importable by reference
+WorkerFactory = Callable[[], Tuple[Any, Metrics]]
+
+
+def _run_worker(worker_factory: WorkerFactory, index: int, socket_path: str, debug: bool) -> None:
+    import uvicorn
+
+    from src.server import create_sse_app
+
+    app, metrics = worker_factory()
+    starlette_app = create_sse_app(app, messages_path=f"/messages/{index}/", metrics=metrics, debug=debug)
+    uvicorn.run(starlette_app, uds=socket_path, log_level="warning")
+
+
+class WorkerPool:
+    """Worker processes, each serving the MCP server over SSE on its own Unix socket."""
+
+    def __init__(self, worker_factory: WorkerFactory, workers: int, socket_dir: str, debug: bool = False):
+        self.socket_paths = [os.path.join(socket_dir, f"worker-{index}.sock") for index in range(workers)]
+        # spawn gives every worker a fresh interpreter instead of a fork of the router's state
+        context = multiprocessing.get_context("spawn")
+        self.processes = [
+            context.Process(
+                target=_run_worker,
+                args=(worker_factory, index, socket_path, debug),
+                name=f"mcp-sse-worker-{index}",
+                daemon=True,
+            )
+            for index, socket_path in enumerate(self.socket_paths)
+        ]
+        self.active_streams = [0] * workers
+
+    def start(self) -> None:
+        for process in self.processes:
+            process.start()
+        deadline = time.monotonic() + WORKER_STARTUP_TIMEOUT
+        for process, socket_path in zip(self.processes, self.socket_paths):
+            while not os.path.exists(socket_path):
+                if not process.is_alive():
+                    raise RuntimeError(f"SSE worker {process.name} exited during startup")
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"SSE worker {process.name} did not start listening")
+                time.sleep(0.05)
+
+    def pick(self) -> int:
+        """Choose the live worker holding the fewest open SSE streams."""
+        alive = [index for index, process in enumerate(self.processes) if process.is_alive()]
+        if not alive:
+            raise RuntimeError("No SSE worker is running")
+        return min(alive, key=lambda index: self.active_streams[index])
+
+    def stop(self) -> None:
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.kill()
+
+
+def _forwarded_headers(response: httpx.Response) -> Dict[str, str]:
+    return {name: response.headers[name] for name in FORWARDED_RESPONSE_HEADERS if name in response.headers}
+
+
+class _WorkerClients:
+    """HTTP clients of the workers' Unix sockets, created lazily so they bind to the router's event loop."""
+
+    def __init__(self, socket_paths: List[str]):
+        self.socket_paths = socket_paths
+        self._clients: List[httpx.AsyncClient] = []
+
+    def __getitem__(self, index: int) -> httpx.AsyncClient:
+        if not self._clients:
+            self._clients.extend(
+                httpx.AsyncClient(
+                    transport=httpx.AsyncHTTPTransport(uds=socket_path),
+                    base_url="http://worker",
+                    timeout=httpx.Timeout(30.0, read=None),
+                )
+                for socket_path in self.socket_paths
+            )
+        return self._clients[index]
+
+    async def aclose(self) -> None:
+        for client in self._clients:
+            await client.aclose()
+
+
+def create_router_app(pool: WorkerPool, debug: bool = False) -> Any:
+    """Build the Starlette app that routes SSE streams and message posts to the worker pool."""
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response, StreamingResponse
+    from starlette.routing import Route
+
+    clients = _WorkerClients(pool.socket_paths)
+
+    async def handle_sse(request: Request) -> Response:
+        index = pool.pick()
+        client = clients[index]
+        upstream = await client.send(client.build_request("GET", "/sse"), stream=True)
+        pool.active_streams[index] += 1
+
+        async def relay() -> AsyncIterator[bytes]:
+            # Runs until the client disconnects (the stream task is cancelled) or the worker ends the stream
+            try:
+                async for chunk in upstream.aiter_raw():
+                    yield chunk
+            finally:
+                pool.active_streams[index] -= 1
+                await upstream.aclose()
+
+        return StreamingResponse(relay(), status_code=upstream.status_code, headers=_forwarded_headers(upstream))
+
+    async def handle_message(request: Request) -> Response:
+        index = request.path_params["worker"]
+        if index >= len(pool.socket_paths):
+            return Response("Unknown worker", status_code=404)
+        upstream = await clients[index].post(
+            f"/messages/{index}/",
+            params=request.query_params,
+            content=await request.body(),
+            headers={"content-type": request.headers.get("content-type", "application/json")},
+        )
+        return Response(upstream.content, status_code=upstream.status_code, headers=_forwarded_headers(upstream))
+
+    async def handle_metrics(request: Request) -> Response:
+        expositions: List[Optional[str]] = []
+        for index in range(len(pool.socket_paths)):
+            try:
+                expositions.append((await clients[index].get("/metrics")).text)
+            except httpx.HTTPError:
+                expositions.append(None)
+        return Response(merge_expositions(expositions, label="worker"), media_type=CONTENT_TYPE)
+
+    return Starlette(
+        debug=debug,
+        routes=[
+            Route("/sse", endpoint=handle_sse),
+            Route("/messages/{worker:int}/", endpoint=handle_message, methods=["POST"]),
+            Route("/metrics", endpoint=handle_metrics),
+        ],
+        on_shutdown=[clients.aclose],
+    )
+
+
+def get_multi_worker_sse_runner(
+    port: int,
+    workers: int,
+    worker_factory: WorkerFactory,
+    debug: bool = False,
+    shared_cache_socket: Optional[str] = None,
+    cache_ttl: float = 60.0,
+    cache_max_entries: int = 1024,
+    **kwargs: Any,
+) -> Callable:
+    """Return a runner that starts the shared cache (if configured), the workers and the router.
+
+    Args:
+        port: Port the router listens on
+        workers: Number of worker processes
+        worker_factory: Module-level function building a worker's MCP server and metrics registry
+        debug: Whether the router and workers run in Starlette debug mode
+        shared_cache_socket: Unix socket path to serve the cache shared by the workers on
+        cache_ttl: Seconds a shared cache entry stays valid
+        cache_max_entries: Maximum number of shared cache entries
+    """
+
+    def run():
+        import uvicorn
+
+        cache_server = None
+        if shared_cache_socket:
+            cache_server = SharedCacheServer(shared_cache_socket, ttl=cache_ttl, max_entries=cache_max_entries).start()
+        socket_dir = tempfile.mkdtemp(prefix="mcp-openmetadata-")
+        pool = WorkerPool(worker_factory, workers, socket_dir, debug=debug)
+        try:
+            pool.start()
+            logger.info("Started %d SSE workers", workers)
+            uvicorn.run(create_router_app(pool, debug=debug), host="0.0.0.0", port=port)
+        finally:
+            pool.stop()
+            if cache_server is not None:
+                cache_server.close()
+            shutil.rmtree(socket_dir, ignore_errors=True)
+        return 0
+
+    return run
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.fqn_index import GLOSSARY, GLOSSARY_TERM
+from src.openmetadata import GLOSSARY_TERM_ENDPOINTS, AsyncOpenMetadataClient
+
+logger = logging.getLogger(__name__)
+
+# OpenMetadata entity type -> local entity kind
+SYNCED_ENTITY_TYPES = {"glossary": GLOSSARY, "glossaryTerm": GLOSSARY_TERM}
+
+DELETE_EVENT_TYPES = frozenset({"entityDeleted", "entitySoftDeleted"})
+
+
+class EventGapError(Exception):
+    """Raised by an event source that cannot serve every event since the requested timestamp."""
+
+    pass
+
+
+class ApiEventSource:
+    """Reads glossary change events from OpenMetadata's change-event feed."""
+
+    def __init__(self, client: AsyncOpenMetadataClient):
+        self.client = client
+
+    async def fetch(self, since: int) -> List[Dict[str, Any]]:
+        try:
+            response = await self.client.list_change_events(list(SYNCED_ENTITY_TYPES), timestamp=since)
+        except httpx.HTTPStatusError as e:
+            # The server rejects timestamps outside its event retention window
+            if e.response.status_code in (400, 410):
+                raise EventGapError(str(e)) from e
+            raise
+        return response.get("data") or []
+
+
+class RecordedEventSource:
+    """Replays change events recorded in a JSON Lines file (or a JSON array), for local testing.
+
+    A record of the form ``{"gap": true, "timestamp": ...}`` simulates events lost at that point:
+    fetching across it raises EventGapError.
+    """
+
+    def __init__(self, path: str):
+        with open(path) as f:
+            content = f.read().strip()
+        if content.startswith("["):
+            self.events = json.loads(content)
+        else:
+            self.events = [json.loads(line) for line in content.splitlines() if line.strip()]
+        self.events.sort(key=lambda event: event.get("timestamp", 0))
+
+    async def fetch(self, since: int) -> List[Dict[str, Any]]:
+        events = [event for event in self.events if event.get("timestamp", 0) > since]
+        gap = next((event for event in events if event.get("gap")), None)
+        if gap is not None:
+            raise EventGapError(f"Recorded gap at {gap['timestamp']}")
+        return events
+
+
+class ChangeEventSync:
+    """Keeps the client's cache, FQN index, search index, glossary graph and snapshot current from change events.
+
+    Every ``interval`` seconds the event source is polled for glossary and glossary term events
+    newer than the last one applied. A detected gap, or a poll more than ``max_gap`` seconds after
+    the previous one, triggers a full resync instead.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenMetadataClient,
+        source: Optional[Any] = None,
+        interval: float = 60.0,
+        max_gap: float = 3600.0,
+        since: Optional[int] = None,
+    ):
+        """Initialize the sync.
+
+        Args:
+            client: Client whose local state is kept current
+            source: Event source with an async ``fetch(since)`` method (default: ApiEventSource(client))
+            interval: Seconds between polls
+            max_gap: Seconds without a successful poll after which a full resync is done
+            since: Epoch milliseconds to start from (default: now)
+        """
+        self.client = client
+        self.source = source or ApiEventSource(client)
+        self.interval = interval
+        self.max_gap = max_gap
+        self.last_timestamp = since if since is not None else int(time.time() * 1000)
+        self.last_polled_at = time.monotonic()
+        self.applied_events = 0
+        self.resyncs = 0
+        self._task: Optional[asyncio.Future] = None
+
+    def ensure_started(self) -> None:
+        """Start the background polling loop unless it is already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("Glossary change-event sync failed")
+
+    async def poll_once(self) -> int:
+        """Fetch and apply new events, falling back to a full resync on a gap.
+
+        Returns:
+            Number of events applied (0 after a full resync)
+        """
+        if time.monotonic() - self.last_polled_at > self.max_gap:
+            await self.full_resync()
+            return 0
+        try:
+            events = await self.source.fetch(self.last_timestamp)
+        except EventGapError as e:
+            logger.warning("Gap in glossary change events (%s); doing a full resync", e)
+            await self.full_resync()
+            return 0
+
+        applied = 0
+        for event in sorted(events, key=lambda event: event.get("timestamp", 0)):
+            if await self.apply_event(event):
+                applied += 1
+            self.last_timestamp = max(self.last_timestamp, event.get("timestamp", 0))
+        self.last_polled_at = time.monotonic()
+        self.applied_events += applied
+        return applied
+
+    async def apply_event(self, event: Dict[str, Any]) -> bool:
+        """Apply one change event to the client's local state.
+
+        Returns:
+            Whether the event concerned a synced entity type
+        """
+        kind = SYNCED_ENTITY_TYPES.get(event.get("entityType"))
+        entity_id = event.get("entityId")
+        if kind is None or not entity_id:
+            return False
+        entity = event.get("entity")
+        if isinstance(entity, str):
+            entity = json.loads(entity)
+        if event.get("eventType") in DELETE_EVENT_TYPES:
+            # The deleted entity, when the event carries it, names the FQN its nested terms are dropped by
+            entity = entity if isinstance(entity, dict) else None
+            await self.client.apply_entity_change(kind, entity=entity, entity_id=entity_id, deleted=True)
+            return True
+
+        if not isinstance(entity, dict) or "fullyQualifiedName" not in entity:
+            entity = await self._fetch_entity(kind, entity_id)
+        if entity is None:
+            await self.client.apply_entity_change(kind, entity_id=entity_id, deleted=True)
+        else:
+            await self.client.apply_entity_change(kind, entity=entity)
+        return True
+
+    async def _fetch_entity(self, kind: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        # Drop cached copies first so the lookup reflects the change
+        self.client.cache.invalidate_prefixes(GLOSSARY_TERM_ENDPOINTS)
+        try:
+            if kind == GLOSSARY_TERM:
+                return await self.client.get_glossary_term(entity_id)
+            return await self.client.get_glossary(entity_id)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def full_resync(self) -> None:
+        """Rebuild local glossary state from full listings."""
+        started_at = int(time.time() * 1000)
+        self.client.cache.invalidate_prefixes(GLOSSARY_TERM_ENDPOINTS)
+        if self.client.snapshot is not None:
+            await self.client.revalidate_snapshot()
+        else:
+            await self.client.warm_glossary_index()
+            if self.client.search_index.is_built:
+                await self.client.refresh_search_index()
+        if self.client.glossary_graph.is_built:
+            await self.client.refresh_glossary_graph()
+        self.last_timestamp = max(self.last_timestamp, started_at)
+        self.last_polled_at = time.monotonic()
+        self.resyncs += 1
@@ -0,0 +1,50 @@
+"""Fixtures building OpenMetadata clients that talk to an in-process handler through httpx.MockTransport."""
+
+from typing import Any, Callable, Iterator, List
+
+import httpx
+import pytest
+
+from src.openmetadata import AsyncOpenMetadataClient, OpenMetadataClient
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def make_client() -> Iterator[Callable[..., OpenMetadataClient]]:
+    """Build a synchronous client whose requests are answered by ``handler``."""
+    clients: List[OpenMetadataClient] = []
+
+    def make(handler: Handler, **kwargs: Any) -> OpenMetadataClient:
+        client = OpenMetadataClient(host="http://openmetadata.test", api_token="token", **kwargs)
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.session.close()
+        if client.snapshot is not None:
+            client.snapshot.close()
+
+
+@pytest.fixture
+def make_async_client() -> Iterator[Callable[..., AsyncOpenMetadataClient]]:
+    """Build an asynchronous client whose requests are answered by ``handler``."""
+    clients: List[AsyncOpenMetadataClient] = []
+
+    def make(handler: Handler, **kwargs: Any) -> AsyncOpenMetadataClient:
+        client = AsyncOpenMetadataClient(host="http://openmetadata.test", api_token="token", **kwargs)
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        if client.snapshot is not None:
+            client.snapshot.close()
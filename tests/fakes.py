@@ -0,0 +1,10 @@
+"""Helpers for answering OpenMetadata API requests in tests."""
+
+from typing import Any, Dict, List
+
+import httpx
+
+
+def list_response(entities: List[Dict[str, Any]], **paging: Any) -> httpx.Response:
+    """Render a list endpoint's response with ``total`` and any other paging fields."""
+    return httpx.Response(200, json={"data": entities, "paging": {"total": len(entities), **paging}})
@@ -0,0 +1,46 @@
+import json
+
+import httpx
+import pytest
+
+from src.openmetadata import OpenMetadataClient
+from tests.test_snapshot import TERMS
+
+
+def test_render_patch_substitutes_only_placeholders():
+    template = [
+        {"op": "replace", "path": "/description", "value": "$name costs $$5 ($fqn, $id) not $names or $other"},
+        {"op": "add", "path": "/tags/0", "value": {"tagFQN": "Price.$$", "source": ["$fqn"]}},
+    ]
+
+    patch = OpenMetadataClient._render_patch(template, "t1", "Finance.Revenue")
+
+    assert patch == [
+        {
+            "op": "replace",
+            "path": "/description",
+            "value": "Revenue costs $$5 (Finance.Revenue, t1) not $names or $other",
+        },
+        {"op": "add", "path": "/tags/0", "value": {"tagFQN": "Price.$$", "source": ["Finance.Revenue"]}},
+    ]
+
+
+@pytest.mark.anyio
+async def test_bulk_update_sends_literal_dollars(make_async_client):
+    patches = []
+
+    def serve(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/glossaryTerms/name/Finance.Revenue":
+            return httpx.Response(200, json=TERMS[0])
+        if request.method == "PATCH":
+            patches.append(json.loads(request.content))
+            return httpx.Response(200, json=TERMS[0])
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = make_async_client(serve)
+    template = [{"op": "replace", "path": "/description", "value": "$$ for $name"}]
+
+    report = await client.bulk_update_glossary_terms(template, term_fqns=["Finance.Revenue"])
+
+    assert report["succeeded"] == 1
+    assert patches == [[{"op": "replace", "path": "/description", "value": "$$ for Revenue"}]]
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from src.json_stream import ListResponseParser
+
+ENTITIES = [
+    {"id": "a", "score": 1.5, "weight": -12.25e-3, "count": 125, "active": True, "owner": None},
+    {"id": "b", "name": 'Quote " and ] brace }', "tags": [{"n": [1, 2.0, {"x": "é😀"}]}], "ratio": 1e10},
+    7,
+    -0.5,
+    False,
+    "plain",
+]
+BODY = {"paging": {"total": 12.5, "after": "c]"}, "data": ENTITIES, "count": 6}
+
+
+def parse(chunks):
+    parser = ListResponseParser()
+    entities = []
+    for chunk in chunks:
+        entities += parser.feed(chunk)
+    entities += parser.feed(b"", final=True)
+    return entities, parser.envelope
+
+
+@pytest.mark.parametrize("indent", [None, 1])
+def test_split_at_every_boundary(indent):
+    body = json.dumps(BODY, ensure_ascii=False, indent=indent).encode()
+    for split in range(len(body) + 1):
+        entities, envelope = parse([body[:split], body[split:]])
+        assert entities == ENTITIES, split
+        assert envelope == {**BODY, "data": []}, split
+
+
+def test_one_byte_chunks():
+    body = json.dumps(BODY).encode()
+    entities, envelope = parse([body[i : i + 1] for i in range(len(body))])
+    assert entities == ENTITIES
+    assert envelope["paging"] == BODY["paging"]
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected", "total"),
+    [
+        ([b'{"data":[1.', b"5]}"], [1.5], None),
+        ([b'{"data":[1e', b"3]}"], [1000.0], None),
+        ([b'{"data":[],"total":12.', b"5}"], [], 12.5),
+    ],
+)
+def test_number_split_inside(chunks, expected, total):
+    entities, envelope = parse(chunks)
+    assert entities == expected
+    assert envelope.get("total") == total
+
+
+@pytest.mark.parametrize("body", [b'{"data":[1.]}', b'{"data":[1,]}', b'{"data":[1]', b"[1]", b'{"data":[tru]}'])
+def test_malformed_body(body):
+    with pytest.raises(ValueError):
+        parse([body])
@@ -0,0 +1,64 @@
+import json
+
+import httpx
+import pytest
+
+from src.mcp_components.tools import call_tool
+from tests.fakes import list_response
+
+NAMES = [f"g{index:02}" for index in range(10)]
+
+
+def serve_cursors(request: httpx.Request) -> httpx.Response:
+    # Name cursors as OpenMetadata's: ``after`` and ``before`` are names bounding the page
+    params = request.url.params
+    limit = int(params["limit"])
+    if "before" in params:
+        earlier = [name for name in NAMES if name < params["before"]]
+        names = earlier[-limit:]
+    else:
+        names = [name for name in NAMES if name > params.get("after", "")][:limit]
+    paging = {"total": len(NAMES)}
+    if names and names[0] != NAMES[0]:
+        paging["before"] = names[0]
+    if names and names[-1] != NAMES[-1]:
+        paging["after"] = names[-1]
+    response = list_response([{"id": name, "name": name, "fullyQualifiedName": name} for name in names])
+    return httpx.Response(200, json={**response.json(), "paging": paging})
+
+
+async def list_glossaries(client, **arguments) -> dict:
+    [content] = await call_tool("list_glossaries", arguments, client)
+    return json.loads(content.text)
+
+
+def names(result: dict) -> list:
+    return [glossary["name"] for glossary in result["data"]]
+
+
+@pytest.mark.anyio
+async def test_before_returns_the_preceding_page(make_async_client):
+    client = make_async_client(serve_cursors)
+
+    result = await list_glossaries(client, before="g06", limit=3)
+
+    assert names(result) == ["g03", "g04", "g05"]
+    assert result["paging"] == {"before": "g03", "after": "g05", "total": 10}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("before", ["g06", "g02"])
+async def test_before_is_cut_at_the_byte_budget(make_async_client, before):
+    client = make_async_client(serve_cursors, max_response_bytes=60)
+
+    result = await list_glossaries(client, before=before, limit=3)
+
+    assert len(result["data"]) < 3
+    assert result["paging"]["truncated"]
+    # The continuation resumes forward at the first glossary left out, up to the cursor
+    expected = [name for name in NAMES if name < before][-3:]
+    returned = names(result)
+    while result["paging"].get("truncated"):
+        result = await list_glossaries(client, after=result["paging"]["after"], limit=len(expected) - len(returned))
+        returned += names(result)
+    assert returned == expected
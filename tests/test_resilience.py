@@ -0,0 +1,144 @@
+import time
+
+import httpx
+import pytest
+
+from src.openmetadata import CircuitOpenError
+from src.resilience import CircuitBreaker, RetryPolicy
+from tests.fakes import list_response
+from tests.test_snapshot import GLOSSARIES
+
+GLOSSARY = GLOSSARIES[0]
+
+
+def scripted(*outcomes):
+    """Answer requests with ``outcomes`` in order (a status code, or an exception to raise), then 200."""
+    requests = []
+
+    def serve(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        outcome = outcomes[len(requests) - 1] if len(requests) <= len(outcomes) else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome == 200:
+            if request.url.path == "/api/v1/glossaries":
+                return list_response(GLOSSARIES)
+            return httpx.Response(200, json=GLOSSARY)
+        return httpx.Response(outcome, headers={"Retry-After": "0"}, json={"message": "failed"})
+
+    return serve, requests
+
+
+def client_for(make_client, serve, max_retries=3, failure_threshold=0, reset_timeout=30.0):
+    return make_client(
+        serve,
+        cache_ttl=0,
+        coalesce_requests=False,
+        retry_policy=RetryPolicy(max_retries=max_retries, backoff_base=0.0),
+        circuit_breaker=CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout),
+    )
+
+
+def test_retries_idempotent_request(make_client):
+    serve, requests = scripted(503, httpx.ConnectError("refused"), 429)
+    client = client_for(make_client, serve)
+
+    assert client.get_glossary("g1") == GLOSSARY
+    assert len(requests) == 4
+
+
+def test_gives_up_after_max_retries(make_client):
+    serve, requests = scripted(503, 503, 503)
+    client = client_for(make_client, serve, max_retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_glossary("g1")
+    assert len(requests) == 3
+
+
+def test_does_not_retry_sent_non_idempotent_request(make_client):
+    serve, requests = scripted(503)
+    client = client_for(make_client, serve)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.create_table({"name": "orders", "databaseSchema": "shop.db.public"})
+    assert len(requests) == 1
+
+
+def test_retries_stream_request(make_client):
+    serve, requests = scripted(502)
+    client = client_for(make_client, serve)
+
+    page = client.list_glossaries(stream=True)
+
+    assert list(page) == GLOSSARIES
+    assert page.paging == {"total": 1}
+    assert len(requests) == 2
+
+
+def test_breaker_opens_after_consecutive_failures(make_client):
+    serve, requests = scripted(500, 500, 500)
+    client = client_for(make_client, serve, max_retries=0, failure_threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_glossary("g1")
+    with pytest.raises(CircuitOpenError):
+        client.get_glossary("g1")
+    with pytest.raises(CircuitOpenError):
+        client.list_glossaries(stream=True)
+
+    assert len(requests) == 2
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_trial_success_closes_breaker(make_client):
+    serve, requests = scripted(500, 500)
+    client = client_for(make_client, serve, max_retries=0, failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_glossary("g1")
+
+    time.sleep(0.06)
+
+    assert client.get_glossary("g1") == GLOSSARY
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+    assert client.get_glossary("g1") == GLOSSARY
+    assert len(requests) == 4
+
+
+def test_half_open_trial_failure_reopens_breaker(make_client):
+    serve, requests = scripted(500, 500, httpx.ConnectError("refused"))
+    client = client_for(make_client, serve, max_retries=0, failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_glossary("g1")
+
+    time.sleep(0.06)
+
+    with pytest.raises(httpx.ConnectError):
+        client.get_glossary("g1")
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+    # One failed trial is enough to open the circuit again
+    with pytest.raises(CircuitOpenError):
+        client.get_glossary("g1")
+    assert len(requests) == 3
+
+
+@pytest.mark.anyio
+async def test_async_client_retries_and_opens_breaker(make_async_client):
+    serve, requests = scripted(503, 500, 500)
+    client = make_async_client(
+        serve,
+        cache_ttl=0,
+        retry_policy=RetryPolicy(max_retries=1, backoff_base=0.0),
+        circuit_breaker=CircuitBreaker(failure_threshold=3),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_glossary("g1")
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_glossary("g1")
+    with pytest.raises(CircuitOpenError):
+        await client.get_glossary("g1")
+    assert len(requests) == 3
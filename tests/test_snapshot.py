@@ -0,0 +1,123 @@
+import json
+import threading
+
+import httpx
+import pytest
+
+from src.fqn_index import GLOSSARY_TERM
+from src.mcp_components.tools import call_tool
+from src.snapshot import GlossarySnapshot
+from tests.fakes import list_response
+
+GLOSSARIES = [{"id": "g1", "name": "Finance", "fullyQualifiedName": "Finance", "version": 0.1}]
+TERMS = [
+    {
+        "id": "t1",
+        "name": "Revenue",
+        "fullyQualifiedName": "Finance.Revenue",
+        "description": "Income from sales",
+        "glossary": {"id": "g1", "fullyQualifiedName": "Finance"},
+        "version": 0.1,
+        "updatedAt": 1,
+    },
+    {
+        "id": "t2",
+        "name": "Churn",
+        "fullyQualifiedName": "Finance.Churn",
+        "description": "Customers lost",
+        "glossary": {"id": "g1", "fullyQualifiedName": "Finance"},
+        "version": 0.1,
+        "updatedAt": 1,
+    },
+]
+
+
+def serve_glossary(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/v1/glossaries":
+        return list_response(GLOSSARIES)
+    if request.url.path == "/api/v1/glossaryTerms":
+        return list_response(TERMS)
+    return httpx.Response(404, json={"message": "not found"})
+
+
+def refuse(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(503, json={"message": "unavailable"})
+
+
+async def search(client, query: str) -> dict:
+    [content] = await call_tool("search_glossary_terms", {"query": query}, client)
+    return json.loads(content.text)
+
+
+@pytest.mark.anyio
+async def test_search_after_first_revalidation_of_a_fresh_snapshot(make_async_client, tmp_path):
+    client = make_async_client(serve_glossary, snapshot_path=str(tmp_path / "snapshot.db"))
+
+    await client.revalidate_snapshot()
+
+    assert client.search_index.is_built
+    result = await search(client, "revenue")
+    assert [term["fullyQualifiedName"] for term in result["data"]] == ["Finance.Revenue"]
+
+
+@pytest.mark.anyio
+async def test_search_right_after_cold_snapshot_load(make_async_client, tmp_path):
+    path = str(tmp_path / "snapshot.db")
+    await make_async_client(serve_glossary, snapshot_path=path).revalidate_snapshot()
+
+    # A restart answers from the snapshot before OpenMetadata is reachable
+    client = make_async_client(refuse, snapshot_path=path)
+    result = await search(client, "churn")
+
+    assert [term["fullyQualifiedName"] for term in result["data"]] == ["Finance.Churn"]
+
+
+@pytest.mark.anyio
+async def test_revalidation_reindexes_changed_terms(make_async_client, tmp_path):
+    path = str(tmp_path / "snapshot.db")
+    await make_async_client(serve_glossary, snapshot_path=path).revalidate_snapshot()
+    renamed = [{**TERMS[0], "description": "Turnover", "version": 0.2, "updatedAt": 2}]
+
+    def serve_renamed(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/glossaryTerms":
+            return list_response(renamed)
+        return serve_glossary(request)
+
+    client = make_async_client(serve_renamed, snapshot_path=path)
+    await client.revalidate_snapshot()
+
+    assert [term["id"] for term in (await search(client, "turnover"))["data"]] == ["t1"]
+    assert (await search(client, "churn"))["total"] == 0
+
+
+@pytest.fixture
+def snapshot_threads(monkeypatch):
+    """Record the thread each snapshot read and write runs on."""
+    threads = []
+    for name in ("load", "versions", "upsert", "delete", "delete_nested"):
+        method = getattr(GlossarySnapshot, name)
+
+        def record(self, *args, _method=method, _name=name):
+            threads.append((_name, threading.current_thread()))
+            return _method(self, *args)
+
+        monkeypatch.setattr(GlossarySnapshot, name, record)
+    return threads
+
+
+@pytest.mark.anyio
+async def test_async_client_keeps_snapshot_io_off_the_event_loop(make_async_client, tmp_path, snapshot_threads):
+    path = str(tmp_path / "snapshot.db")
+    await make_async_client(serve_glossary, snapshot_path=path).revalidate_snapshot()
+    snapshot_threads.clear()
+
+    client = make_async_client(serve_glossary, snapshot_path=path)
+    # Opening the client reads nothing; the first request loads the snapshot
+    assert snapshot_threads == []
+    await client.revalidate_snapshot()
+    await client.apply_entity_change(GLOSSARY_TERM, entity={**TERMS[0], "version": 0.3, "updatedAt": 3})
+    await client.apply_entity_change(GLOSSARY_TERM, entity_id="t2", deleted=True)
+
+    assert {name for name, _ in snapshot_threads} == {"load", "versions", "upsert", "delete"}
+    assert all(thread is not threading.main_thread() for _, thread in snapshot_threads)
+    assert {term["id"]: term["version"] for term in client.snapshot.load(GLOSSARY_TERM)} == {"t1": 0.3}
@@ -0,0 +1,151 @@
+import json
+
+import httpx
+import pytest
+
+from src.fqn_index import GLOSSARY_TERM
+from src.sync import ChangeEventSync, EventGapError, RecordedEventSource
+from tests.fakes import list_response
+from tests.test_snapshot import GLOSSARIES, TERMS, search, serve_glossary
+
+
+def record(path, events, as_array=False):
+    with open(path, "w") as f:
+        if as_array:
+            json.dump(events, f)
+        else:
+            f.writelines(json.dumps(event) + "\n" for event in events)
+    return RecordedEventSource(str(path))
+
+
+def counting(handler, requests):
+    def serve(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return handler(request)
+
+    return serve
+
+
+@pytest.mark.anyio
+async def test_recorded_source_replays_events_after_timestamp(tmp_path):
+    events = [
+        {"timestamp": 30, "entityId": "c"},
+        {"timestamp": 10, "entityId": "a"},
+        {"timestamp": 20, "entityId": "b"},
+    ]
+    source = record(tmp_path / "events.json", events, as_array=True)
+
+    assert [event["entityId"] for event in await source.fetch(10)] == ["b", "c"]
+
+
+@pytest.mark.anyio
+async def test_poll_applies_deltas(make_async_client, tmp_path):
+    client = make_async_client(serve_glossary)
+    await client.refresh_search_index()
+    renamed = {**TERMS[0], "description": "Turnover", "version": 0.2, "updatedAt": 2}
+    source = record(
+        tmp_path / "events.jsonl",
+        [
+            {
+                "timestamp": 5,
+                "eventType": "entityUpdated",
+                "entityType": "glossaryTerm",
+                "entityId": "t1",
+                "entity": json.dumps(renamed),
+            },
+            {"timestamp": 6, "eventType": "entityDeleted", "entityType": "glossaryTerm", "entityId": "t2"},
+            {"timestamp": 7, "eventType": "entityUpdated", "entityType": "table", "entityId": "x"},
+        ],
+    )
+    sync = ChangeEventSync(client, source=source, since=0)
+
+    assert await sync.poll_once() == 2
+    assert sync.last_timestamp == 7
+    assert sync.resyncs == 0
+    assert [term["fullyQualifiedName"] for term in (await search(client, "turnover"))["data"]] == ["Finance.Revenue"]
+    assert (await search(client, "churn"))["total"] == 0
+    assert client.fqn_index.get_id(GLOSSARY_TERM, "Finance.Churn") is None
+    # Already applied events are not fetched again
+    assert await sync.poll_once() == 0
+
+
+@pytest.mark.anyio
+async def test_poll_fetches_entity_missing_from_event(make_async_client, tmp_path):
+    added = {
+        **TERMS[1],
+        "id": "t3",
+        "name": "Margin",
+        "fullyQualifiedName": "Finance.Margin",
+        "description": "Profit share",
+    }
+
+    def serve(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/glossaryTerms/t3":
+            return httpx.Response(200, json=added)
+        return serve_glossary(request)
+
+    client = make_async_client(serve)
+    await client.refresh_search_index()
+    source = record(
+        tmp_path / "events.jsonl",
+        [{"timestamp": 5, "eventType": "entityCreated", "entityType": "glossaryTerm", "entityId": "t3"}],
+    )
+
+    assert await ChangeEventSync(client, source=source, since=0).poll_once() == 1
+    assert [term["fullyQualifiedName"] for term in (await search(client, "profit"))["data"]] == ["Finance.Margin"]
+
+
+@pytest.mark.anyio
+async def test_recorded_gap_raises(tmp_path):
+    source = record(tmp_path / "events.jsonl", [{"timestamp": 5, "entityId": "t1"}, {"timestamp": 8, "gap": True}])
+
+    assert await source.fetch(8) == []
+    with pytest.raises(EventGapError):
+        await source.fetch(0)
+
+
+@pytest.mark.anyio
+async def test_gap_falls_back_to_full_resync(make_async_client, tmp_path):
+    requests = []
+    current = [{**TERMS[0], "description": "Turnover", "version": 0.2, "updatedAt": 2}]
+
+    def serve(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/glossaryTerms":
+            return list_response(current)
+        if request.url.path == "/api/v1/glossaries":
+            return list_response(GLOSSARIES)
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = make_async_client(counting(serve, requests))
+    await client.refresh_search_index()
+    source = record(
+        tmp_path / "events.jsonl",
+        [
+            {"timestamp": 5, "gap": True},
+            {"timestamp": 6, "eventType": "entityDeleted", "entityType": "glossaryTerm", "entityId": "t1"},
+        ],
+    )
+    sync = ChangeEventSync(client, source=source, since=0)
+    requests.clear()
+
+    assert await sync.poll_once() == 0
+    assert sync.resyncs == 1
+    assert sync.applied_events == 0
+    assert set(requests) == {"/api/v1/glossaries", "/api/v1/glossaryTerms"}
+    assert [term["fullyQualifiedName"] for term in (await search(client, "turnover"))["data"]] == ["Finance.Revenue"]
+    assert (await search(client, "churn"))["total"] == 0
+    # The resync moves past the recorded gap
+    assert sync.last_timestamp > 6
+
+
+@pytest.mark.anyio
+async def test_overdue_poll_falls_back_to_full_resync(make_async_client, tmp_path):
+    requests = []
+    client = make_async_client(counting(serve_glossary, requests))
+    source = record(tmp_path / "events.jsonl", [])
+    sync = ChangeEventSync(client, source=source, max_gap=60.0, since=0)
+    sync.last_polled_at -= 61.0
+
+    assert await sync.poll_once() == 0
+    assert sync.resyncs == 1
+    assert "/api/v1/glossaries" in requests
@@ -0,0 +1,80 @@
+import json
+
+import httpx
+import pytest
+
+from src.mcp_components.tools import call_tool
+from tests.fakes import list_response
+
+TABLE = {
+    "id": "t1",
+    "name": "orders",
+    "fullyQualifiedName": "shop.db.public.orders",
+    "href": "http://openmetadata.test/api/v1/tables/t1",
+    "columns": [
+        {
+            "name": "id",
+            "dataType": "INT",
+            "fullyQualifiedName": "shop.db.public.orders.id",
+            "profile": {"nullCount": 0},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def client(make_async_client, requests):
+    def serve(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/api/v1/tables":
+            return list_response([TABLE])
+        return httpx.Response(200, json=TABLE)
+
+    return make_async_client(serve, cache_ttl=0)
+
+
+async def call(client, name: str, **arguments) -> dict:
+    [content] = await call_tool(name, arguments, client)
+    return json.loads(content.text)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("arguments", "fields"),
+    [
+        ({}, "columns,owners,tags"),
+        ({"projection": "name,columns.name,followers.name"}, "columns,followers"),
+        ({"projection": "name"}, None),
+        ({"projection": "*"}, None),
+        ({"fields": "joins"}, "joins"),
+    ],
+)
+async def test_get_table_requests_projected_fields(client, requests, arguments, fields):
+    await call(client, "get_table", table_id="t1", **arguments)
+
+    assert requests[-1].url.params.get("fields") == fields
+
+
+@pytest.mark.anyio
+async def test_default_projection_trims_columns(client):
+    table = await call(client, "get_table_by_name", fqn="shop.db.public.orders")
+
+    assert table == {
+        "id": "t1",
+        "name": "orders",
+        "fullyQualifiedName": "shop.db.public.orders",
+        "columns": [{"name": "id", "dataType": "INT"}],
+    }
+
+
+@pytest.mark.anyio
+async def test_list_tables_requests_no_optional_fields_by_default(client, requests):
+    result = await call(client, "list_tables")
+
+    assert "fields" not in requests[-1].url.params
+    assert result["data"] == [{"id": "t1", "name": "orders", "fullyQualifiedName": "shop.db.public.orders"}]
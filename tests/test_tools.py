@@ -0,0 +1,61 @@
+import asyncio
+
+from mcp.types import TextContent, Tool
+import pytest
+
+from src.mcp_components.tools import TOOL_REGISTRY, ToolSpec, call_tool
+
+TOOL = Tool(name="fake", description="Counts its runs", inputSchema={"type": "object", "properties": {}})
+
+
+@pytest.fixture
+def runs():
+    return []
+
+
+@pytest.fixture
+def install(monkeypatch, runs):
+    def install(cacheable: bool) -> None:
+        async def handler(arguments, client):
+            runs.append(arguments)
+            await asyncio.sleep(0.01)
+            return [TextContent(type="text", text=str(len(runs)))]
+
+        monkeypatch.setitem(TOOL_REGISTRY, TOOL.name, ToolSpec(TOOL, handler, cacheable=cacheable))
+
+    return install
+
+
+@pytest.mark.anyio
+async def test_identical_cacheable_calls_share_one_run(install, runs):
+    install(cacheable=True)
+    client = object()
+
+    first, second, other = await asyncio.gather(
+        call_tool("fake", {"a": 1, "b": 2}, client),
+        call_tool("fake", {"b": 2, "a": 1}, client),
+        call_tool("fake", {"a": 2}, client),
+    )
+
+    assert len(runs) == 2
+    assert first == second
+    # Once the shared run is done, a new call runs again
+    await call_tool("fake", {"a": 1, "b": 2}, client)
+    assert len(runs) == 3
+
+
+@pytest.mark.anyio
+async def test_calls_of_other_tools_run_separately(install, runs):
+    install(cacheable=False)
+    client = object()
+
+    await asyncio.gather(*(call_tool("fake", {}, client) for _ in range(2)))
+
+    assert len(runs) == 2
+
+
+def test_reads_are_cacheable_and_writes_are_not():
+    assert TOOL_REGISTRY["get_table"].cacheable
+    assert TOOL_REGISTRY["search_glossary_terms"].cacheable
+    assert not TOOL_REGISTRY["create_glossary_term"].cacheable
+    assert not TOOL_REGISTRY["bulk_update_glossary_terms"].cacheable